@@ -1,10 +1,10 @@
+import logging
 import os
-import sys
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
-
+import re
 from logging.config import fileConfig
 
+from dotenv import load_dotenv
+
 from alembic import context
 
 # this is the Alembic Config object, which provides
@@ -20,9 +20,34 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 # from myapp import mymodel
 # target_metadata = mymodel.Base.metadata
-from server.nexlist.db.database import Base
+# alembic.ini의 prepend_sys_path(.)로 server/ 기준 import
+# : 모든 models 모듈을 import해야 autogenerate가 전체 테이블을 인식
+import nexlist.auth.models  # noqa: E402,F401
+import nexlist.memo.models  # noqa: E402,F401
+import nexlist.todos.models  # noqa: E402,F401
+from nexlist.config import settings  # noqa: E402
+from nexlist.db.database import PRIMARY_DB_URL, Base  # noqa: E402
 
 target_metadata = Base.metadata
+logger = logging.getLogger("alembic.env")
+
+
+def migration_url() -> str:
+    """
+    앱과 같은 DB를 바라보도록 Settings(NEXLIST_*)로 구성한 URL 사용
+    : lifespan의 revision 확인과 마이그레이션 대상이 어긋나지 않게 함
+    : NEXLIST_DB_PRIMARY_URL / NEXLIST_MYSQL_HOST가 모두 없으면 이전 방식대로
+      접두사 없는 MYSQL_* 환경변수(.env 포함)를 alembic.ini의 sqlalchemy.url에 채워서 사용
+    """
+    if settings.DB_PRIMARY_URL or settings.MYSQL_HOST:
+        return PRIMARY_DB_URL
+
+    load_dotenv()
+    if not os.getenv("MYSQL_HOST"):
+        return PRIMARY_DB_URL
+    logger.warning("using unprefixed MYSQL_* variables, set NEXLIST_DB_PRIMARY_URL or NEXLIST_MYSQL_* instead")
+    url = config.get_main_option("sqlalchemy.url")
+    return re.sub(r"\${(.+?)}", lambda m: os.getenv(m.group(1), ""), url)
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
@@ -42,7 +67,7 @@ def run_migrations_offline() -> None:
     script output.
 
     """
-    url = config.get_main_option("sqlalchemy.url")
+    url = migration_url()
     context.configure(
         url=url,
         target_metadata=target_metadata,
@@ -67,26 +92,9 @@ def run_migrations_online() -> None:
     #     poolclass=pool.NullPool,
     # )
 
-    # alembic.ini 에서 환경변수 사용
-    import os
-    import re
-
-    from dotenv import load_dotenv
-    from sqlalchemy import create_engine
-
-    load_dotenv()
+    from sqlalchemy import create_engine, pool
 
-    url_tokens = {
-        "MYSQL_USER": os.getenv("MYSQL_USER"),
-        "MYSQL_PASSWORD": os.getenv("MYSQL_PASSWORD"),
-        "MYSQL_HOST": os.getenv("MYSQL_HOST"),
-        "MYSQL_PORT": os.getenv("MYSQL_PORT"),
-        "MYSQL_DB_NAME": os.getenv("MYSQL_DB_NAME"),
-    }
-    url = config.get_main_option("sqlalchemy.url")  # alembic.ini에 있는 url
-    url = re.sub(r"\${(.+?)}", lambda m: url_tokens[m.group(1)], url)  # url로부터 환경변수 파싱
-
-    connectable = create_engine(url)
+    connectable = create_engine(migration_url(), poolclass=pool.NullPool)
 
     with connectable.connect() as connection:
         context.configure(
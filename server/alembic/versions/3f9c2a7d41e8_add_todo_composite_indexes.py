@@ -0,0 +1,43 @@
+"""Add composite indexes for todo access patterns
+
+Revision ID: 3f9c2a7d41e8
+Revises: 8c4e1f0b7a26
+Create Date: 2026-10-18 13:20:11.402113
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2a7d41e8'
+down_revision: str | Sequence[str] | None = '8c4e1f0b7a26'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEXES = ('ix_todos_user_id_today', 'ix_todos_user_id_due_date')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 모델에 인덱스가 있던 시절 create_all로 만든 DB는 이미 있을 수 있음
+    existing = {ix['name'] for ix in sa.inspect(op.get_bind()).get_indexes('todos')}
+    if 'ix_todos_user_id_today' not in existing:
+        op.create_index('ix_todos_user_id_today', 'todos', ['user_id', 'today'], unique=False)
+    if 'ix_todos_user_id_due_date' not in existing:
+        op.create_index('ix_todos_user_id_due_date', 'todos', ['user_id', 'due_date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name == "mysql":
+        # MySQL은 user_id로 시작하는 인덱스가 생기면 FK(user_id)용 자동 인덱스를 제거할 수 있음
+        # : 두 인덱스를 모두 지우면 FK에 쓸 인덱스가 없어 실패(1553)하므로 단일 컬럼 인덱스를 먼저 만듦
+        indexes = sa.inspect(bind).get_indexes('todos')
+        if not any(ix['name'] not in INDEXES and ix['column_names'][:1] == ['user_id'] for ix in indexes):
+            op.create_index('user_id', 'todos', ['user_id'], unique=False)
+    op.drop_index('ix_todos_user_id_due_date', table_name='todos')
+    op.drop_index('ix_todos_user_id_today', table_name='todos')
@@ -0,0 +1,55 @@
+"""Sync schema with models previously created by create_all
+
+Revision ID: 8c4e1f0b7a26
+Revises: 0b3dd18fadaf
+Create Date: 2026-10-18 15:02:37.118204
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4e1f0b7a26'
+down_revision: str | Sequence[str] | None = '0b3dd18fadaf'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# 앱 import 시점 create_all이 만들던 컬럼/테이블
+# : create_all로 이미 만들어진 DB도 있으므로 없는 것만 추가
+USER_COLUMNS = (
+    ('verified_email', sa.Boolean()),
+    ('given_name', sa.String(length=255)),
+    ('picture', sa.String(length=4096)),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+
+    user_columns = {column['name'] for column in inspector.get_columns('users')}
+    for name, type_ in USER_COLUMNS:
+        if name not in user_columns:
+            op.add_column('users', sa.Column(name, type_, nullable=True))
+
+    todo_columns = {column['name'] for column in inspector.get_columns('todos')}
+    if 'today' not in todo_columns:
+        op.add_column('todos', sa.Column('today', sa.Boolean(), nullable=True))
+
+    if not inspector.has_table('memos'):
+        op.create_table('memos',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('content', sa.String(length=8192), nullable=True),
+        sa.Column('saved_at', sa.Date(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id')
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # create_all 시절 스키마를 그대로 두기 위해 되돌리지 않음 (데이터 보존)
+    pass
@@ -0,0 +1,31 @@
+"""Add FULLTEXT (ngram) index on todos.task
+
+Revision ID: c4b7e91d2f63
+Revises: a9f2c6b84e1d
+Create Date: 2026-10-18 20:41:07.518204
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4b7e91d2f63'
+down_revision: str | Sequence[str] | None = 'a9f2c6b84e1d'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # FULLTEXT / ngram parser는 MySQL 전용 (다른 DB는 메모리 n-gram 색인으로 검색)
+    if op.get_bind().dialect.name != "mysql":
+        return
+    op.create_index('ft_todos_task', 'todos', ['task'], unique=False, mysql_prefix='FULLTEXT', mysql_with_parser='ngram')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "mysql":
+        return
+    op.drop_index('ft_todos_task', table_name='todos')
@@ -0,0 +1,40 @@
+"""Add memo version and widen memo content
+
+Revision ID: d5a8e3c17f42
+Revises: 3f9c2a7d41e8
+Create Date: 2026-10-18 16:41:09.530218
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a8e3c17f42'
+down_revision: str | Sequence[str] | None = '3f9c2a7d41e8'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # batch: SQLite는 ALTER COLUMN이 없으므로 테이블을 다시 만들어 변경 (MySQL은 ALTER TABLE 그대로)
+    with op.batch_alter_table('memos') as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), server_default='0', nullable=False))
+        batch_op.alter_column('content',
+               existing_type=sa.String(length=8192),
+               type_=sa.Text().with_variant(mysql.MEDIUMTEXT(), 'mysql'),
+               existing_nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('memos') as batch_op:
+        batch_op.alter_column('content',
+               existing_type=sa.Text().with_variant(mysql.MEDIUMTEXT(), 'mysql'),
+               type_=sa.String(length=8192),
+               existing_nullable=True)
+        batch_op.drop_column('version')
@@ -0,0 +1,37 @@
+"""Add todo rollover checkpoints
+
+Revision ID: e8b3d6f1a527
+Revises: c4b7e91d2f63
+Create Date: 2026-10-18 22:07:31.904512
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b3d6f1a527'
+down_revision: str | Sequence[str] | None = 'c4b7e91d2f63'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('todo_rollover_checkpoints',
+    sa.Column('run_date', sa.Date(), nullable=False),
+    sa.Column('step', sa.String(length=32), nullable=False),
+    sa.Column('last_id', sa.Integer(), nullable=False),
+    sa.Column('updated_rows', sa.Integer(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('run_date')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('todo_rollover_checkpoints')
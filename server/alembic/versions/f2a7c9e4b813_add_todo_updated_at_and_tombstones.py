@@ -0,0 +1,48 @@
+"""Add todos.updated_at and todo tombstones
+
+Revision ID: f2a7c9e4b813
+Revises: e8b3d6f1a527
+Create Date: 2026-10-18 23:16:48.372915
+
+"""
+from collections.abc import Sequence
+from datetime import datetime, timezone
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a7c9e4b813'
+down_revision: str | Sequence[str] | None = 'e8b3d6f1a527'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+Timestamp = sa.DateTime().with_variant(mysql.DATETIME(fsp=6), 'mysql')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('todos', sa.Column('updated_at', Timestamp, nullable=True))
+    # 기존 행은 마이그레이션 시각(UTC)으로 (since 이후 변경 조회에서 NULL은 비교 대상이 되지 않음)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    op.execute(sa.text("UPDATE todos SET updated_at = :now").bindparams(now=now))
+    op.create_index('ix_todos_user_id_updated_at', 'todos', ['user_id', 'updated_at'], unique=False)
+    op.create_table('todo_tombstones',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('todo_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('deleted_at', Timestamp, nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_todo_tombstones_user_id_deleted_at', 'todo_tombstones', ['user_id', 'deleted_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_todo_tombstones_user_id_deleted_at', table_name='todo_tombstones')
+    op.drop_table('todo_tombstones')
+    op.drop_index('ix_todos_user_id_updated_at', table_name='todos')
+    op.drop_column('todos', 'updated_at')
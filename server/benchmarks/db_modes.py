@@ -0,0 +1,180 @@
+""" 동기(Session + 스레드풀) / 비동기(AsyncSession) DB 모드 처리량 비교 벤치마크
+
+같은 동시성으로 todos/memo 라우터에 요청을 보내고 모드별 requests/sec, p50/p99 latency를 출력한다.
+
+    cd server
+    python -m benchmarks.db_modes --requests 3000 --concurrency 64
+    python -m benchmarks.db_modes --db-url "mysql+pymysql://user:pw@127.0.0.1:3306/nexlist_bench"
+
+--db-url은 동기 드라이버 URL이며 비동기 모드는 드라이버만 바꿔서(pymysql -> aiomysql, sqlite -> aiosqlite) 같은 DB를 사용한다.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+
+os.environ.setdefault("NEXLIST_JWT_SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("NEXLIST_JWT_ALGORITHM", "HS256")
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from nexlist.auth.dependencies import get_current_user_async, get_current_user_sync
+from nexlist.auth.jwt_utils import create_jwt_token
+from nexlist.auth.models import User
+from nexlist.db.database import Base, to_async_url
+from nexlist.db.dependencies import get_async_db, get_db
+from nexlist.memo.dependencies import get_async_memo_service, get_sync_memo_service
+from nexlist.memo.models import Memo
+from nexlist.memo.router import router as memo_router
+from nexlist.todos.dependencies import get_async_todo_service, get_sync_todo_service
+from nexlist.todos.models import Todo
+from nexlist.todos.router import router as todos_router
+
+
+def engine_options(url: str) -> dict:
+    # 운영 엔진과 동일한 풀 크기 (nexlist/db/database.py)
+    if url.startswith("sqlite"):
+        return {"pool_size": 5, "max_overflow": 5}
+    return {"pool_size": 5, "max_overflow": 5, "pool_recycle": 500}
+
+
+def seed(url: str, todos_per_user: int) -> int:
+    engine = create_engine(url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as db:
+        user = User(email="bench@nexlist.dev", name="bench", google_sub="bench", created_at=date.today())
+        db.add(user)
+        db.flush()
+        db.add(Memo(user_id=user.id, content="benchmark memo"))
+        db.add_all(
+            Todo(task=f"task {i}", user_id=user.id, today=i % 2 == 0, is_done=False)
+            for i in range(todos_per_user)
+        )
+        db.commit()
+        user_id = user.id
+    engine.dispose()
+    return user_id
+
+
+def build_app(mode: str, url: str) -> tuple[FastAPI, object]:
+    app = FastAPI()
+    app.include_router(todos_router)
+    app.include_router(memo_router)
+
+    if mode == "sync":
+        engine = create_engine(url, **engine_options(url))
+        SessionBench = sessionmaker(bind=engine)
+
+        def override_get_db():
+            db = SessionBench()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = override_get_db
+        return app, engine
+
+    engine = create_async_engine(to_async_url(url), **engine_options(url))
+    AsyncSessionBench = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    async def override_get_async_db():
+        async with AsyncSessionBench() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_sync_todo_service] = get_async_todo_service
+    app.dependency_overrides[get_sync_memo_service] = get_async_memo_service
+    app.dependency_overrides[get_current_user_sync] = get_current_user_async
+    return app, engine
+
+
+async def drive(app: FastAPI, user_id: int, total: int, concurrency: int) -> tuple[float, list[float]]:
+    cookies = {"access_token": create_jwt_token({"user_id": user_id})}
+    transport = httpx.ASGITransport(app=app)
+    latencies: list[float] = []
+    counter = iter(range(total))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", cookies=cookies) as client:
+        todo_ids = [t["id"] for t in (await client.get("/todos/")).json()]
+
+        async def request(i: int) -> httpx.Response:
+            # 읽기 위주 트래픽: 목록 조회 / 완료 상태 토글 / 메모 조회
+            match i % 4:
+                case 0 | 1:
+                    return await client.get("/todos/", params={"today": True})
+                case 2:
+                    todo_id = todo_ids[i % len(todo_ids)]
+                    return await client.put(f"/todos/{todo_id}/completed", json={"is_done": i % 8 == 2})
+                case _:
+                    return await client.get("/memo/")
+
+        async def worker():
+            for i in counter:
+                started = time.perf_counter()
+                response = await request(i)
+                latencies.append(time.perf_counter() - started)
+                if response.status_code >= 400:
+                    raise RuntimeError(f"{response.request.url} -> {response.status_code}")
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return elapsed, latencies
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run(mode: str, url: str, args) -> dict:
+    user_id = seed(url, args.todos)
+    app, engine = build_app(mode, url)
+    try:
+        elapsed, latencies = await drive(app, user_id, args.requests, args.concurrency)
+    finally:
+        if mode == "async":
+            await engine.dispose()
+        else:
+            engine.dispose()
+    return {
+        "mode": mode,
+        "rps": len(latencies) / elapsed,
+        "p50": statistics.median(latencies) * 1000,
+        "p99": percentile(latencies, 99) * 1000,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db-url", default=None, help="동기 드라이버 DB URL (기본값: 임시 SQLite 파일)")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--todos", type=int, default=50, help="벤치마크 유저의 todo 개수")
+    parser.add_argument("--modes", nargs="+", default=["sync", "async"], choices=["sync", "async"])
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.db_url or f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        print(f"db={url.split('@')[-1]} requests={args.requests} concurrency={args.concurrency}")
+        print(f"{'mode':<6} {'req/s':>10} {'p50(ms)':>10} {'p99(ms)':>10}")
+        for mode in args.modes:
+            result = asyncio.run(run(mode, url, args))
+            print(f"{result['mode']:<6} {result['rps']:>10.1f} {result['p50']:>10.2f} {result['p99']:>10.2f}")
+            sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
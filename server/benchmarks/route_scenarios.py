@@ -0,0 +1,353 @@
+""" benchmarks.routes 시나리오: todos / memo / auth 라우터의 모든 라우트
+
+nexlist 설정(DB URL, DB_ASYNC 등)은 import 시점에 읽히므로 이 모듈은 benchmarks.routes가
+환경 변수를 설정한 뒤에 import한다. 앱은 운영과 같은 nexlist.app:app(미들웨어, 캐시, lifespan 포함)을
+ASGITransport로 프로세스 안에서 호출하고, Google OAuth만 MockTransport stub으로 대체한다.
+"""
+
+import asyncio
+import itertools
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import date
+
+import httpx
+from sqlalchemy import create_engine, insert, select, text
+from sqlalchemy.orm import sessionmaker
+
+from nexlist.app import app, lifespan
+from nexlist.auth.google_auth import GoogleOAuthClient, get_google_client
+from nexlist.auth.jwt_utils import create_jwt_token
+from nexlist.auth.models import User
+from nexlist.db.database import PRIMARY_DB_URL, Base
+from nexlist.memo.models import Memo
+from nexlist.todos.models import Todo
+
+GOOGLE_STUB_URL = "http://google.stub"
+BATCH_SIZE = 10
+
+# POST /memo/ 용 신규 사용자 번호 (warmup과 측정 실행에서 겹치지 않도록 전역 카운터)
+new_users = itertools.count()
+
+
+@dataclass
+class BenchSession:
+    """ 가상 사용자 하나 (워커마다 전용 사용자를 써서 memo version 등이 충돌하지 않도록 함) """
+
+    user_id: int
+    google_sub: str
+    todo_ids: list[int]
+    access_token: str = ""
+    refresh_token: str = ""
+    memo_version: int = 0
+    etag: str = ""
+    changes_cursor: int | None = None
+
+    def cookies(self) -> dict[str, str]:
+        return {"Cookie": f"access_token={self.access_token}; refresh_token={self.refresh_token}"}
+
+    def update_tokens(self, response: httpx.Response) -> None:
+        self.access_token = response.cookies.get("access_token", self.access_token)
+        self.refresh_token = response.cookies.get("refresh_token", self.refresh_token)
+
+
+@dataclass
+class Recorder:
+    """ 시나리오 하나의 요청별 latency와 오류 """
+
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    first_error: str = ""
+
+    async def call(self, client: httpx.AsyncClient, method: str, url: str, expect: int = 200, **kwargs) -> httpx.Response:
+        started = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        self.latencies.append(time.perf_counter() - started)
+        if response.status_code != expect:
+            self.errors += 1
+            self.first_error = self.first_error or f"{method} {url} -> {response.status_code} {response.text[:200]}"
+        return response
+
+
+Scenario = Callable[[httpx.AsyncClient, BenchSession, int, Recorder], Awaitable[None]]
+
+# 이름(라우트) -> 시나리오, 등록 순서대로 실행 (삭제 / 로그아웃 등 상태를 바꾸는 시나리오는 뒤쪽)
+SCENARIOS: dict[str, Scenario] = {}
+
+
+def scenario(name: str):
+    def register(fn: Scenario) -> Scenario:
+        SCENARIOS[name] = fn
+        return fn
+    return register
+
+
+async def untimed(client: httpx.AsyncClient, method: str, url: str, **kwargs) -> httpx.Response:
+    """ 시나리오 준비용 요청 (측정하지 않음) """
+    response = await client.request(method, url, **kwargs)
+    if response.status_code >= 400:
+        raise RuntimeError(f"{method} {url} -> {response.status_code} {response.text[:200]}")
+    return response
+
+
+# ---- todos ----
+
+@scenario("POST /todos/")
+async def create_todo(client, session, i, recorder):
+    await recorder.call(client, "POST", "/todos/", 201, headers=session.cookies(), json={"task": f"bench {i}", "today": i % 2 == 0})
+
+
+@scenario("POST /todos/batch")
+async def create_todo_batch(client, session, i, recorder):
+    items = [{"task": f"bench {i}-{n}", "today": n % 2 == 0} for n in range(BATCH_SIZE)]
+    await recorder.call(client, "POST", "/todos/batch", 201, headers=session.cookies(), json={"items": items})
+
+
+@scenario("GET /todos/")
+async def list_todos(client, session, i, recorder):
+    response = await recorder.call(client, "GET", "/todos/", headers=session.cookies())
+    session.etag = response.headers.get("ETag", "")
+
+
+@scenario("GET /todos/?today=true")
+async def list_today_todos(client, session, i, recorder):
+    await recorder.call(client, "GET", "/todos/", headers=session.cookies(), params={"today": True})
+
+
+@scenario("GET /todos/?limit=20")
+async def list_todo_page(client, session, i, recorder):
+    await recorder.call(client, "GET", "/todos/", headers=session.cookies(), params={"limit": 20})
+
+
+@scenario("GET /todos/?overdue=true")
+async def list_overdue_todos(client, session, i, recorder):
+    await recorder.call(client, "GET", "/todos/", headers=session.cookies(), params={"overdue": True})
+
+
+@scenario("GET /todos/?stream=true")
+async def stream_todos(client, session, i, recorder):
+    await recorder.call(client, "GET", "/todos/", headers=session.cookies(), params={"stream": True})
+
+
+@scenario("GET /todos/ If-None-Match")
+async def list_todos_not_modified(client, session, i, recorder):
+    if not session.etag:
+        session.etag = (await untimed(client, "GET", "/todos/", headers=session.cookies())).headers["ETag"]
+    headers = {**session.cookies(), "If-None-Match": session.etag}
+    await recorder.call(client, "GET", "/todos/", 304, headers=headers)
+
+
+@scenario("GET /todos/changes")
+async def todo_changes(client, session, i, recorder):
+    # 첫 요청은 전체 목록, 이후는 이전 cursor 이후 변경만
+    params = {} if session.changes_cursor is None else {"since": session.changes_cursor}
+    response = await recorder.call(client, "GET", "/todos/changes", headers=session.cookies(), params=params)
+    session.changes_cursor = response.json()["cursor"]
+
+
+@scenario("GET /todos/stats")
+async def todo_stats(client, session, i, recorder):
+    await recorder.call(client, "GET", "/todos/stats", headers=session.cookies())
+
+
+@scenario("GET /todos/search")
+async def search_todos(client, session, i, recorder):
+    await recorder.call(client, "GET", "/todos/search", headers=session.cookies(), params={"q": f"task {i % 10}"})
+
+
+@scenario("GET /todos/{id}")
+async def read_todo(client, session, i, recorder):
+    todo_id = session.todo_ids[i % len(session.todo_ids)]
+    await recorder.call(client, "GET", f"/todos/{todo_id}", headers=session.cookies())
+
+
+@scenario("PUT /todos/{id}")
+async def update_todo(client, session, i, recorder):
+    todo_id = session.todo_ids[i % len(session.todo_ids)]
+    body = {"task": f"updated {i}", "due_date": "2030-01-01", "today": i % 2 == 0}
+    await recorder.call(client, "PUT", f"/todos/{todo_id}", headers=session.cookies(), json=body)
+
+
+@scenario("PUT /todos/{id}/completed")
+async def complete_todo(client, session, i, recorder):
+    todo_id = session.todo_ids[i % len(session.todo_ids)]
+    await recorder.call(client, "PUT", f"/todos/{todo_id}/completed", headers=session.cookies(), json={"is_done": i % 2 == 0})
+
+
+@scenario("PUT /todos/{id}/move")
+async def move_todo(client, session, i, recorder):
+    todo_id = session.todo_ids[i % len(session.todo_ids)]
+    await recorder.call(client, "PUT", f"/todos/{todo_id}/move", headers=session.cookies(), json={"today": i % 2 == 0})
+
+
+@scenario("PUT /todos/batch/completed")
+async def complete_todo_batch(client, session, i, recorder):
+    body = {"ids": session.todo_ids[:BATCH_SIZE], "is_done": i % 2 == 0}
+    await recorder.call(client, "PUT", "/todos/batch/completed", headers=session.cookies(), json=body)
+
+
+@scenario("PUT /todos/batch/move")
+async def move_todo_batch(client, session, i, recorder):
+    body = {"ids": session.todo_ids[:BATCH_SIZE], "today": i % 2 == 0}
+    await recorder.call(client, "PUT", "/todos/batch/move", headers=session.cookies(), json=body)
+
+
+@scenario("POST /todos/batch/delete")
+async def delete_todo_batch(client, session, i, recorder):
+    items = [{"task": f"doomed {i}-{n}", "today": False} for n in range(BATCH_SIZE)]
+    created = await untimed(client, "POST", "/todos/batch", headers=session.cookies(), json={"items": items})
+    ids = [todo["id"] for todo in created.json()]
+    await recorder.call(client, "POST", "/todos/batch/delete", headers=session.cookies(), json={"ids": ids})
+
+
+@scenario("DELETE /todos/{id}")
+async def delete_todo(client, session, i, recorder):
+    created = await untimed(client, "POST", "/todos/", headers=session.cookies(), json={"task": f"doomed {i}", "today": False})
+    await recorder.call(client, "DELETE", f"/todos/{created.json()['id']}", 204, headers=session.cookies())
+
+
+@scenario("DELETE /todos/")
+async def delete_all_todos(client, session, i, recorder):
+    # 가장 마지막 todos 시나리오: 시드된 목록 전체 삭제 후 다시 채움
+    await recorder.call(client, "DELETE", "/todos/", 204, headers=session.cookies())
+    items = [{"task": f"refill {i}-{n}", "today": n % 2 == 0} for n in range(BATCH_SIZE)]
+    created = await untimed(client, "POST", "/todos/batch", headers=session.cookies(), json={"items": items})
+    session.todo_ids = [todo["id"] for todo in created.json()]
+
+
+# ---- memo ----
+
+@scenario("POST /memo/")
+async def create_memo(client, session, i, recorder):
+    # 메모는 사용자당 하나: 메모 없는 사용자로 로그인해서 생성
+    login = await untimed(client, "GET", "/auth/google/callback", params={"code": f"bench-memo-{next(new_users)}"})
+    cookies = {"Cookie": f"access_token={login.cookies['access_token']}"}
+    await recorder.call(client, "POST", "/memo/", 201, headers=cookies, json={"content": "new memo"})
+
+
+@scenario("GET /memo/")
+async def get_memo(client, session, i, recorder):
+    response = await recorder.call(client, "GET", "/memo/", headers=session.cookies())
+    session.memo_version = response.json().get("version", session.memo_version)
+
+
+@scenario("PUT /memo/")
+async def update_memo(client, session, i, recorder):
+    response = await recorder.call(client, "PUT", "/memo/", headers=session.cookies(), json={"content": f"memo {i}"})
+    session.memo_version = response.json().get("version") or session.memo_version
+
+
+@scenario("PATCH /memo/")
+async def patch_memo(client, session, i, recorder):
+    body = {"base_version": session.memo_version, "ops": [{"pos": 0, "delete": 0, "insert": "+"}]}
+    response = await recorder.call(client, "PATCH", "/memo/", headers=session.cookies(), json=body)
+    session.memo_version = response.json().get("version") or session.memo_version
+
+
+# ---- auth ----
+
+@scenario("GET /auth/login/google")
+async def login_redirect(client, session, i, recorder):
+    await recorder.call(client, "GET", "/auth/login/google", 307)
+
+
+@scenario("GET /auth/google/callback")
+async def google_callback(client, session, i, recorder):
+    response = await recorder.call(client, "GET", "/auth/google/callback", 307, params={"code": session.google_sub})
+    session.update_tokens(response)
+
+
+@scenario("GET /auth/me")
+async def get_me(client, session, i, recorder):
+    await recorder.call(client, "GET", "/auth/me", headers=session.cookies())
+
+
+@scenario("POST /auth/refresh")
+async def refresh(client, session, i, recorder):
+    response = await recorder.call(client, "POST", "/auth/refresh", headers=session.cookies())
+    session.update_tokens(response)
+
+
+@scenario("POST /auth/logout")
+async def logout(client, session, i, recorder):
+    await recorder.call(client, "POST", "/auth/logout", headers=session.cookies())
+    # 다음 요청을 위해 다시 로그인 (측정하지 않음)
+    session.update_tokens(await untimed(client, "GET", "/auth/google/callback", params={"code": session.google_sub}))
+
+
+def google_stub(request: httpx.Request) -> httpx.Response:
+    """ 인가 코드를 그대로 access_token으로 돌려주고, userinfo는 그 토큰을 google sub로 사용 """
+    if request.url.path == "/token":
+        code = dict(httpx.QueryParams(request.content.decode()))["code"]
+        return httpx.Response(200, json={"access_token": code})
+    sub = request.headers["Authorization"].removeprefix("Bearer ")
+    return httpx.Response(200, json={
+        "id": sub, "email": f"{sub}@nexlist.dev", "verified_email": True, "name": sub, "given_name": sub, "picture": "",
+    })
+
+
+def reset_database() -> None:
+    """ 이전 실행의 데이터 삭제 (lifespan이 DB_CREATE_TABLES로 테이블 생성 후 head로 stamp) """
+    engine = create_engine(PRIMARY_DB_URL)
+    Base.metadata.drop_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS alembic_version"))
+    engine.dispose()
+
+
+def seed(users: int, todos_per_user: int) -> list[BenchSession]:
+    engine = create_engine(PRIMARY_DB_URL)
+    sessions = []
+    with sessionmaker(bind=engine)() as db:
+        for n in range(users):
+            sub = f"bench-{n}"
+            user = User(email=f"{sub}@nexlist.dev", name=sub, given_name=sub, google_sub=sub, created_at=date.today(), picture="")
+            db.add(user)
+            db.flush()
+            db.add(Memo(user_id=user.id, content="benchmark memo"))
+            db.execute(insert(Todo), [
+                {"task": f"task {i}", "user_id": user.id, "today": i % 2 == 0, "is_done": False}
+                for i in range(todos_per_user)
+            ])
+            todo_ids = list(db.scalars(select(Todo.id).where(Todo.user_id == user.id).order_by(Todo.id)))
+            sessions.append(BenchSession(user.id, sub, todo_ids, access_token=create_jwt_token({"user_id": user.id})))
+        db.commit()
+    engine.dispose()
+    return sessions
+
+
+async def run_scenario(client: httpx.AsyncClient, fn: Scenario, sessions: list[BenchSession], requests: int) -> tuple[Recorder, float]:
+    recorder = Recorder()
+    counter = iter(range(requests))
+
+    async def worker(session: BenchSession):
+        for i in counter:
+            await fn(client, session, i, recorder)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(session) for session in sessions))
+    return recorder, time.perf_counter() - started
+
+
+async def run_suite(names: list[str], users: int, todos: int, requests: int, warmup: int) -> dict[str, tuple[Recorder, float]]:
+    """ 시나리오별 (Recorder, 경과 시간). 동시성 = 가상 사용자 수 """
+    reset_database()
+    google = GoogleOAuthClient(base_url=GOOGLE_STUB_URL, retries=0, transport=httpx.MockTransport(google_stub))
+    app.dependency_overrides[get_google_client] = lambda: google
+
+    results = {}
+    async with lifespan(app):
+        sessions = seed(users, todos)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            # 모든 가상 사용자 로그인: refresh_token 발급
+            for session in sessions:
+                session.update_tokens(await untimed(client, "GET", "/auth/google/callback", params={"code": session.google_sub}))
+
+            for name in names:
+                if warmup:
+                    await run_scenario(client, SCENARIOS[name], sessions, warmup)
+                results[name] = await run_scenario(client, SCENARIOS[name], sessions, requests)
+    await google.aclose()
+    return results
@@ -0,0 +1,160 @@
+""" GET /events/ (SSE) idle 구독자 부하 테스트
+
+uvicorn으로 앱을 별도 프로세스에서 띄우고(SQLite), 구독 연결을 N개 열어 둔 상태에서
+서버 프로세스의 RSS 증가량으로 연결당 메모리를 측정한다.
+이어서 모든 사용자에게 todo를 하나씩 추가해서 변경 알림이 전체 구독자에게 도달하는 시간을 측정한다.
+
+    cd server
+    python -m benchmarks.sse_subscribers --subscribers 1000 --users 100
+
+RSS는 /proc/<pid>/status 에서 읽으므로 Linux에서만 동작한다.
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date
+
+os.environ.setdefault("NEXLIST_JWT_SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("NEXLIST_JWT_ALGORITHM", "HS256")
+
+import httpx
+from sqlalchemy import create_engine, insert
+
+from nexlist.auth.jwt_utils import create_jwt_token
+from nexlist.auth.models import User
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def rss_kib(pid: int) -> int:
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    raise RuntimeError("VmRSS not found")
+
+
+def start_server(url: str, port: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "NEXLIST_DB_PRIMARY_URL": url,
+        "NEXLIST_DB_CREATE_TABLES": "true",
+        "NEXLIST_DB_ECHO": "false",
+        "NEXLIST_EVENTS_KEEPALIVE_SECONDS": "600",
+    }
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "nexlist.app:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+
+
+async def wait_ready(client: httpx.AsyncClient, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get("/readyz")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("server did not become ready")
+
+
+def seed_users(url: str, users: int) -> list[int]:
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(User),
+            [{"email": f"sse{i}@nexlist.dev", "name": f"sse{i}", "google_sub": f"sse-{i}", "created_at": date.today()} for i in range(users)],
+        )
+        ids = [row.id for row in conn.execute(User.__table__.select().where(User.google_sub.like("sse-%")))]
+    engine.dispose()
+    return ids
+
+
+async def subscribe(client: httpx.AsyncClient, user_id: int, subscribed: asyncio.Event, received: asyncio.Queue, opened: list):
+    cookies = {"access_token": create_jwt_token({"user_id": user_id})}
+    async with client.stream("GET", "/events/", cookies=cookies) as response:
+        response.raise_for_status()
+        events = 0
+        async for line in response.aiter_lines():
+            if not line.startswith("event: "):
+                continue
+            events += 1
+            # 연결 직후 todos / memo 현재 ETag 2개를 받으면 구독 완료
+            if events == 2:
+                opened.append(user_id)
+                subscribed.set()
+            elif events > 2 and line == "event: todos":
+                await received.put(time.perf_counter())
+
+
+async def run(args, url: str) -> None:
+    port = free_port()
+    server = start_server(url, port)
+    limits = httpx.Limits(max_connections=args.subscribers + 10, max_keepalive_connections=args.subscribers + 10)
+    timeout = httpx.Timeout(60, read=None)
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=timeout) as client:
+            await wait_ready(client)
+            user_ids = seed_users(url, args.users)
+            baseline = rss_kib(server.pid)
+
+            received: asyncio.Queue = asyncio.Queue()
+            opened: list[int] = []
+            subscribed = asyncio.Event()
+            tasks = [
+                asyncio.create_task(subscribe(client, user_ids[i % len(user_ids)], subscribed, received, opened))
+                for i in range(args.subscribers)
+            ]
+            while len(opened) < args.subscribers:
+                await asyncio.sleep(0.1)
+                if any(task.done() and task.exception() for task in tasks):
+                    raise next(task.exception() for task in tasks if task.done() and task.exception())
+            await asyncio.sleep(1)
+            loaded = rss_kib(server.pid)
+
+            print(f"subscribers={args.subscribers} users={args.users}")
+            print(f"server RSS: {baseline / 1024:.1f} MiB -> {loaded / 1024:.1f} MiB")
+            print(f"per idle subscriber: {(loaded - baseline) / args.subscribers:.1f} KiB")
+
+            # 모든 사용자에게 쓰기 1회 -> 전체 구독자에게 알림이 도달하는 시간
+            started = time.perf_counter()
+            for user_id in user_ids:
+                cookies = {"access_token": create_jwt_token({"user_id": user_id})}
+                (await client.post("/todos/", json={"task": "ping", "today": True}, cookies=cookies)).raise_for_status()
+            last = started
+            for _ in range(args.subscribers):
+                last = max(last, await asyncio.wait_for(received.get(), timeout=30))
+            print(f"fan-out: {args.users} writes delivered to {args.subscribers} subscribers in {(last - started) * 1000:.1f} ms")
+
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subscribers", type=int, default=1000)
+    parser.add_argument("--users", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(args, f"sqlite:///{os.path.join(tmp, 'sse.db')}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+""" todos 복합 인덱스 마이그레이션(3f9c2a7d41e8) 전/후 쿼리 latency 비교 벤치마크
+
+많은 유저/할 일을 시딩한 뒤 TodoRepository의 조회 경로를 인덱스 없이 측정하고,
+마이그레이션의 upgrade()를 적용한 뒤 다시 측정한다.
+
+    cd server
+    python -m benchmarks.todo_indexes --users 500 --todos-per-user 400
+    python -m benchmarks.todo_indexes --db-url "mysql+pymysql://user:pw@127.0.0.1:3306/nexlist_bench"
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from sqlalchemy import create_engine, insert, inspect
+from sqlalchemy.orm import Session
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from nexlist.auth.models import User
+from nexlist.db.database import Base
+from nexlist.todos.models import Todo
+from nexlist.todos.repository import TodoRepository
+
+MIGRATION = Path(__file__).resolve().parents[1] / "alembic" / "versions" / "3f9c2a7d41e8_add_todo_composite_indexes.py"
+
+
+def load_migration():
+    spec = importlib.util.spec_from_file_location("todo_indexes_migration", MIGRATION)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def seed(engine, users: int, todos_per_user: int) -> None:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    rng = random.Random(42)
+    start = date.today() - timedelta(days=180)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(User),
+            [{"email": f"u{i}@nexlist.dev", "name": f"u{i}", "google_sub": f"sub-{i}", "created_at": start} for i in range(users)],
+        )
+        user_ids = list(range(1, users + 1))
+        batch: list[dict] = []
+        # 실제 트래픽처럼 유저들의 todo가 테이블 전체에 흩어지도록 섞어서 삽입
+        for _ in range(todos_per_user):
+            rng.shuffle(user_ids)
+            for user_id in user_ids:
+                batch.append({
+                    "user_id": user_id,
+                    "task": "benchmark task",
+                    "is_done": rng.random() < 0.5,
+                    "today": rng.random() < 0.2,
+                    "due_date": start + timedelta(days=rng.randrange(365)),
+                })
+            if len(batch) >= 20_000:
+                conn.execute(insert(Todo), batch)
+                batch.clear()
+        if batch:
+            conn.execute(insert(Todo), batch)
+
+
+def apply_migration(engine, direction: str) -> None:
+    migration = load_migration()
+    with engine.begin() as conn:
+        with Operations.context(MigrationContext.configure(conn)):
+            getattr(migration, direction)()
+
+
+def measure(engine, users: int, samples: int) -> dict[str, float]:
+    rng = random.Random(7)
+    today = date.today()
+    with Session(engine) as db:
+        repo = TodoRepository(db)
+        max_todo_id = db.query(Todo.id).order_by(Todo.id.desc()).limit(1).scalar()
+        cases = {
+            "get_all_todos(today=True)": lambda u: repo.get_all_todos(u, True),
+            "get_all_todos(today=None)": lambda u: repo.get_all_todos(u, None),
+            "get_todo_by_id": lambda u: repo.get_todo_by_id(rng.randint(1, max_todo_id), u),
+            "due_date range (30d)": lambda u: db.query(Todo)
+            .filter(Todo.user_id == u, Todo.due_date >= today, Todo.due_date < today + timedelta(days=30))
+            .all(),
+        }
+        results = {}
+        for name, query in cases.items():
+            timings = []
+            for _ in range(samples):
+                user_id = rng.randint(1, users)
+                started = time.perf_counter()
+                query(user_id)
+                timings.append(time.perf_counter() - started)
+                db.expunge_all()
+            results[name] = statistics.median(timings) * 1000
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db-url", default=None, help="DB URL (기본값: 임시 SQLite 파일)")
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--todos-per-user", type=int, default=400)
+    parser.add_argument("--samples", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(args.db_url or f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        print(f"seeding {args.users} users x {args.todos_per_user} todos ...")
+        seed(engine, args.users, args.todos_per_user)
+
+        # create_all이 모델의 인덱스까지 만들었으므로 먼저 되돌려서 마이그레이션 이전 스키마를 재현
+        apply_migration(engine, "downgrade")
+        assert not [ix for ix in inspect(engine).get_indexes("todos") if ix["name"] in load_migration().INDEXES]
+        before = measure(engine, args.users, args.samples)
+
+        apply_migration(engine, "upgrade")
+        after = measure(engine, args.users, args.samples)
+        engine.dispose()
+
+    print(f"{'query':<28} {'before(ms)':>11} {'after(ms)':>10} {'speedup':>8}")
+    for name in before:
+        print(f"{name:<28} {before[name]:>11.3f} {after[name]:>10.3f} {before[name] / after[name]:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
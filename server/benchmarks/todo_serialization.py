@@ -0,0 +1,86 @@
+""" GET /todos/ 직렬화 경로 비교 마이크로 벤치마크
+
+ORM 객체 + response_model(TodoResponse) 검증 + 기본 JSON 인코더 경로(TODO_FAST_JSON=False)와
+컬럼 프로젝션 + orjson 경로(TODO_FAST_JSON=True)를 todo 10 / 1k / 10k 개에서 비교한다.
+요청은 하나씩 순서대로 보내서 (동시성 없이) 요청당 CPU 시간을 측정한다.
+
+    cd server
+    python -m benchmarks.todo_serialization
+    python -m benchmarks.todo_serialization --sizes 10 1000 10000 --requests 50
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import httpx
+
+from benchmarks.db_modes import build_app, percentile, seed
+from nexlist.auth.jwt_utils import create_jwt_token
+from nexlist.config import settings
+
+
+async def measure(app, user_id: int, fast: bool, requests: int) -> list[float]:
+    settings.TODO_FAST_JSON = fast
+    cookies = {"access_token": create_jwt_token({"user_id": user_id})}
+    transport = httpx.ASGITransport(app=app)
+    latencies: list[float] = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", cookies=cookies) as client:
+        # 워밍업 (커넥션 / 캐시)
+        for _ in range(3):
+            (await client.get("/todos/")).raise_for_status()
+        for _ in range(requests):
+            started = time.perf_counter()
+            response = await client.get("/todos/")
+            latencies.append(time.perf_counter() - started)
+            response.raise_for_status()
+    return latencies
+
+
+async def run(url: str, size: int, requests: int) -> dict:
+    user_id = seed(url, size)
+    app, engine = build_app("sync", url)
+    try:
+        slow = await measure(app, user_id, fast=False, requests=requests)
+        fast = await measure(app, user_id, fast=True, requests=requests)
+    finally:
+        engine.dispose()
+    return {
+        "size": size,
+        "slow_p50": statistics.median(slow) * 1000,
+        "slow_p99": percentile(slow, 99) * 1000,
+        "fast_p50": statistics.median(fast) * 1000,
+        "fast_p99": percentile(fast, 99) * 1000,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db-url", default=None, help="동기 드라이버 DB URL (기본값: 임시 SQLite 파일)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 10000])
+    parser.add_argument("--requests", type=int, default=30, help="크기별 / 경로별 요청 수")
+    args = parser.parse_args(argv)
+
+    fast_json = settings.TODO_FAST_JSON
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.db_url or f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        print(f"db={url.split('@')[-1]} requests={args.requests}")
+        print(f"{'todos':>6} {'orm p50':>10} {'orm p99':>10} {'fast p50':>10} {'fast p99':>10} {'speedup':>8}")
+        try:
+            for size in args.sizes:
+                r = asyncio.run(run(url, size, args.requests))
+                print(
+                    f"{r['size']:>6} {r['slow_p50']:>10.2f} {r['slow_p99']:>10.2f} "
+                    f"{r['fast_p50']:>10.2f} {r['fast_p99']:>10.2f} {r['slow_p50'] / r['fast_p50']:>7.1f}x"
+                )
+                sys.stdout.flush()
+        finally:
+            settings.TODO_FAST_JSON = fast_json
+
+
+if __name__ == "__main__":
+    main()
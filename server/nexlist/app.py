@@ -1,21 +1,118 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_fastapi_instrumentator import Instrumentator
 
+from nexlist.auth.google_auth import google_client
+from nexlist.auth.id_token import google_id_token_verifier
 from nexlist.auth.router import router as auth_router
-from nexlist.db.database import create_tables
+from nexlist.config import settings
+from nexlist.db.database import (
+    Base,
+    async_engine,
+    async_replica_engine,
+    engine,
+    replica_engine,
+)
+from nexlist.db.startup import (
+    Readiness,
+    UnversionedSchemaError,
+    create_tables_and_stamp,
+    prewarm_pool,
+)
+from nexlist.events.router import router as events_router
+from nexlist.health.router import router as health_router
+from nexlist.memo.buffer import memo_write_buffer
+from nexlist.memo.dependencies import save_pending_memos
 from nexlist.memo.router import router as memo_router
+from nexlist.metrics import DbStatsMiddleware
+from nexlist.todos.cache import todo_list_cache
+from nexlist.todos.clear import todo_clear_jobs
+from nexlist.todos.rollover import todo_rollover_scheduler
 from nexlist.todos.router import router as todos_router
+from nexlist.todos.tombstones import tombstone_prune_scheduler
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    import 시점 create_all 대신 서버 시작 시 DB 준비
+    1. alembic revision 확인 (실패해도 프로세스는 띄우고 /readyz 503)
+    2. 풀 커넥션 pre-warm
+    3. 메모 write-behind 버퍼 flush 시작 (종료 시 남은 값 flush 후 엔진 정리)
+    4. id_token 로컬 검증 모드면 Google JWKS 미리 받아두기
+    5. 오늘 할 일 rollover 스케줄러 / 만료된 tombstone 정리 시작
+    """
+    primary, replica = (async_engine, async_replica_engine) if settings.DB_ASYNC else (engine, replica_engine)
+
+    if settings.DB_CREATE_TABLES:
+        try:
+            await create_tables_and_stamp(primary, Base.metadata)
+        except UnversionedSchemaError as e:
+            # 프로세스는 띄우고 schema 확인에서 not ready로 남김
+            logger.error("skipped DB_CREATE_TABLES: %s", e)
+
+    readiness = Readiness(primary, check_schema=settings.DB_CHECK_SCHEMA)
+    app.state.readiness = readiness
+    if await readiness.check():
+        for target in filter(None, (primary, replica)):
+            warmed = await prewarm_pool(target, settings.DB_PREWARM_CONNECTIONS)
+            logger.info("pre-warmed %d connections (%s)", warmed, target.pool.logging_name)
+
+    if settings.MEMO_WRITE_BEHIND:
+        await memo_write_buffer.start(save_pending_memos)
+
+    if settings.GOOGLE_ID_TOKEN_VERIFY:
+        try:
+            await google_id_token_verifier.jwks.refresh()
+        except Exception:
+            # 첫 로그인 요청에서 다시 받아옴
+            logger.exception("failed to prefetch Google JWKS")
+
+    if settings.TODO_ROLLOVER_ENABLED:
+        await todo_rollover_scheduler.start()
+    if settings.TODO_TOMBSTONE_PRUNE_ENABLED:
+        await tombstone_prune_scheduler.start()
+
+    yield
+
+    if settings.TODO_TOMBSTONE_PRUNE_ENABLED:
+        await tombstone_prune_scheduler.stop()
+    if settings.TODO_ROLLOVER_ENABLED:
+        await todo_rollover_scheduler.stop()
+    await todo_clear_jobs.stop()
+    if settings.MEMO_WRITE_BEHIND:
+        await memo_write_buffer.stop()
+    await google_client.aclose()
+    if todo_list_cache is not None:
+        await todo_list_cache.aclose()
+    for target in filter(None, (engine, replica_engine)):
+        target.dispose()
+    for target in filter(None, (async_engine, async_replica_engine)):
+        await target.dispose()
 
-# Create MySQL Tables
-create_tables()
 
 # FastAPI Configuration
-app = FastAPI(debug=True)
+app = FastAPI(debug=True, lifespan=lifespan)
 
 # include routers
+app.include_router(health_router)
 app.include_router(todos_router)
 app.include_router(auth_router)
 app.include_router(memo_router)
+app.include_router(events_router)
+
+# Prometheus: 라우트별 latency 히스토그램 / in-flight 게이지 + 요청별 DB 쿼리 통계, GET /metrics 노출
+app.add_middleware(DbStatsMiddleware)
+Instrumentator(
+    should_instrument_requests_inprogress=True,
+    inprogress_labels=True,
+    excluded_handlers=["/metrics", "/healthz", "/readyz", "/events/"],
+).instrument(app).expose(app, include_in_schema=False)
 
 # CORS 허용
 app.add_middleware(
@@ -24,4 +121,5 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
@@ -0,0 +1,32 @@
+# get_current_user 핫패스용 캐시
+# : 검증된 토큰(digest -> user_id)과 User 행(user_id -> User)을 캐싱해서 매 요청마다 JWT 디코딩과 users SELECT를 생략
+
+import hashlib
+import time
+
+from nexlist.cache.memory import TTLCache
+from nexlist.config import settings
+from nexlist.metrics import register_cache
+
+token_cache = TTLCache(settings.AUTH_TOKEN_CACHE_SIZE, settings.AUTH_TOKEN_CACHE_TTL_SECONDS)
+user_cache = TTLCache(settings.AUTH_USER_CACHE_SIZE, settings.AUTH_USER_CACHE_TTL_SECONDS)
+register_cache("auth_token", token_cache)
+register_cache("auth_user", user_cache)
+
+
+def token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def cache_token(token: str, user_id: int, expires_at: float | None) -> None:
+    """ 토큰 만료 시각(exp) 이후에는 캐시에서 조회되지 않도록 TTL을 제한 """
+    ttl = None if expires_at is None else expires_at - time.time()
+    token_cache.set(token_digest(token), user_id, ttl)
+
+
+def invalidate_user(user_id: int) -> None:
+    user_cache.delete(user_id)
+
+
+def cache_stats() -> dict[str, dict[str, float]]:
+    return {"token": token_cache.stats(), "user": user_cache.stats()}
@@ -1,21 +1,30 @@
+import hmac
+
 from fastapi import Depends, HTTPException, Request
 from jose import JWTError, jwt
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from nexlist.config import settings
-from nexlist.db.dependencies import get_db
+from nexlist.db.dependencies import get_async_db, get_db
 
+from .cache import cache_token, token_cache, token_digest, user_cache
 from .models import User
+from .repository import get_user_by_id, get_user_by_id_async
 
 
-
-# 현재 로그인 상태인 유저를 반환
-def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
+# 쿠키의 access_token을 검증하고 user_id를 반환
+def get_token_user_id(request: Request) -> int:
     token = request.cookies.get("access_token")
 
     if token is None:
         raise HTTPException(status_code=401, detail="Login Required")
 
+    # 이미 검증한 토큰이면 디코딩 생략
+    user_id = token_cache.get(token_digest(token))
+    if user_id is not None:
+        return user_id
+
     try:
         payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
         user_id: int = payload.get("user_id")
@@ -25,8 +34,54 @@ def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
     except JWTError:
         raise HTTPException(status_code=401, detail="Token decode error")
 
-    user = db.query(User).filter(User.id == user_id).first()
+    cache_token(token, user_id, payload.get("exp"))
+    return user_id
+
+
+# 운영 엔드포인트: Authorization: Bearer <token>이 Settings.OPS_TOKEN과 같은지 확인
+# : 토큰이 설정되지 않았으면 엔드포인트가 없는 것처럼 404
+def require_ops_token(request: Request) -> None:
+    if not settings.OPS_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), settings.OPS_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Invalid ops token")
+
+
+# 현재 로그인 상태인 유저를 반환
+def get_current_user_sync(request: Request, db: Session = Depends(get_db)) -> User:
+    user_id = get_token_user_id(request)
+
+    user = user_cache.get(user_id)
+    if user is not None:
+        return user
+
+    user = get_user_by_id(user_id, db)
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
 
+    # 세션의 commit(expire)/close에 영향받지 않도록 분리된(detached) 객체를 캐싱
+    db.expunge(user)
+    user_cache.set(user_id, user)
     return user
+
+
+# 현재 로그인 상태인 유저를 반환 (AsyncSession)
+async def get_current_user_async(request: Request, db: AsyncSession = Depends(get_async_db)) -> User:
+    user_id = get_token_user_id(request)
+
+    user = user_cache.get(user_id)
+    if user is not None:
+        return user
+
+    user = await get_user_by_id_async(user_id, db)
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    db.expunge(user)
+    user_cache.set(user_id, user)
+    return user
+
+
+# Settings.DB_ASYNC에 따라 라우터가 사용할 의존성 선택
+get_current_user = get_current_user_async if settings.DB_ASYNC else get_current_user_sync
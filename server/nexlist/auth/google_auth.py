@@ -1,44 +1,130 @@
-import requests
+import asyncio
+import random
+import time
+from urllib.parse import urlsplit
+
+import httpx
 from fastapi import HTTPException, Response
 
 from nexlist.config import settings
+from nexlist.metrics import observe_google_call
+
 from .schemas import GoogleUserInfoResponse
 
+# 요청이 서버에 전달되지 않았음이 확실한 오류: 인가 코드 교환(POST)도 재시도 가능
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# 멱등 요청(userinfo GET 등)만 재시도하는 응답 코드
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def rebase_url(url: str, base_url: str) -> str:
+    """ 설정된 Google URL의 scheme/host를 base_url로 교체 (테스트/부하 테스트용 stub 서버) """
+    if not base_url:
+        return url
+    parts = urlsplit(url)
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{base_url.rstrip('/')}{parts.path}{query}"
+
+
+class GoogleOAuthClient:
+    """
+    Google OAuth 호출용 공유 비동기 HTTP 클라이언트
+    : keep-alive 커넥션 풀을 프로세스에서 재사용하고, 이벤트 루프를 막지 않음
+    : 클라이언트는 첫 호출 시 생성하고 lifespan 종료 시 aclose()
+    """
+
+    def __init__(
+        self,
+        base_url: str = "",
+        timeout: float = 5.0,
+        connect_timeout: float = 2.0,
+        max_connections: int = 20,
+        retries: int = 2,
+        backoff: float = 0.2,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.base_url = base_url
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self.retries = retries
+        self.backoff = backoff
+        self.transport = transport
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def token_url(self) -> str:
+        return rebase_url(settings.GOOGLE_TOKEN_URL, self.base_url)
 
+    @property
+    def user_info_url(self) -> str:
+        return rebase_url(settings.GOOGLE_USER_INFO_ENDPOINT, self.base_url)
 
-def fetch_google_access_token(code: str) -> str:
-    """ Google 인증 서버에 토큰 요청 """
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits, transport=self.transport)
+        return self._client
 
-    token_url = settings.GOOGLE_TOKEN_URL
-    data = {
-        "code": code,
-        "client_id": settings.GOOGLE_CLIENT_ID,
-        "client_secret": settings.GOOGLE_CLIENT_SECRET,
-        "redirect_uri": settings.GOOGLE_REDIRECT_URI,
-        "grant_type": "authorization_code",
-    }
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
-    token_response = requests.post(token_url, data=data)
-    if token_response.status_code != 200:
-        raise HTTPException(status_code=400, detail="Failed to obtain token")
+    async def request(self, call: str, method: str, url: str, idempotent: bool, **kwargs) -> httpx.Response:
+        """ 지수 백오프(+jitter) 재시도, 시도마다 nexlist_google_oauth_request_duration_seconds 기록 """
+        for attempt in range(self.retries + 1):
+            last_attempt = attempt == self.retries
+            started = time.perf_counter()
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                observe_google_call(call, started, e.__class__.__name__)
+                retryable = isinstance(e, NOT_SENT_ERRORS) or (idempotent and isinstance(e, httpx.TimeoutException))
+                if last_attempt or not retryable:
+                    raise HTTPException(status_code=502, detail="Google OAuth unavailable")
+            else:
+                observe_google_call(call, started, response.status_code)
+                if last_attempt or not (idempotent and response.status_code in RETRY_STATUSES):
+                    return response
+            await asyncio.sleep(self.backoff * (2 ** attempt) * random.uniform(0.5, 1.5))
 
-    access_token = token_response.json().get("access_token")
+    async def exchange_code(self, code: str) -> dict:
+        """ Google 인증 서버에 토큰 요청 (access_token, OpenID id_token 등) """
+        data = {
+            "code": code,
+            "client_id": settings.GOOGLE_CLIENT_ID,
+            "client_secret": settings.GOOGLE_CLIENT_SECRET,
+            "redirect_uri": settings.GOOGLE_REDIRECT_URI,
+            "grant_type": "authorization_code",
+        }
+        # 인가 코드는 한 번만 사용할 수 있으므로 전송된 요청은 재시도하지 않음
+        token_response = await self.request("token", "POST", self.token_url, idempotent=False, data=data)
+        if token_response.status_code != 200:
+            raise HTTPException(status_code=400, detail="Failed to obtain token")
+        return token_response.json()
 
-    return access_token
+    async def fetch_user_info(self, access_token: str) -> GoogleUserInfoResponse:
+        """ Google로부터 사용자 정보 받아오기 """
+        headers = {"Authorization": f"Bearer {access_token}"}
+        user_info_response = await self.request("userinfo", "GET", self.user_info_url, idempotent=True, headers=headers)
 
+        if user_info_response.status_code != 200:
+            response = Response(status_code=401)
+            response.delete_cookie("access_token")
+            raise HTTPException(status_code=401, detail="Invalid or expired token")
 
-def fetch_google_user_info(access_token: str) -> GoogleUserInfoResponse:
-    """ Google로부터 사용자 정보 받아오기 """
+        return GoogleUserInfoResponse(**user_info_response.json())
 
-    headers = {"Authorization": f"Bearer {access_token}"}
-    user_info_response = requests.get(settings.GOOGLE_USER_INFO_ENDPOINT, headers=headers)
 
-    if user_info_response.status_code != 200:
-        response = Response(status_code=401)
-        response.delete_cookie("access_token")
-        raise HTTPException(status_code=401, detail="Invalid or expired token")
+google_client = GoogleOAuthClient(
+    base_url=settings.GOOGLE_OAUTH_BASE_URL,
+    timeout=settings.GOOGLE_HTTP_TIMEOUT_SECONDS,
+    connect_timeout=settings.GOOGLE_HTTP_CONNECT_TIMEOUT_SECONDS,
+    max_connections=settings.GOOGLE_HTTP_MAX_CONNECTIONS,
+    retries=settings.GOOGLE_HTTP_RETRIES,
+    backoff=settings.GOOGLE_HTTP_RETRY_BACKOFF_SECONDS,
+)
 
-    raw_json = user_info_response.json()
-    user_info = GoogleUserInfoResponse(**raw_json)
 
-    return user_info
+def get_google_client() -> GoogleOAuthClient:
+    return google_client
@@ -0,0 +1,157 @@
+# Google OpenID id_token 로컬 검증
+# : 토큰 교환 응답의 id_token을 Google 서명 키(JWKS)로 검증하고 claims에서 프로필을 읽어
+#   userinfo 호출(로그인당 네트워크 왕복 1회)을 생략
+# : JWKS는 TTL 동안 캐시하고, 만료 전에 백그라운드로 갱신 (요청은 기존 키로 계속 처리)
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from fastapi import HTTPException
+from jose import jwt
+from jose.exceptions import JWTError
+from starlette.concurrency import run_in_threadpool
+
+from nexlist.config import settings
+
+from .google_auth import GoogleOAuthClient, google_client, rebase_url
+from .schemas import GoogleUserInfoResponse
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
+
+class JwksCache:
+    def __init__(
+        self,
+        fetch: Callable[[], Awaitable[dict]],
+        ttl: float = 3600,
+        refresh_ahead: float = 0.8,
+        min_refresh_interval: float = 60,
+    ):
+        self.fetch = fetch
+        self.ttl = ttl
+        # TTL의 이 비율이 지나면 백그라운드 갱신 시작
+        self.refresh_ahead = refresh_ahead
+        # 모르는 kid로 인한 강제 갱신 최소 간격 (위조 토큰으로 JWKS 요청이 폭주하지 않도록)
+        self.min_refresh_interval = min_refresh_interval
+        self._keys: dict[str, dict] = {}
+        self._fetched_at: float | None = None
+        self._lock = asyncio.Lock()
+        self._background: asyncio.Task | None = None
+
+    def age(self) -> float:
+        return float("inf") if self._fetched_at is None else time.monotonic() - self._fetched_at
+
+    async def refresh(self) -> None:
+        requested_at = time.monotonic()
+        async with self._lock:
+            # 기다리는 동안 다른 요청이 이미 갱신했으면 생략
+            if self._fetched_at is not None and self._fetched_at >= requested_at:
+                return
+            jwks = await self.fetch()
+            self._keys = {key["kid"]: key for key in jwks.get("keys", []) if "kid" in key}
+            self._fetched_at = time.monotonic()
+
+    async def get_key(self, kid: str | None) -> dict | None:
+        age = self.age()
+        if age >= self.ttl:
+            await self.refresh()
+        elif age >= self.ttl * self.refresh_ahead:
+            self._refresh_in_background()
+
+        key = self._keys.get(kid)
+        if key is None and self.age() >= self.min_refresh_interval:
+            # Google 키 교체 직후: 새 kid가 보이면 한 번 다시 받아옴
+            await self.refresh()
+            key = self._keys.get(kid)
+        return key
+
+    def _refresh_in_background(self) -> None:
+        if self._background is not None and not self._background.done():
+            return
+        self._background = asyncio.create_task(self._refresh_logged())
+
+    async def _refresh_logged(self) -> None:
+        try:
+            await self.refresh()
+        except Exception:
+            logger.exception("JWKS background refresh failed")
+
+
+def jwks_fetcher(source: str, client: GoogleOAuthClient) -> Callable[[], Awaitable[dict]]:
+    """ JWKS 위치: http(s) URL이면 공유 HTTP 클라이언트로, 아니면 로컬 파일(file:// 또는 경로)에서 읽음 """
+    if source.startswith(("http://", "https://")):
+        url = rebase_url(source, client.base_url)
+
+        async def fetch_url() -> dict:
+            response = await client.request("jwks", "GET", url, idempotent=True)
+            if response.status_code != 200:
+                raise HTTPException(status_code=502, detail="Failed to fetch Google signing keys")
+            return response.json()
+
+        return fetch_url
+
+    path = Path(source.removeprefix("file://"))
+
+    async def fetch_file() -> dict:
+        return json.loads(await run_in_threadpool(path.read_text))
+
+    return fetch_file
+
+
+class GoogleIdTokenVerifier:
+    def __init__(self, jwks: JwksCache, client_id: str):
+        self.jwks = jwks
+        self.client_id = client_id
+
+    async def verify(self, id_token: str | None, access_token: str | None = None) -> GoogleUserInfoResponse:
+        """ 서명(RS256), aud, iss, exp, at_hash 검증 후 userinfo 응답과 같은 형태로 반환 """
+        if not id_token:
+            raise HTTPException(status_code=401, detail="Missing id_token")
+        try:
+            kid = jwt.get_unverified_header(id_token).get("kid")
+        except JWTError:
+            raise HTTPException(status_code=401, detail="Invalid id_token")
+
+        key = await self.jwks.get_key(kid)
+        if key is None:
+            raise HTTPException(status_code=401, detail="Invalid id_token")
+
+        try:
+            claims = jwt.decode(
+                id_token,
+                key,
+                algorithms=["RS256"],
+                audience=self.client_id,
+                issuer=GOOGLE_ISSUERS,
+                access_token=access_token,
+            )
+        except JWTError:
+            raise HTTPException(status_code=401, detail="Invalid id_token")
+
+        return GoogleUserInfoResponse(
+            id=claims["sub"],
+            email=claims.get("email", ""),
+            verified_email=claims.get("email_verified", False),
+            name=claims.get("name", ""),
+            given_name=claims.get("given_name", ""),
+            picture=claims.get("picture", ""),
+        )
+
+
+google_id_token_verifier = GoogleIdTokenVerifier(
+    jwks=JwksCache(
+        jwks_fetcher(settings.GOOGLE_JWKS_URL, google_client),
+        ttl=settings.GOOGLE_JWKS_TTL_SECONDS,
+    ),
+    client_id=settings.GOOGLE_CLIENT_ID,
+)
+
+
+def get_id_token_verifier() -> GoogleIdTokenVerifier | None:
+    return google_id_token_verifier if settings.GOOGLE_ID_TOKEN_VERIFY else None
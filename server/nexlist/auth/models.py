@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Date, Integer, String
+from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Integer, String
 
 from nexlist.db.database import Base
 
@@ -14,3 +14,17 @@ class User(Base):
     google_sub = Column(String(255), unique=True)  # Google 사용자 고유 ID
     created_at = Column(Date)
     picture = Column(String(4096))
+
+
+# 서버 측 refresh token 저장소
+# : 토큰 원문은 저장하지 않고 sha256만 보관, 재발급(rotation)마다 같은 family에 새 행 추가
+class RefreshToken(Base):
+    __tablename__ = "refresh_tokens"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    family_id = Column(String(32), nullable=False, index=True)  # 로그인 1회 = family 1개
+    token_hash = Column(String(64), nullable=False, unique=True)
+    session_started_at = Column(DateTime, nullable=False)  # 최대 세션 길이 계산용 (rotation 시 유지)
+    expires_at = Column(DateTime, nullable=False)
+    revoked_at = Column(DateTime)
@@ -0,0 +1,186 @@
+# refresh_tokens 테이블 접근
+# : 재발급(rotation) 시 기존 토큰은 폐기하고 같은 family로 새 토큰 발급
+# : 이미 폐기된 토큰이 다시 제시되면 탈취로 보고 family 전체를 폐기 (reuse detection)
+#   단, 재발급 직후 Settings.REFRESH_REUSE_GRACE_SECONDS 안이고 family에 유효한 토큰이 남아 있으면
+#   (같은 토큰으로 여러 탭이 동시에 재발급) 같은 family로 새 토큰을 발급
+#   (로그아웃 / reuse detection으로 폐기된 family는 유효한 토큰이 없으므로 유예하지 않음)
+
+import hashlib
+import secrets
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from nexlist.config import settings
+from nexlist.db.routing import use_primary
+
+from .models import RefreshToken
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def hash_refresh_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def new_refresh_token(user_id: int, now: datetime, family_id: str | None = None, session_started_at: datetime | None = None) -> tuple[str, RefreshToken]:
+    """ (토큰 원문, 저장할 행) 생성 """
+    token = secrets.token_urlsafe(32)
+    session_started_at = session_started_at or now
+    expires_at = min(
+        now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        session_started_at + timedelta(days=settings.REFRESH_TOKEN_MAX_DAYS),
+    )
+    row = RefreshToken(
+        user_id=user_id,
+        family_id=family_id or secrets.token_hex(16),
+        token_hash=hash_refresh_token(token),
+        session_started_at=session_started_at,
+        expires_at=expires_at,
+    )
+    return token, row
+
+
+def revoke_family_statement(family_id: str, now: datetime):
+    return (
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=now)
+    )
+
+
+# 같은 토큰으로 동시에 재발급을 시도한 경우 한 요청만 성공
+def claim_statement(token_id: int, now: datetime):
+    return (
+        update(RefreshToken)
+        .where(RefreshToken.id == token_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=now)
+    )
+
+
+# 유예 구간 확인: family에 폐기되지 않은 유효한 토큰이 있는지 (= 재발급으로 폐기된 토큰)
+def active_in_family_statement(family_id: str, now: datetime):
+    return (
+        select(RefreshToken.id)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None), RefreshToken.expires_at > now)
+        .limit(1)
+    )
+
+
+def revoked_within_grace(row: RefreshToken, now: datetime) -> bool:
+    return row.revoked_at is not None and row.revoked_at > now - timedelta(seconds=settings.REFRESH_REUSE_GRACE_SECONDS)
+
+
+# 만료된 행 정리: 로그인할 때 해당 사용자 것만 지워서 테이블을 작게 유지
+def purge_expired_statement(user_id: int, now: datetime):
+    return delete(RefreshToken).where(RefreshToken.user_id == user_id, RefreshToken.expires_at <= now)
+
+
+def find_statement(token: str):
+    # 동시 재발급으로 rollback한 뒤 다시 조회할 때 다른 요청이 커밋한 값으로 갱신
+    return select(RefreshToken).filter_by(token_hash=hash_refresh_token(token)).execution_options(populate_existing=True)
+
+
+# CREATE: 로그인 시 새 family 발급
+def issue_refresh_token(user_id: int, db: Session) -> str:
+    now = utcnow()
+    db.execute(purge_expired_statement(user_id, now))
+    token, row = new_refresh_token(user_id, now)
+    db.add(row)
+    db.commit()
+    return token
+
+
+# UPDATE: 재발급, 성공하면 (user_id, 새 토큰) 반환
+def rotate_refresh_token(token: str, db: Session) -> tuple[int, str] | None:
+    use_primary(db)
+    now = utcnow()
+    current = db.scalar(find_statement(token))
+    if current is None:
+        return None
+    claimed = False
+    if current.revoked_at is None:
+        if current.expires_at <= now:
+            return None
+        claimed = db.execute(claim_statement(current.id, now)).rowcount == 1
+        if not claimed:
+            # 같은 토큰으로 다른 요청이 먼저 재발급: 그 요청이 커밋한 뒤의 상태로 유예 여부 확인
+            db.rollback()
+            current = db.scalar(find_statement(token))
+            if current is None or current.revoked_at is None:
+                return None
+    if not claimed and not (
+        revoked_within_grace(current, now) and db.scalar(active_in_family_statement(current.family_id, now))
+    ):
+        db.execute(revoke_family_statement(current.family_id, now))
+        db.commit()
+        return None
+
+    user_id = current.user_id
+    new_token, row = new_refresh_token(user_id, now, current.family_id, current.session_started_at)
+    db.add(row)
+    db.commit()
+    return user_id, new_token
+
+
+# DELETE(폐기): 로그아웃 시 현재 세션(family) 폐기
+def revoke_refresh_token(token: str, db: Session) -> None:
+    use_primary(db)
+    current = db.scalar(find_statement(token))
+    if current is not None:
+        db.execute(revoke_family_statement(current.family_id, utcnow()))
+        db.commit()
+
+
+# CREATE (async)
+async def issue_refresh_token_async(user_id: int, db: AsyncSession) -> str:
+    now = utcnow()
+    await db.execute(purge_expired_statement(user_id, now))
+    token, row = new_refresh_token(user_id, now)
+    db.add(row)
+    await db.commit()
+    return token
+
+
+# UPDATE (async)
+async def rotate_refresh_token_async(token: str, db: AsyncSession) -> tuple[int, str] | None:
+    use_primary(db)
+    now = utcnow()
+    current = await db.scalar(find_statement(token))
+    if current is None:
+        return None
+    claimed = False
+    if current.revoked_at is None:
+        if current.expires_at <= now:
+            return None
+        claimed = (await db.execute(claim_statement(current.id, now))).rowcount == 1
+        if not claimed:
+            await db.rollback()
+            current = await db.scalar(find_statement(token))
+            if current is None or current.revoked_at is None:
+                return None
+    if not claimed and not (
+        revoked_within_grace(current, now) and await db.scalar(active_in_family_statement(current.family_id, now))
+    ):
+        await db.execute(revoke_family_statement(current.family_id, now))
+        await db.commit()
+        return None
+
+    user_id = current.user_id
+    new_token, row = new_refresh_token(user_id, now, current.family_id, current.session_started_at)
+    db.add(row)
+    await db.commit()
+    return user_id, new_token
+
+
+# DELETE(폐기) (async)
+async def revoke_refresh_token_async(token: str, db: AsyncSession) -> None:
+    use_primary(db)
+    current = await db.scalar(find_statement(token))
+    if current is not None:
+        await db.execute(revoke_family_statement(current.family_id, utcnow()))
+        await db.commit()
@@ -2,17 +2,28 @@
 
 from datetime import datetime
 
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from nexlist.db.routing import use_primary
+
+from .cache import invalidate_user
 from .models import User
 from .schemas import GoogleUserInfoResponse, UserInfoResponse
 
 
 # CREATE: 신규 유저 추가
 def add_user(google_user_info: GoogleUserInfoResponse, db: Session) -> UserInfoResponse:
-    # 기존 유저인지 확인
+    # 기존 유저인지 확인: replica 지연으로 신규 유저로 오판해서 중복 INSERT 하지 않도록 primary에서 조회
+    use_primary(db)
     existing_user: User = get_user_by_sub(google_user_info.google_sub, db)
     if existing_user:
+        # Google 프로필이 바뀐 경우에만 갱신하고 캐시 무효화
+        if update_user_profile(existing_user, google_user_info):
+            db.commit()
+            db.refresh(existing_user)
+            invalidate_user(existing_user.id)
         # .model_validate(): ORM 객체 -> Pydantic 모델(즉, API Response) 변환
         # schema.py에서 model_config = ConfigDict(from_attribute=True) 설정 필요
         return UserInfoResponse.model_validate(existing_user)
@@ -28,5 +39,50 @@ def add_user(google_user_info: GoogleUserInfoResponse, db: Session) -> UserInfoR
     return UserInfoResponse.model_validate(new_user)
 
 
+# UPDATE: Google 프로필 변경 사항 반영, 변경 여부 반환
+def update_user_profile(user: User, google_user_info: GoogleUserInfoResponse) -> bool:
+    changed = False
+    for field, value in google_user_info.model_dump().items():
+        if getattr(user, field) != value:
+            setattr(user, field, value)
+            changed = True
+    return changed
+
+
 def get_user_by_sub(sub: str, db: Session) -> User | None:
     return db.query(User).filter(User.google_sub == sub).first()
+
+
+def get_user_by_id(user_id: int, db: Session) -> User | None:
+    return db.query(User).filter(User.id == user_id).first()
+
+
+# CREATE (async): 신규 유저 추가
+async def add_user_async(google_user_info: GoogleUserInfoResponse, db: AsyncSession) -> UserInfoResponse:
+    use_primary(db)
+    existing_user: User = await get_user_by_sub_async(google_user_info.google_sub, db)
+    if existing_user:
+        if update_user_profile(existing_user, google_user_info):
+            await db.commit()
+            await db.refresh(existing_user)
+            invalidate_user(existing_user.id)
+        return UserInfoResponse.model_validate(existing_user)
+
+    new_user: User = User(**google_user_info.model_dump())
+    new_user.created_at = datetime.now()
+
+    db.add(new_user)
+    await db.commit()
+    await db.refresh(new_user)
+
+    return UserInfoResponse.model_validate(new_user)
+
+
+async def get_user_by_sub_async(sub: str, db: AsyncSession) -> User | None:
+    result = await db.execute(select(User).filter(User.google_sub == sub))
+    return result.scalars().first()
+
+
+async def get_user_by_id_async(user_id: int, db: AsyncSession) -> User | None:
+    result = await db.execute(select(User).filter(User.id == user_id))
+    return result.scalars().first()
@@ -1,18 +1,53 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from fastapi.responses import JSONResponse, RedirectResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from nexlist.config import settings
-from nexlist.db.dependencies import get_db
+from nexlist.db.dependencies import get_session
 
 from .dependencies import get_current_user
 from .google_auth import *
+from .id_token import GoogleIdTokenVerifier, get_id_token_verifier
 from .jwt_utils import *
+from .refresh_tokens import (
+    issue_refresh_token,
+    issue_refresh_token_async,
+    revoke_refresh_token,
+    revoke_refresh_token_async,
+    rotate_refresh_token,
+    rotate_refresh_token_async,
+)
 from .repository import *
 
 
 router = APIRouter(prefix="/auth")
 
+# refresh_token 쿠키는 /auth 요청에만 전송
+REFRESH_COOKIE_PATH = "/auth"
+
+
+def set_auth_cookies(response: Response, user_id: int, refresh_token: str) -> None:
+    """ 새 access_token(jwt)과 refresh_token 쿠키 설정 """
+    # smaesite="none": POST를 포함한 'cross-site' 요청으로부터 쿠키 허용, 단 secure=True 필수
+    response.set_cookie(
+        key="access_token", value=create_jwt_token({"user_id": user_id}), httponly=True, samesite="lax"
+    )
+    response.set_cookie(
+        key="refresh_token",
+        value=refresh_token,
+        httponly=True,
+        samesite="lax",
+        path=REFRESH_COOKIE_PATH,
+        max_age=settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,
+    )
+
+
+def delete_auth_cookies(response: Response) -> None:
+    response.delete_cookie("access_token")
+    response.delete_cookie("refresh_token", path=REFRESH_COOKIE_PATH)
+
 
 @router.get("/login/google")
 async def login_google() -> RedirectResponse:
@@ -23,25 +58,59 @@ async def login_google() -> RedirectResponse:
 
 
 @router.get("/google/callback")
-async def auth_google(code: str, db: Session = Depends(get_db)) -> RedirectResponse:
+async def auth_google(
+    code: str,
+    db: Session | AsyncSession = Depends(get_session),
+    google: GoogleOAuthClient = Depends(get_google_client),
+    id_token_verifier: GoogleIdTokenVerifier | None = Depends(get_id_token_verifier),
+) -> RedirectResponse:
     """ Google로부터 access_token을 받아와서 신규 유저라면 DB에 등록하고 로그인한 사용자에게 jwt 토큰을 반환함.
     : SRP 위배 -> 책임 분리를 위한 리팩토링 필요
     """
 
-    access_token = fetch_google_access_token(code)  #Google Access Token 발급
+    tokens = await google.exchange_code(code)  #Google Access Token (+ OpenID id_token) 발급
 
-    google_user_info = fetch_google_user_info(access_token)  #유저 정보 획득
-    user_info = add_user(google_user_info, db) #유저 정보 등록
+    #유저 정보 획득: id_token 로컬 검증 모드면 userinfo 호출 생략
+    if id_token_verifier is not None:
+        google_user_info = await id_token_verifier.verify(tokens.get("id_token"), tokens.get("access_token"))
+    else:
+        google_user_info = await google.fetch_user_info(tokens.get("access_token"))
 
-    jwt_token = create_jwt_token({"user_id": user_info.id})  #jwt token 생성
+    #유저 정보 등록 + refresh token 발급
+    if settings.DB_ASYNC:
+        user_info = await add_user_async(google_user_info, db)
+        refresh_token = await issue_refresh_token_async(user_info.id, db)
+    else:
+        user_info = await run_in_threadpool(add_user, google_user_info, db)
+        refresh_token = await run_in_threadpool(issue_refresh_token, user_info.id, db)
 
     response = RedirectResponse(url=settings.FRONTEND_BASE_URL)  #jwt token 발급 및 frontend로 리디렉션
+    set_auth_cookies(response, user_info.id, refresh_token)
 
-    # smaesite="none": POST를 포함한 'cross-site' 요청으로부터 쿠키 허용, 단 secure=True 필수
-    response.set_cookie(
-        key="access_token", value=jwt_token, httponly=True, samesite="lax"
-    )
+    return response
 
+
+@router.post("/refresh")
+async def refresh(request: Request, db: Session | AsyncSession = Depends(get_session)) -> JSONResponse:
+    """ access_token 재발급 (Google OAuth 없이)
+    : refresh_token은 한 번 쓰면 폐기되고 새 토큰으로 교체됨 (만료도 연장)
+    """
+    token = request.cookies.get("refresh_token")
+    rotated = None
+    if token is not None:
+        if settings.DB_ASYNC:
+            rotated = await rotate_refresh_token_async(token, db)
+        else:
+            rotated = await run_in_threadpool(rotate_refresh_token, token, db)
+
+    if rotated is None:
+        response = JSONResponse(status_code=401, content={"detail": "Login Required"})
+        delete_auth_cookies(response)
+        return response
+
+    user_id, refresh_token = rotated
+    response = JSONResponse(content={"message": "Refreshed"})
+    set_auth_cookies(response, user_id, refresh_token)
     return response
 
 
@@ -52,10 +121,17 @@ async def get_me(user: User = Depends(get_current_user)):
 
 
 @router.post("/logout")
-async def logout() -> JSONResponse:
+async def logout(request: Request, db: Session | AsyncSession = Depends(get_session)) -> JSONResponse:
     """ 유저 로그아웃
-    : jwt_token(access_token)을 쿠키에서 삭제
+    : jwt_token(access_token)을 쿠키에서 삭제하고 refresh_token(현재 세션)을 폐기
     """
+    token = request.cookies.get("refresh_token")
+    if token is not None:
+        if settings.DB_ASYNC:
+            await revoke_refresh_token_async(token, db)
+        else:
+            await run_in_threadpool(revoke_refresh_token, token, db)
+
     response = JSONResponse(content={"message": "Logged out"})
-    response.delete_cookie("access_token")
+    delete_auth_cookies(response)
     return response
@@ -0,0 +1,72 @@
+# 사용자별 데이터 버전 카운터
+# : 서비스의 쓰기 메서드가 버전을 올리고, 조회 API는 버전으로 ETag를 만들어서
+#   If-None-Match가 일치하면 todos/memos 테이블을 조회하지 않고 304로 응답
+# : 카운터는 프로세스 메모리에 있으므로 단일 프로세스(uvicorn 워커 1개) 배포 기준
+# : 마지막 쓰기 시각도 같이 기록해서 최근 쓰기가 있었던 사용자의 조회를 primary로 보내는 데 사용
+#   (replica 지연 중 읽은 오래된 본문에 쓰기로 올라간 최신 ETag가 붙지 않도록)
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from nexlist.config import settings
+
+
+class VersionStore:
+    """
+    : 최근에 쓰기가 있었던 max_users명의 (버전, 쓰기 시각)만 보관하고 가장 오래전에 쓴 사용자부터 방출
+    : 방출된 사용자는 방출된 버전 중 가장 큰 값(floor)을 버전으로 사용
+      (사용자별 버전은 줄어들지 않고 쓰기마다 커지므로, 이전 ETag가 다른 내용에 다시 붙지 않음)
+    """
+
+    def __init__(self, max_users: int = 100_000):
+        # 재시작 후 카운터가 0부터 다시 시작해도 이전 ETag와 겹치지 않도록 프로세스별 epoch 사용
+        self.epoch = uuid.uuid4().hex[:12]
+        self.max_users = max_users
+        self._entries: OrderedDict[tuple[str, int], tuple[int, float]] = OrderedDict()
+        self._floor = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, scope: str, user_id: int) -> int:
+        entry = self._entries.get((scope, user_id))
+        return entry[0] if entry is not None else self._floor
+
+    def bump(self, scope: str, user_id: int) -> int:
+        with self._lock:
+            version = self.get(scope, user_id) + 1
+            self._entries[(scope, user_id)] = (version, time.monotonic())
+            self._entries.move_to_end((scope, user_id))
+            while len(self._entries) > self.max_users:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self._floor = max(self._floor, evicted)
+            return version
+
+    def changed_within(self, scope: str, user_id: int, seconds: float) -> bool:
+        """ 최근 seconds초 안에 버전이 올라갔는지 (방출된 사용자는 가장 오래전에 쓴 사용자이므로 False) """
+        entry = self._entries.get((scope, user_id))
+        return entry is not None and time.monotonic() - entry[1] < seconds
+
+    def etag(self, scope: str, user_id: int) -> str:
+        return f'"{scope}-{self.epoch}-{user_id}-{self.get(scope, user_id)}"'
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._floor = 0
+
+
+versions = VersionStore(settings.VERSION_STORE_MAX_USERS)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """ If-None-Match 헤더(콤마로 구분된 목록, W/ 접두사, *)와 ETag 비교 """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
@@ -44,11 +44,98 @@ class Settings(BaseSettings):
     GOOGLE_REDIRECT_URI: str = ""
     GOOGLE_TOKEN_URL: str = "https://oauth2.googleapis.com/token"
     GOOGLE_USER_INFO_ENDPOINT: str = "https://www.googleapis.com/oauth2/v1/userinfo"
+    GOOGLE_OAUTH_BASE_URL: str = ""  # 지정 시 위 URL들의 scheme/host를 교체 (로컬 stub 서버)
+    GOOGLE_HTTP_TIMEOUT_SECONDS: float = 5.0
+    GOOGLE_HTTP_CONNECT_TIMEOUT_SECONDS: float = 2.0
+    GOOGLE_HTTP_MAX_CONNECTIONS: int = 20
+    GOOGLE_HTTP_RETRIES: int = 2
+    GOOGLE_HTTP_RETRY_BACKOFF_SECONDS: float = 0.2
+    # id_token 로컬 검증: True면 userinfo 호출 대신 JWKS로 id_token 서명 검증 후 claims 사용
+    GOOGLE_ID_TOKEN_VERIFY: bool = False
+    GOOGLE_JWKS_URL: str = "https://www.googleapis.com/oauth2/v3/certs"  # http(s) URL 또는 로컬 파일 경로
+    GOOGLE_JWKS_TTL_SECONDS: float = 3600
+
+    # 운영 엔드포인트 (POST /todos/rollover 등) Bearer 토큰, 비워두면 엔드포인트 비활성화 (404)
+    OPS_TOKEN: str = ""
 
     #JWT
     JWT_SECRET_KEY: str = ""
     JWT_ALGORITHM: str = ""
     ACCESS_TOKEN_EXPIRE_MINUTE: int = 30
+    # Refresh token: 재발급할 때마다 만료가 연장(sliding)되지만 로그인 시점부터 MAX_DAYS를 넘지 않음
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 14
+    REFRESH_TOKEN_MAX_DAYS: int = 90
+    # 재발급으로 폐기된 토큰이 이 시간 안에 다시 제시되면 (여러 탭의 동시 재발급) family를 폐기하지 않고 새 토큰 발급
+    REFRESH_REUSE_GRACE_SECONDS: float = 10
+
+    # ETag 버전 카운터 (nexlist.cache.versions): 최근에 쓰기가 있었던 사용자 수만큼만 메모리에 보관
+    VERSION_STORE_MAX_USERS: int = 100_000
+
+    # get_current_user 캐시 (SIZE=0 이면 비활성화)
+    AUTH_TOKEN_CACHE_SIZE: int = 4096
+    AUTH_TOKEN_CACHE_TTL_SECONDS: float = 300
+    AUTH_USER_CACHE_SIZE: int = 1024
+    AUTH_USER_CACHE_TTL_SECONDS: float = 60
+
+    # Todo 목록 응답: 필요한 컬럼만 조회해서 orjson으로 직렬화 (False면 ORM + response_model 경로)
+    TODO_FAST_JSON: bool = True
+    # Todo 목록 캐시 (전체 목록 JSON, 사용자 x today 필터). BACKEND: none | memory | redis
+    # : 어떤 백엔드든 워커 1개 기준. redis는 목록 캐시 무효화만 워커 간에 공유하고,
+    #   ETag 버전 카운터 / primary 고정 구간 / 통계 캐시 / 검색 색인은 프로세스 메모리에 있어서
+    #   워커가 여럿이면 다른 워커의 쓰기 이후에도 이전 ETag로 304, 이전 통계를 응답할 수 있음
+    TODO_LIST_CACHE_BACKEND: str = "memory"
+    TODO_LIST_CACHE_SIZE: int = 4096  # memory 백엔드 최대 항목 수
+    TODO_LIST_CACHE_TTL_SECONDS: float = 300
+    TODO_LIST_CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    TODO_LIST_CACHE_REDIS_PREFIX: str = "nexlist:"
+    # Todo 통계 캐시 (GET /todos/stats, SIZE=0 이면 비활성화)
+    TODO_STATS_CACHE_SIZE: int = 4096
+    TODO_STATS_CACHE_TTL_SECONDS: float = 600
+    # Todo 검색 (GET /todos/search). BACKEND: auto(MySQL이면 fulltext, 아니면 memory) | fulltext | memory
+    TODO_SEARCH_BACKEND: str = "auto"
+    TODO_SEARCH_INDEX_USERS: int = 1024  # memory 백엔드: 역색인을 보관할 최대 사용자 수
+
+    # DELETE /todos/: BATCH_SIZE 행씩 나눠서 삭제 (chunk마다 커밋)
+    # : INLINE_MAX_ROWS까지는 요청 안에서 삭제(204), 남은 행은 백그라운드 작업으로 삭제(202 + GET /todos/clear-jobs/{id})
+    TODO_CLEAR_BATCH_SIZE: int = 500
+    TODO_CLEAR_INLINE_MAX_ROWS: int = 2000
+    TODO_CLEAR_PAUSE_SECONDS: float = 0.01  # 백그라운드 chunk 사이 대기
+    TODO_CLEAR_JOB_RETENTION_SECONDS: float = 3600  # 끝난 작업 상태를 조회할 수 있는 시간
+
+    # 증분 동기화 (GET /todos/changes)
+    TODO_CHANGES_SETTLE_SECONDS: float = 5  # 새 cursor를 조회 시각보다 이만큼 앞으로 (늦게 커밋된 쓰기 포함)
+    TODO_TOMBSTONE_RETENTION_DAYS: int = 30  # 이보다 오래된 cursor는 410 (전체 목록을 다시 받아야 함)
+    # 보관 기간이 지난 tombstone 정리 (nexlist.todos.tombstones): 서버 시작 직후, 이후 INTERVAL마다
+    # : 끄면 CLI(python -m nexlist.todos.tombstones)를 주기적으로 실행
+    TODO_TOMBSTONE_PRUNE_ENABLED: bool = True
+    TODO_TOMBSTONE_PRUNE_INTERVAL_SECONDS: float = 3600
+    TODO_TOMBSTONE_PRUNE_BATCH_SIZE: int = 1000  # chunk(트랜잭션) 하나에서 삭제할 최대 행 수
+    TODO_TOMBSTONE_PRUNE_PAUSE_SECONDS: float = 0.05  # chunk 사이 대기
+
+    # Todo "오늘 할 일" rollover (nexlist.todos.rollover): 매일 ROLLOVER_AT에 모든 사용자 대상 실행
+    # : 여러 워커/인스턴스로 배포하면 한 곳에서만 켜거나 CLI(python -m nexlist.todos.rollover)로 서버에 실행 요청
+    TODO_ROLLOVER_ENABLED: bool = False
+    TODO_ROLLOVER_AT: str = "00:05"  # 서버 로컬 시각 HH:MM
+    TODO_ROLLOVER_BATCH_SIZE: int = 1000  # chunk(트랜잭션) 하나에서 변경할 최대 행 수
+    TODO_ROLLOVER_MAX_LOCK_SECONDS: float = 0.5  # chunk 트랜잭션이 이보다 오래 걸리면 다음 chunk 크기를 절반으로
+    TODO_ROLLOVER_PAUSE_SECONDS: float = 0.05  # chunk 사이 대기 (다른 트랜잭션이 잠금을 얻을 틈)
+    TODO_ROLLOVER_CLEAR_DONE: bool = True  # 완료한 todo를 오늘 할 일에서 내림
+
+    # 변경 알림 (GET /events/, Server-Sent Events)
+    EVENTS_BACKEND: str = "memory"  # nexlist.events.broker.BACKENDS
+    EVENTS_KEEPALIVE_SECONDS: float = 15
+    EVENTS_RETRY_MILLISECONDS: int = 3000  # 연결이 끊겼을 때 브라우저 EventSource 재연결 간격
+
+    # Memo
+    MEMO_MAX_LENGTH: int = 65536  # 메모 최대 길이 (문자 수)
+    MEMO_PATCH_MAX_OPS: int = 100  # PATCH /memo/ 한 번에 보낼 수 있는 편집 수
+
+    # Memo write-behind: PUT /memo/ 를 메모리에 모았다가 주기적으로 DB에 기록
+    MEMO_WRITE_BEHIND: bool = False
+    MEMO_FLUSH_INTERVAL_SECONDS: float = 2.0
+    MEMO_WRITE_BEHIND_MAX_PENDING: int = 10000  # 대기 사용자 수가 이를 넘으면 즉시 flush
+    MEMO_WRITE_BEHIND_JOURNAL: str = ""  # 비워두면 메모리만 사용 (비정상 종료 시 마지막 flush 이후 유실)
+    MEMO_WRITE_BEHIND_FSYNC: bool = True  # journal append 마다 fsync
 
     # MySQL
     MYSQL_USER: str = ''
@@ -58,6 +145,25 @@ class Settings(BaseSettings):
     MYSQL_DB_NAME: str = ""
     MYSQL_AUTHENTICATION_PLUGIN: str = ""
 
+    # DB 접근 모드: True면 AsyncSession(aiomysql) 기반 비동기 경로 사용
+    DB_ASYNC: bool = False
+
+    # DB Engine 프로필 (primary / replica 엔진에 공통 적용)
+    DB_PRIMARY_URL: str = ""  # 비워두면 MYSQL_* 설정으로 구성 (로컬 테스트 시 SQLite 등으로 대체)
+    DB_REPLICA_URL: str = ""  # 읽기 전용 replica, 비워두면 모든 쿼리를 primary로 보냄
+    DB_REPLICA_STICKY_SECONDS: float = 5.0  # 쓰기 후 이 시간 동안 해당 사용자의 ETag 조회를 primary에서 (replica 최대 지연보다 길게)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 500
+    DB_POOL_PRE_PING: bool = False
+    DB_ECHO: bool = True
+
+    # 시작(lifespan) 시 DB 준비
+    DB_CHECK_SCHEMA: bool = True  # alembic_version이 head와 다르면 /readyz 503
+    DB_PREWARM_CONNECTIONS: int = 5  # 미리 열어둘 풀 커넥션 수 (pool_size 이하로 제한)
+    DB_CREATE_TABLES: bool = False  # 개발용: 빈 DB면 create_all 후 head로 stamp
+
     model_config = SettingsConfigDict(
         env_prefix="NEXLIST_",
         case_sensitive=False,
@@ -1,24 +1,74 @@
 from urllib.parse import quote
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from nexlist.config import settings
+from nexlist.metrics import instrument_engine
 
-# DB Engine
+from .pool import TimedAsyncAdaptedQueuePool, TimedQueuePool
+from .routing import RoutingSession
+
+# DB URL: DB_PRIMARY_URL이 없으면 MYSQL_* 설정으로 구성
 MYSQL_DB_URL = f"mysql+pymysql://{settings.MYSQL_USER}:{quote(settings.MYSQL_PASSWORD)}@{settings.MYSQL_HOST}:{settings.MYSQL_PORT}/{settings.MYSQL_DB_NAME}?charset=utf8"
-engine = create_engine(MYSQL_DB_URL, pool_recycle=500, pool_size=5, max_overflow=5, echo=True)
+PRIMARY_DB_URL = settings.DB_PRIMARY_URL or MYSQL_DB_URL
+REPLICA_DB_URL = settings.DB_REPLICA_URL or None
 
-# DB 세션 팩토리
-SessionLocal = sessionmaker(bind=engine)
+# 동기 드라이버 -> 비동기 드라이버
+ASYNC_DRIVERS = {"mysql+pymysql": "mysql+aiomysql", "mysql": "mysql+aiomysql", "sqlite": "sqlite+aiosqlite"}
 
-# models.py의 각 Table 클래스가 상속하는 Base Class: Table로 인식
-Base = declarative_base()
 
+def to_async_url(url: str) -> str:
+    scheme, rest = url.split("://", 1)
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}://{rest}"
 
-def create_tables():
-    """Base에 연결된 모든 Table 생성"""
 
+# Settings의 Engine 프로필
+def engine_options(name: str, is_async: bool = False) -> dict:
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "echo": settings.DB_ECHO,
+        "poolclass": TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool,
+        "pool_logging_name": name,
+    }
+
+
+# DB Engine
+engine = create_engine(PRIMARY_DB_URL, **engine_options("primary"))
+instrument_engine(engine, "primary")
+
+replica_engine = None
+if REPLICA_DB_URL:
+    replica_engine = create_engine(REPLICA_DB_URL, **engine_options("replica"))
+    instrument_engine(replica_engine, "replica")
+
+# Async DB Engine (settings.DB_ASYNC=True 일 때 사용)
+async_engine = create_async_engine(to_async_url(PRIMARY_DB_URL), **engine_options("primary_async", is_async=True))
+instrument_engine(async_engine.sync_engine, "primary_async")
+
+async_replica_engine = None
+if REPLICA_DB_URL:
+    async_replica_engine = create_async_engine(to_async_url(REPLICA_DB_URL), **engine_options("replica_async", is_async=True))
+    instrument_engine(async_replica_engine.sync_engine, "replica_async")
+
+# DB 세션 팩토리: 읽기는 replica, 쓰기와 쓰기 이후 읽기는 primary
+SessionLocal = sessionmaker(class_=RoutingSession, primary=engine, replica=replica_engine)
+
+# Async DB 세션 팩토리
+# : commit 이후 속성 접근 시 암묵적 I/O(lazy refresh)가 일어나지 않도록 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(
+    sync_session_class=RoutingSession,
+    primary=async_engine.sync_engine,
+    replica=async_replica_engine.sync_engine if async_replica_engine else None,
+    expire_on_commit=False,
+)
+
+# models.py의 각 Table 클래스가 상속하는 Base Class: Table로 인식
+Base = declarative_base()
 
-    Base.metadata.create_all(bind=engine)
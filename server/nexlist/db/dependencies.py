@@ -1,4 +1,6 @@
-from .database import SessionLocal
+from nexlist.config import settings
+
+from .database import AsyncSessionLocal, SessionLocal
 
 
 def get_db():
@@ -7,3 +9,12 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:  # Async Session Factory
+        yield db
+
+
+# Settings.DB_ASYNC에 따라 사용할 세션 의존성 선택
+get_session = get_async_db if settings.DB_ASYNC else get_db
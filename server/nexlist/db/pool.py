@@ -0,0 +1,26 @@
+import time
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from nexlist.metrics import DB_POOL_CHECKOUT_DURATION
+
+
+class CheckoutTimerMixin:
+    """ 풀에서 커넥션을 얻기까지 걸린 시간(대기 + 신규 연결)을 기록
+    : 엔진 이름은 create_engine(pool_logging_name=...) 값을 사용 (dispose/recreate 후에도 유지)
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_DURATION.labels(getattr(self, "logging_name", None) or "default").observe(time.perf_counter() - started)
+
+
+class TimedQueuePool(CheckoutTimerMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(CheckoutTimerMixin, AsyncAdaptedQueuePool):
+    pass
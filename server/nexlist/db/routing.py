@@ -0,0 +1,33 @@
+# 읽기/쓰기 엔진 라우팅
+# : 읽기 전용 쿼리는 replica로, 쓰기(flush, DML, SELECT ... FOR UPDATE)는 primary로 보내고
+#   같은 세션(= 같은 요청)에서 한 번 쓰기가 일어나면 이후 읽기도 primary에 고정 (read-your-writes)
+
+from sqlalchemy import Engine, Select
+from sqlalchemy.orm import Session
+
+
+class RoutingSession(Session):
+    def __init__(self, primary: Engine, replica: Engine | None = None, **kwargs):
+        super().__init__(**kwargs)
+        self.primary = primary
+        self.replica = replica
+        self.sticky_primary = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.replica is None or self.sticky_primary:
+            return self.primary
+        if self._flushing or not is_read_only(clause):
+            self.sticky_primary = True
+            return self.primary
+        return self.replica
+
+
+def is_read_only(clause) -> bool:
+    return isinstance(clause, Select) and clause._for_update_arg is None
+
+
+def use_primary(db) -> None:
+    """ 이후의 읽기를 primary로 고정 (조회 결과로 쓰기 여부를 결정하는 경로에서 replica 지연으로 인한 오판 방지) """
+    session = getattr(db, "sync_session", db)  # AsyncSession -> Session
+    if isinstance(session, RoutingSession):
+        session.sticky_primary = True
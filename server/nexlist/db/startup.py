@@ -0,0 +1,171 @@
+import logging
+from functools import cache
+from pathlib import Path
+
+from sqlalchemy import Connection, Engine, QueuePool, inspect, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.concurrency import run_in_threadpool
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+
+logger = logging.getLogger(__name__)
+
+# server/alembic.ini (컨테이너에서는 /app/alembic.ini)
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
+class SchemaMismatchError(Exception):
+    def __init__(self, current: str | None, head: str | None):
+        self.current = current
+        self.head = head
+        super().__init__(f"schema revision {current} != alembic head {head} (run `alembic upgrade head`)")
+
+
+class UnversionedSchemaError(Exception):
+    """ alembic revision 없이 테이블만 있는 DB (import 시점 create_all로 만들어진 DB 등) """
+
+    def __init__(self, tables: list[str]):
+        self.tables = tables
+        super().__init__(
+            f"database has tables ({', '.join(tables)}) but no alembic revision: "
+            "run `alembic stamp <revision matching the schema>` (0b3dd18fadaf for a create_all schema) "
+            "and then `alembic upgrade head`"
+        )
+
+
+def alembic_config() -> Config:
+    # script_location은 alembic.ini의 %(here)s 기준이라 작업 디렉터리와 무관
+    return Config(str(ALEMBIC_INI))
+
+
+@cache
+def get_head_revision() -> str | None:
+    """ alembic/versions 스크립트 기준 head revision """
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def get_current_revision(connection: Connection) -> str | None:
+    """ DB alembic_version 테이블에 기록된 revision """
+    return MigrationContext.configure(connection).get_current_revision()
+
+
+async def run_with_connection(engine: Engine | AsyncEngine, fn):
+    """ 동기 함수 fn(connection)을 엔진 종류에 맞게 실행 (이벤트 루프를 막지 않음) """
+    if isinstance(engine, AsyncEngine):
+        async with engine.connect() as connection:
+            return await connection.run_sync(fn)
+
+    def run():
+        with engine.connect() as connection:
+            return fn(connection)
+
+    return await run_in_threadpool(run)
+
+
+async def verify_schema_revision(engine: Engine | AsyncEngine) -> str:
+    """ create_all 대신 DB revision이 alembic head와 같은지만 확인 """
+    current = await run_with_connection(engine, get_current_revision)
+    head = get_head_revision()
+    if current != head:
+        raise SchemaMismatchError(current, head)
+    return current
+
+
+async def ping(engine: Engine | AsyncEngine) -> None:
+    await run_with_connection(engine, lambda connection: connection.execute(text("SELECT 1")))
+
+
+async def prewarm_pool(engine: Engine | AsyncEngine, size: int) -> int:
+    """
+    커넥션 size개를 동시에 체크아웃했다가 반납해 풀을 미리 채움
+    : 첫 요청들이 TCP/TLS 연결 + 인증 비용을 치르지 않도록 함
+    """
+    pool = engine.pool
+    if isinstance(pool, QueuePool):
+        # pool_size를 넘는 overflow 커넥션은 반납 시 닫히므로 미리 열어둘 의미가 없음
+        size = min(size, pool.size())
+    if size <= 0:
+        return 0
+
+    if isinstance(engine, AsyncEngine):
+        connections = []
+        try:
+            for _ in range(size):
+                connections.append(await engine.connect())
+        finally:
+            for connection in connections:
+                await connection.close()
+        return len(connections)
+
+    def warm():
+        connections = []
+        try:
+            for _ in range(size):
+                connections.append(engine.connect())
+        finally:
+            for connection in connections:
+                connection.close()
+        return len(connections)
+
+    return await run_in_threadpool(warm)
+
+
+async def create_tables_and_stamp(engine: Engine | AsyncEngine, metadata) -> None:
+    """
+    개발용: 빈 DB에 테이블을 만들고 alembic head로 stamp
+    : revision이 있는 DB는 건드리지 않음 (verify_schema_revision이 확인)
+    : revision 없이 테이블이 있는 DB는 UnversionedSchemaError
+      (create_all은 기존 테이블에 컬럼을 추가하지 않으므로 head로 stamp하면 이후 마이그레이션의 컬럼이 빠진 채로 남음)
+    """
+    head = get_head_revision()
+
+    def create(connection: Connection):
+        context = MigrationContext.configure(connection)
+        if context.get_current_revision() is not None:
+            return
+        tables = sorted(set(inspect(connection).get_table_names()) - {"alembic_version"})
+        if tables:
+            raise UnversionedSchemaError(tables)
+        metadata.create_all(bind=connection)
+        context.stamp(ScriptDirectory.from_config(alembic_config()), head)
+        connection.commit()
+
+    await run_with_connection(engine, create)
+
+
+class Readiness:
+    """
+    /readyz 상태
+    : 시작 시 schema 검증에 실패해도 프로세스를 죽이지 않고 not ready로 남겨두었다가,
+      readiness probe가 올 때마다 재검증
+    """
+
+    def __init__(self, engine: Engine | AsyncEngine, check_schema: bool = True):
+        self.engine = engine
+        self.check_schema = check_schema
+        self.ready = False
+        self.detail = "starting"
+
+    async def check(self) -> bool:
+        try:
+            if self.ready or not self.check_schema:
+                await ping(self.engine)
+            else:
+                await verify_schema_revision(self.engine)
+        except SchemaMismatchError as e:
+            self._fail(str(e))
+        except (SQLAlchemyError, OSError) as e:
+            self._fail(f"database unavailable: {e.__class__.__name__}")
+        else:
+            self.ready = True
+            self.detail = "ok"
+        return self.ready
+
+    def _fail(self, detail: str) -> None:
+        if self.ready or self.detail != detail:
+            logger.warning("not ready: %s", detail)
+        self.ready = False
+        self.detail = detail
@@ -0,0 +1,23 @@
+import inspect
+
+from starlette.concurrency import run_in_threadpool
+
+
+class ThreadPoolRepository:
+    """ 동기 Repository의 메서드를 스레드풀에서 실행하는 awaitable로 감싸는 어댑터
+    : 서비스 계층이 동기/비동기 Repository를 같은 방식(await)으로 호출할 수 있도록 함
+    """
+
+    def __init__(self, repository):
+        self._repository = repository
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._repository, name)
+        # 제너레이터는 호출 시점에 I/O가 없으므로 그대로 반환 (순회는 StreamingResponse가 스레드풀에서 수행)
+        if not callable(attr) or inspect.isgeneratorfunction(attr):
+            return attr
+
+        async def call(*args, **kwargs):
+            return await run_in_threadpool(attr, *args, **kwargs)
+
+        return call
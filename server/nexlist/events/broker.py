@@ -0,0 +1,119 @@
+# 사용자별 변경 알림 브로커
+# : TodoService / MemoService가 커밋된 쓰기 이후(_changed) publish하고, GET /events/ (SSE) 구독자에게 전달
+# : 이벤트는 "scope의 데이터가 바뀌었다(+ 새 ETag)"만 알리므로 느린 구독자에게는 scope별 최신 이벤트만 남김
+# : 백엔드는 교체 가능 (기본: 프로세스 메모리). 여러 워커에 걸치려면 pub/sub 백엔드를 구현해서 등록
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from nexlist.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeEvent:
+    scope: str  # "todos" | "memo"
+    etag: str
+
+
+class Subscription:
+    """ 구독자 하나: 대기 이벤트를 scope별로 하나만 보관 (idle 연결당 메모리를 작게 유지) """
+
+    __slots__ = ("user_id", "_pending", "_ready")
+
+    def __init__(self, user_id: int):
+        self.user_id = user_id
+        self._pending: dict[str, ChangeEvent] = {}
+        self._ready = asyncio.Event()
+
+    def deliver(self, event: ChangeEvent) -> None:
+        self._pending[event.scope] = event
+        self._ready.set()
+
+    async def next_events(self, timeout: float | None = None) -> list[ChangeEvent]:
+        """ 이벤트가 올 때까지 대기, timeout이면 빈 목록 (keep-alive 전송용) """
+        if not self._pending:
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except TimeoutError:
+                return []
+        events = list(self._pending.values())
+        self._pending.clear()
+        self._ready.clear()
+        return events
+
+
+class BrokerBackend:
+    """ 브로커 백엔드 인터페이스: publish는 쓰기 경로를 막지 않도록 동기 호출 (원격 I/O는 백엔드가 비동기로 처리) """
+
+    def publish(self, user_id: int, event: ChangeEvent) -> None:
+        raise NotImplementedError
+
+    def add(self, subscription: Subscription) -> None:
+        raise NotImplementedError
+
+    def remove(self, subscription: Subscription) -> None:
+        raise NotImplementedError
+
+    def subscriber_count(self) -> int:
+        raise NotImplementedError
+
+
+class InMemoryBackend(BrokerBackend):
+    """ 단일 프로세스 백엔드: user_id -> 구독자 집합 """
+
+    def __init__(self):
+        self._subscriptions: dict[int, set[Subscription]] = {}
+
+    def publish(self, user_id: int, event: ChangeEvent) -> None:
+        for subscription in self._subscriptions.get(user_id, ()):
+            subscription.deliver(event)
+
+    def add(self, subscription: Subscription) -> None:
+        self._subscriptions.setdefault(subscription.user_id, set()).add(subscription)
+
+    def remove(self, subscription: Subscription) -> None:
+        subscriptions = self._subscriptions.get(subscription.user_id)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscriptions[subscription.user_id]
+
+    def subscriber_count(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+
+# Settings.EVENTS_BACKEND 값 -> 백엔드 클래스
+BACKENDS: dict[str, type[BrokerBackend]] = {"memory": InMemoryBackend}
+
+
+class EventBroker:
+    def __init__(self, backend: BrokerBackend):
+        self.backend = backend
+
+    def publish(self, user_id: int, scope: str, etag: str) -> None:
+        # 알림 실패가 이미 커밋된 쓰기 요청을 실패시키지 않도록 함
+        try:
+            self.backend.publish(user_id, ChangeEvent(scope, etag))
+        except Exception:
+            logger.exception("failed to publish %s change for user %s", scope, user_id)
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: int) -> AsyncIterator[Subscription]:
+        subscription = Subscription(user_id)
+        self.backend.add(subscription)
+        try:
+            yield subscription
+        finally:
+            self.backend.remove(subscription)
+
+    def subscriber_count(self) -> int:
+        return self.backend.subscriber_count()
+
+
+broker = EventBroker(BACKENDS[settings.EVENTS_BACKEND]())
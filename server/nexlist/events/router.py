@@ -0,0 +1,49 @@
+import json
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+
+from nexlist.auth.dependencies import get_current_user
+from nexlist.auth.models import User
+from nexlist.cache.versions import versions
+from nexlist.config import settings
+from nexlist.memo.service import MEMO_SCOPE
+from nexlist.todos.service import TODOS_SCOPE
+
+from .broker import ChangeEvent, broker
+
+router = APIRouter(prefix="/events", tags=["Events"])
+
+# 변경 알림을 보내는 scope
+SCOPES = (TODOS_SCOPE, MEMO_SCOPE)
+
+
+def to_sse(event: ChangeEvent) -> str:
+    return f"event: {event.scope}\ndata: {json.dumps({'scope': event.scope, 'etag': event.etag})}\n\n"
+
+
+async def change_stream(user_id: int):
+    async with broker.subscribe(user_id) as subscription:
+        # 연결(재연결) 직후 현재 ETag 전송: 클라이언트가 가진 ETag와 다르면 그 사이 놓친 변경이 있는 것
+        yield f"retry: {settings.EVENTS_RETRY_MILLISECONDS}\n\n"
+        for scope in SCOPES:
+            yield to_sse(ChangeEvent(scope, versions.etag(scope, user_id)))
+
+        while True:
+            events = await subscription.next_events(timeout=settings.EVENTS_KEEPALIVE_SECONDS)
+            if not events:
+                # 프록시 / 로드밸런서의 idle timeout으로 연결이 끊기지 않도록 주석 전송
+                yield ": keep-alive\n\n"
+            for event in events:
+                yield to_sse(event)
+
+
+# 사용자별 변경 알림 (Server-Sent Events)
+# : 다른 탭 / 기기에서 todo나 메모를 바꾸면 event: todos | memo 와 새 ETag를 전송
+@router.get("/")
+async def subscribe_changes(user: User = Depends(get_current_user)) -> StreamingResponse:
+    return StreamingResponse(
+        change_stream(user.id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Request, Response, status
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/healthz", include_in_schema=False)
+async def healthz():
+    """ liveness: 프로세스가 요청을 처리할 수 있으면 200 (DB 상태와 무관) """
+    return {"status": "ok"}
+
+
+@router.get("/readyz", include_in_schema=False)
+async def readyz(request: Request, response: Response):
+    """ readiness: lifespan 시작이 끝났고 DB schema/연결이 정상이면 200, 아니면 503 """
+    readiness = getattr(request.app.state, "readiness", None)
+    if readiness is None:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "starting"}
+
+    if not await readiness.check():
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return {"status": readiness.detail}
@@ -0,0 +1,234 @@
+# 메모 자동 저장 write-behind 버퍼
+# : 타이핑 중 연속으로 들어오는 PUT /memo/ 는 마지막 값만 의미가 있으므로,
+#   사용자별 최신 내용만 메모리에 보관하고 즉시 saved_at으로 응답한 뒤
+#   주기적으로(또는 종료 시) 모아서 한 번에 DB에 기록
+# : 버퍼는 프로세스 메모리에 있으므로 단일 프로세스(또는 사용자별 sticky 라우팅) 배포 기준
+#
+# 내구성 (Settings.MEMO_WRITE_BEHIND_JOURNAL)
+# - 비어 있으면: 정상 종료 시에는 flush, 프로세스가 비정상 종료되면 마지막 flush 이후 값 유실
+# - 경로 지정 시: 응답 전에 journal 파일에 append (+ fsync), 시작 시 replay 후 flush
+
+import asyncio
+import json
+import logging
+import os
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
+from pathlib import Path
+
+from starlette.concurrency import run_in_threadpool
+
+from nexlist.config import settings
+from nexlist.metrics import MEMO_WRITES, MEMO_WRITES_PENDING
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PendingMemo:
+    user_id: int
+    content: str
+    saved_at: date
+
+
+# 버퍼 내용을 DB에 기록하는 함수 (MemoRepository.save_memos)
+MemoWriter = Callable[[list[PendingMemo]], Awaitable[object]]
+
+
+class MemoWriteBuffer:
+    def __init__(
+        self,
+        flush_interval: float = 2.0,
+        max_pending: int = 10000,
+        journal_path: str | Path | None = None,
+        fsync: bool = True,
+    ):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.journal_path = Path(journal_path) if journal_path else None
+        self.fsync = fsync
+        self._pending: dict[int, PendingMemo] = {}
+        # 기록 중인 batch: 커밋 전까지 DB에는 이전 내용이 있으므로 get에서 계속 보이게 함
+        self._inflight: dict[int, PendingMemo] = {}
+        # flush / flush_user의 DB 기록을 한 번에 하나씩 (나중 값이 먼저 커밋된 뒤 이전 batch가 덮어쓰지 않도록)
+        self._flush_lock = asyncio.Lock()
+        # memos 행이 있는 것으로 확인된 사용자 (메모는 생성 후 삭제되지 않음)
+        self._known_users: set[int] = set()
+        self._journal_lock = asyncio.Lock()
+        self._writer: MemoWriter | None = None
+        self._task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def get(self, user_id: int) -> PendingMemo | None:
+        return self._pending.get(user_id) or self._inflight.get(user_id)
+
+    def knows(self, user_id: int) -> bool:
+        return user_id in self._known_users
+
+    def remember(self, user_id: int) -> None:
+        self._known_users.add(user_id)
+
+    async def put(self, user_id: int, content: str) -> PendingMemo:
+        entry = PendingMemo(user_id=user_id, content=content, saved_at=datetime.now().date())
+        if self.journal_path:
+            # journal 기록과 버퍼 반영 사이에 compaction이 끼어들면 기록한 줄이 지워지므로 같은 잠금 안에서
+            async with self._journal_lock:
+                await run_in_threadpool(self._write_journal, json.dumps(asdict(entry), default=str) + "\n", "a")
+                self._buffer(entry)
+        else:
+            self._buffer(entry)
+
+        # 백프레셔: 대기 중인 사용자가 너무 많으면 주기를 기다리지 않고 flush
+        if len(self._pending) >= self.max_pending and self._writer is not None:
+            await self.flush()
+        return entry
+
+    def _buffer(self, entry: PendingMemo) -> None:
+        MEMO_WRITES.labels("buffered").inc()
+        if entry.user_id in self._pending:
+            MEMO_WRITES.labels("coalesced").inc()
+        self._pending[entry.user_id] = entry
+        MEMO_WRITES_PENDING.set(len(self._pending))
+
+    async def flush(self, writer: MemoWriter | None = None) -> int:
+        """ 대기 중인 값을 모두 기록, 실패하면 (그 사이 새 값이 없는 사용자만) 다시 버퍼에 넣고 예외 전파 """
+        writer = writer or self._writer
+        if not self._pending or writer is None:
+            return 0
+
+        async with self._flush_lock:
+            batch, self._pending = self._pending, {}
+            self._inflight = batch
+            try:
+                await writer(list(batch.values()))
+            except Exception:
+                self._restore(batch)
+                raise
+            finally:
+                self._inflight = {}
+
+        MEMO_WRITES.labels("flushed").inc(len(batch))
+        MEMO_WRITES_PENDING.set(len(self._pending))
+        if self.journal_path:
+            await self._compact_journal()
+        return len(batch)
+
+    async def flush_user(self, user_id: int, writer: MemoWriter) -> bool:
+        """
+        한 사용자의 대기 값만 기록 (조회/PATCH 전에 read-your-writes 보장)
+        : 진행 중인 flush가 있으면 먼저 끝나기를 기다림 (그 batch에 이 사용자의 값이 있을 수 있음)
+        """
+        async with self._flush_lock:
+            entry = self._pending.pop(user_id, None)
+            if entry is None:
+                return False
+            try:
+                await writer([entry])
+            except Exception:
+                self._restore({user_id: entry})
+                raise
+
+        MEMO_WRITES.labels("flushed").inc()
+        MEMO_WRITES_PENDING.set(len(self._pending))
+        if self.journal_path:
+            # 대기 값만 남도록 다시 씀 (기록 중에 들어온 같은 사용자의 새 값은 _pending에 있으므로 유지)
+            await self._compact_journal()
+        return True
+
+    def _restore(self, batch: dict[int, PendingMemo]) -> None:
+        MEMO_WRITES.labels("failed").inc(len(batch))
+        for user_id, entry in batch.items():
+            self._pending.setdefault(user_id, entry)
+        MEMO_WRITES_PENDING.set(len(self._pending))
+
+    # 백그라운드 flush (lifespan에서 시작/종료)
+    async def start(self, writer: MemoWriter) -> None:
+        self._writer = writer
+        if self.journal_path:
+            self._pending.update(await run_in_threadpool(self._read_journal))
+            MEMO_WRITES_PENDING.set(len(self._pending))
+            if self._pending:
+                logger.info("replaying %d memo writes from %s", len(self._pending), self.journal_path)
+                await self._flush_logged()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._flush_logged()
+        if self._pending:
+            logger.error("%d memo writes could not be flushed on shutdown", len(self._pending))
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self._flush_logged()
+
+    async def _flush_logged(self) -> None:
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("memo write-behind flush failed (%d pending)", len(self._pending))
+
+    def clear(self) -> None:
+        self._pending.clear()
+        self._known_users.clear()
+        MEMO_WRITES_PENDING.set(0)
+
+    # journal: 한 줄에 하나씩 JSON (append-only, flush 후 대기 값만 남도록 다시 씀)
+    async def _compact_journal(self) -> None:
+        async with self._journal_lock:
+            lines = "".join(json.dumps(asdict(entry), default=str) + "\n" for entry in self._pending.values())
+            await run_in_threadpool(self._write_journal, lines, "w")
+
+    def _write_journal(self, lines: str, mode: str) -> None:
+        if mode == "a":
+            target = self.journal_path
+        else:
+            # 전체 재작성은 임시 파일에 쓴 뒤 교체 (중간에 죽어도 이전 journal 유지)
+            target = self.journal_path.with_suffix(self.journal_path.suffix + ".tmp")
+        with open(target, mode, encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        if target != self.journal_path:
+            os.replace(target, self.journal_path)
+
+    def _read_journal(self) -> dict[int, PendingMemo]:
+        pending: dict[int, PendingMemo] = {}
+        if not self.journal_path.exists():
+            return pending
+        with open(self.journal_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 기록 도중 종료된 마지막 줄
+                    continue
+                # 이전 버전이 flush_user 후 남기던 표시
+                if record.get("flushed"):
+                    pending.pop(record["user_id"], None)
+                    continue
+                pending[record["user_id"]] = PendingMemo(
+                    user_id=record["user_id"],
+                    content=record["content"],
+                    saved_at=date.fromisoformat(record["saved_at"]),
+                )
+        return pending
+
+
+memo_write_buffer = MemoWriteBuffer(
+    flush_interval=settings.MEMO_FLUSH_INTERVAL_SECONDS,
+    max_pending=settings.MEMO_WRITE_BEHIND_MAX_PENDING,
+    journal_path=settings.MEMO_WRITE_BEHIND_JOURNAL or None,
+    fsync=settings.MEMO_WRITE_BEHIND_FSYNC,
+)
@@ -1,12 +1,41 @@
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from nexlist.db.dependencies import get_db
+from nexlist.config import settings
+from nexlist.db.database import AsyncSessionLocal, SessionLocal
+from nexlist.db.dependencies import get_async_db, get_db
+from nexlist.db.threadpool import ThreadPoolRepository
 
-from .repository import MemoRepository
+from .buffer import PendingMemo, memo_write_buffer
+from .repository import AsyncMemoRepository, MemoRepository
 from .service import MemoService
 
 
-def get_memo_service(db: Session = Depends(get_db)) -> MemoService:
+def get_memo_write_buffer():
+    return memo_write_buffer if settings.MEMO_WRITE_BEHIND else None
+
+
+def get_sync_memo_service(db: Session = Depends(get_db), buffer = Depends(get_memo_write_buffer)) -> MemoService:
     repo = MemoRepository(db)
-    return MemoService(repository = repo)
+    return MemoService(repository = ThreadPoolRepository(repo), buffer = buffer)
+
+
+def get_async_memo_service(db: AsyncSession = Depends(get_async_db), buffer = Depends(get_memo_write_buffer)) -> MemoService:
+    repo = AsyncMemoRepository(db)
+    return MemoService(repository = repo, buffer = buffer)
+
+
+# write-behind 버퍼의 주기적 flush: 요청 밖에서 실행되므로 세션을 직접 생성
+async def save_pending_memos(memos: list[PendingMemo]) -> None:
+    if settings.DB_ASYNC:
+        async with AsyncSessionLocal() as db:
+            await AsyncMemoRepository(db).save_memos(memos)
+        return
+
+    with SessionLocal() as db:
+        await ThreadPoolRepository(MemoRepository(db)).save_memos(memos)
+
+
+# Settings.DB_ASYNC에 따라 라우터가 사용할 서비스 의존성 선택
+get_memo_service = get_async_memo_service if settings.DB_ASYNC else get_sync_memo_service
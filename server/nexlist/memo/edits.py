@@ -0,0 +1,19 @@
+from collections.abc import Iterable
+
+from .schemas import MemoEdit
+
+
+class InvalidEditError(ValueError):
+    pass
+
+
+def apply_edits(content: str, edits: Iterable[MemoEdit]) -> str:
+    """
+    편집을 순서대로 적용
+    : 각 편집의 pos는 직전 편집까지 반영된 텍스트 기준
+    """
+    for i, edit in enumerate(edits):
+        if edit.pos + edit.delete > len(content):
+            raise InvalidEditError(f"ops[{i}] is out of range (length {len(content)})")
+        content = content[:edit.pos] + edit.insert + content[edit.pos + edit.delete:]
+    return content
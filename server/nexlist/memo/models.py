@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Date, ForeignKey, Integer, String
+from sqlalchemy import Column, Date, ForeignKey, Integer, Text
+from sqlalchemy.dialects.mysql import MEDIUMTEXT
 
 from nexlist.db.database import Base
 
@@ -6,5 +7,8 @@ from nexlist.db.database import Base
 class Memo(Base):
     __tablename__ = "memos"
     user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), primary_key=True)
-    content = Column(String(8192))
+    # 길이 제한은 Settings.MEMO_MAX_LENGTH로 검증 (MySQL TEXT는 64KB라 MEDIUMTEXT 사용)
+    content = Column(Text().with_variant(MEDIUMTEXT(), "mysql"))
     saved_at = Column(Date)
+    # 내용이 바뀔 때마다 1씩 증가: PATCH /memo/ 의 base_version과 비교
+    version = Column(Integer, nullable=False, default=0, server_default="0")
@@ -1,10 +1,14 @@
 from abc import abstractmethod
 from datetime import datetime
 
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from nexlist.auth.models import User
+from nexlist.db.routing import use_primary
 
+from .buffer import PendingMemo
 from .models import Memo
 from .schemas import MemoContent, MemoUpdatedResponse
 
@@ -22,6 +26,35 @@ class MemoRepositoryInterface:
     def update_memo_by_id(self, memo_id: int, user: User) -> MemoUpdatedResponse:
         pass
 
+    @abstractmethod
+    def update_memo_if_version(self, content: str, base_version: int, user: User) -> MemoUpdatedResponse | None:
+        pass
+
+    @abstractmethod
+    def save_memos(self, memos: list[PendingMemo]) -> None:
+        pass
+
+
+# 내용 변경 UPDATE: version을 DB에서 원자적으로 1 증가
+def memo_update_statement(user: User, content: str, saved_at):
+    return (
+        update(Memo)
+        .where(Memo.user_id == user.id)
+        .values(content=content, saved_at=saved_at, version=Memo.version + 1)
+    )
+
+
+# write-behind 버퍼 flush: 사용자별 UPDATE를 executemany 한 번으로 실행
+MEMO_BULK_UPDATE = (
+    update(Memo.__table__)
+    .where(Memo.__table__.c.user_id == bindparam("b_user_id"))
+    .values(content=bindparam("b_content"), saved_at=bindparam("b_saved_at"), version=Memo.__table__.c.version + 1)
+)
+
+
+def memo_bulk_params(memos: list[PendingMemo]) -> list[dict]:
+    return [{"b_user_id": memo.user_id, "b_content": memo.content, "b_saved_at": memo.saved_at} for memo in memos]
+
 
 class MemoRepository(MemoRepositoryInterface):
     def __init__(self, db: Session):
@@ -44,13 +77,91 @@ class MemoRepository(MemoRepositoryInterface):
     def get_memo(self, user: User) -> Memo:
         return self.db.query(Memo).filter_by(user_id=user.id).first()
 
-    # UPDATE: memo content
+    # READ: 편집 기준 version 확인용 (replica 지연으로 인한 잘못된 충돌 방지)
+    def get_memo_from_primary(self, user: User) -> Memo:
+        use_primary(self.db)
+        return self.get_memo(user)
+
+    # UPDATE: memo content (전체 교체)
+    # : 행 전체를 SELECT하지 않고 UPDATE 후 같은 트랜잭션에서 새 version만 조회
     def update_memo(self, change: MemoContent, user: User) -> MemoUpdatedResponse:
-        memo = self.get_memo(user)
-        if not memo:
+        current_date = datetime.now().date()
+        result = self.db.execute(memo_update_statement(user, change.content, current_date))
+        if not result.rowcount:
+            self.db.rollback()
             return None
-        memo.content = change.content
+        version = self.db.scalar(select(Memo.version).filter_by(user_id=user.id))
+        self.db.commit()
+        return MemoUpdatedResponse(saved_at=current_date, version=version)
+
+    # UPDATE: base_version이 현재 version과 같을 때만 교체 (PATCH)
+    # : 다른 요청이 먼저 바꿨다면 0 rows -> None
+    def update_memo_if_version(self, content: str, base_version: int, user: User) -> MemoUpdatedResponse | None:
         current_date = datetime.now().date()
-        memo.saved_at = current_date
+        statement = memo_update_statement(user, content, current_date).where(Memo.version == base_version)
+        result = self.db.execute(statement)
         self.db.commit()
-        return MemoUpdatedResponse(saved_at=current_date)
+        if not result.rowcount:
+            return None
+        return MemoUpdatedResponse(saved_at=current_date, version=base_version + 1)
+
+    # UPDATE: write-behind 버퍼에 모인 메모들을 한 트랜잭션으로 기록
+    def save_memos(self, memos: list[PendingMemo]) -> None:
+        use_primary(self.db)
+        self.db.execute(MEMO_BULK_UPDATE, memo_bulk_params(memos))
+        self.db.commit()
+
+
+class AsyncMemoRepository(MemoRepositoryInterface):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    # CREATE: Memo -> 처음 한 번 생성 후 삭제 X
+    async def create_memo(self, content: MemoContent, user: User) -> Memo:
+        existing_memo = await self.get_memo(user)
+        if existing_memo:
+            return None
+        new_memo = Memo(**content.model_dump())
+        new_memo.user_id = user.id
+        new_memo.saved_at = None  # 처음 메모를 생성할 경우에만
+        self.db.add(new_memo)
+        await self.db.commit()
+        await self.db.refresh(new_memo)
+        return new_memo
+
+    # READ: single memo
+    async def get_memo(self, user: User) -> Memo:
+        result = await self.db.execute(select(Memo).filter_by(user_id=user.id))
+        return result.scalars().first()
+
+    # READ: 편집 기준 version 확인용 (replica 지연으로 인한 잘못된 충돌 방지)
+    async def get_memo_from_primary(self, user: User) -> Memo:
+        use_primary(self.db)
+        return await self.get_memo(user)
+
+    # UPDATE: memo content (전체 교체)
+    async def update_memo(self, change: MemoContent, user: User) -> MemoUpdatedResponse:
+        current_date = datetime.now().date()
+        result = await self.db.execute(memo_update_statement(user, change.content, current_date))
+        if not result.rowcount:
+            await self.db.rollback()
+            return None
+        version = await self.db.scalar(select(Memo.version).filter_by(user_id=user.id))
+        await self.db.commit()
+        return MemoUpdatedResponse(saved_at=current_date, version=version)
+
+    # UPDATE: base_version이 현재 version과 같을 때만 교체 (PATCH)
+    async def update_memo_if_version(self, content: str, base_version: int, user: User) -> MemoUpdatedResponse | None:
+        current_date = datetime.now().date()
+        statement = memo_update_statement(user, content, current_date).where(Memo.version == base_version)
+        result = await self.db.execute(statement)
+        await self.db.commit()
+        if not result.rowcount:
+            return None
+        return MemoUpdatedResponse(saved_at=current_date, version=base_version + 1)
+
+    # UPDATE: write-behind 버퍼에 모인 메모들을 한 트랜잭션으로 기록
+    async def save_memos(self, memos: list[PendingMemo]) -> None:
+        use_primary(self.db)
+        await self.db.execute(MEMO_BULK_UPDATE, memo_bulk_params(memos))
+        await self.db.commit()
@@ -1,11 +1,12 @@
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
 
 from nexlist.auth.dependencies import get_current_user
 from nexlist.auth.models import User
+from nexlist.cache.versions import etag_matches
 
 from .dependencies import get_memo_service
-from .schemas import MemoContent, MemoResponse, MemoUpdatedResponse
+from .schemas import MemoContent, MemoPatch, MemoResponse, MemoUpdatedResponse
 from .service import MemoService
 
 router = APIRouter(prefix="/memo", tags=["Memo"])
@@ -16,32 +17,55 @@ router = APIRouter(prefix="/memo", tags=["Memo"])
     response_model=MemoResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def create_memo(
+async def create_memo(
     content: MemoContent,
     user: User = Depends(get_current_user),
     service: MemoService = Depends(get_memo_service)
 ) -> MemoResponse:
-    return service.create_memo(content, user)
+    return await service.create_memo(content, user)
 
 
 @router.get(
     "/",
     status_code=status.HTTP_200_OK
 )
-def get_memo(
+async def get_memo(
+    request: Request,
+    response: Response,
     user: User = Depends(get_current_user),
     service: MemoService = Depends(get_memo_service)
 ):
-    return service.get_memo(user)
+    # 조건부 GET: 메모가 바뀌지 않았으면 memos 테이블을 조회하지 않고 304
+    etag = service.get_etag(user)
+    cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("If-None-Match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    memo = await service.get_memo(user)
+    response.headers.update(cache_headers)
+    return memo
 
 
 @router.put(
     "/",
     status_code=status.HTTP_200_OK
 )
-def update_memo(
+async def update_memo(
     memo: MemoContent,
     user:User = Depends(get_current_user),
     service: MemoService = Depends(get_memo_service)
 ) -> MemoUpdatedResponse:
-    return service.update_memo(memo, user)
+    return await service.update_memo(memo, user)
+
+
+@router.patch(
+    "/",
+    status_code=status.HTTP_200_OK
+)
+async def patch_memo(
+    patch: MemoPatch,
+    user: User = Depends(get_current_user),
+    service: MemoService = Depends(get_memo_service)
+) -> MemoUpdatedResponse:
+    """ 자동 저장: 전체 내용 대신 base_version 기준 편집 연산만 전송 """
+    return await service.patch_memo(patch, user)
@@ -1,16 +1,34 @@
 from datetime import date
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from nexlist.config import settings
 
 
 # PUT request
 class MemoContent(BaseModel):
-    content: str
+    content: str = Field(max_length=settings.MEMO_MAX_LENGTH)
+
+
+# PATCH request: 편집 하나 (pos 위치에서 delete 글자 삭제 후 insert 삽입)
+# : 위치/길이는 Unicode code point 단위
+class MemoEdit(BaseModel):
+    pos: int = Field(ge=0)
+    delete: int = Field(default=0, ge=0)
+    insert: str = Field(default="", max_length=settings.MEMO_MAX_LENGTH)
+
+
+# PATCH request: base_version 기준 편집 목록 (순서대로 적용)
+class MemoPatch(BaseModel):
+    base_version: int = Field(ge=0)
+    ops: list[MemoEdit] = Field(min_length=1, max_length=settings.MEMO_PATCH_MAX_OPS)
 
 
-# PUT response
+# PUT / PATCH response
+# : write-behind 버퍼에 저장된 경우 version은 아직 정해지지 않았으므로 None
 class MemoUpdatedResponse(BaseModel):
     saved_at: date = date.today
+    version: int | None = None
 
 
 
@@ -18,6 +36,7 @@ class MemoResponse(BaseModel):
     user_id: int
     content: str
     saved_at: date | None
+    version: int
 
     class Config:
         from_attributes = True
@@ -1,31 +1,100 @@
 from fastapi import HTTPException
 
 from nexlist.auth.models import User
+from nexlist.cache.versions import versions
+from nexlist.config import settings
+from nexlist.events.broker import broker
 
+from .buffer import MemoWriteBuffer
+from .edits import InvalidEditError, apply_edits
 from .models import Memo
 from .repository import MemoRepositoryInterface
-from .schemas import MemoContent, MemoUpdatedResponse
+from .schemas import MemoContent, MemoPatch, MemoUpdatedResponse
+
+# 버전 카운터(ETag) scope
+MEMO_SCOPE = "memo"
 
 
 class MemoService:
-    def __init__(self, repository: MemoRepositoryInterface):
+    def __init__(self, repository: MemoRepositoryInterface, buffer: MemoWriteBuffer | None = None):
         self.repository = repository
+        # Settings.MEMO_WRITE_BEHIND 일 때만 주입: PUT을 버퍼에 모아서 기록
+        self.buffer = buffer
+
+    # 메모 조회용 ETag: 조회 쿼리보다 먼저 읽어야 함
+    def get_etag(self, user: User) -> str:
+        return versions.etag(MEMO_SCOPE, user.id)
+
+    # 쓰기 이후 호출: 사용자의 메모 버전 증가
+    def _changed(self, user: User):
+        versions.bump(MEMO_SCOPE, user.id)
+        broker.publish(user.id, MEMO_SCOPE, versions.etag(MEMO_SCOPE, user.id))
 
-    def create_memo(self, content: MemoContent, user: User) -> Memo:
-        memo = self.repository.create_memo(content, user)
+    # 버퍼에 남은 이 사용자의 값을 먼저 기록: 이후 조회/PATCH가 DB 기준으로 동작
+    async def _flush_pending(self, user: User):
+        if self.buffer is not None:
+            await self.buffer.flush_user(user.id, self.repository.save_memos)
+
+    async def create_memo(self, content: MemoContent, user: User) -> Memo:
+        memo = await self.repository.create_memo(content, user)
         if memo is None:
             raise HTTPException(status_code=500, detail="Memo already exists")
+        self._changed(user)
         return memo
 
-    def get_memo(self, user: User) -> Memo:
-        memo = self.repository.get_memo(user)
+    async def get_memo(self, user: User) -> Memo:
+        await self._flush_pending(user)
+        # 최근에 쓰기가 있었다면 primary에서: replica 지연 중 읽은 내용에 최신 ETag가 붙지 않도록
+        if versions.changed_within(MEMO_SCOPE, user.id, settings.DB_REPLICA_STICKY_SECONDS):
+            memo = await self.repository.get_memo_from_primary(user)
+        else:
+            memo = await self.repository.get_memo(user)
         if memo is None:
             raise HTTPException(status_code=404, detail="Memo Not Found")
         return memo
 
 
-    def update_memo(self, content: MemoContent, user: User) -> MemoUpdatedResponse:
-        memo = self.repository.update_memo(content, user)
+    async def update_memo(self, content: MemoContent, user: User) -> MemoUpdatedResponse:
+        if self.buffer is not None:
+            return await self._buffer_memo(content, user)
+
+        memo = await self.repository.update_memo(content, user)
         if memo is None:
             raise HTTPException(status_code=404, detail="Memo Not Found")
+        self._changed(user)
         return memo
+
+    # write-behind: DB 쓰기 없이 버퍼에 최신 값만 남기고 바로 응답 (version은 flush 시 결정되므로 None)
+    async def _buffer_memo(self, content: MemoContent, user: User) -> MemoUpdatedResponse:
+        if not self.buffer.knows(user.id):
+            # 메모가 없는 사용자의 값은 flush 때 0 rows로 사라지므로 처음 한 번만 존재 확인
+            if await self.repository.get_memo(user) is None:
+                raise HTTPException(status_code=404, detail="Memo Not Found")
+            self.buffer.remember(user.id)
+
+        entry = await self.buffer.put(user.id, content.content)
+        self._changed(user)
+        return MemoUpdatedResponse(saved_at=entry.saved_at, version=None)
+
+    # 편집 연산을 서버에서 적용: 클라이언트가 본 버전(base_version)이 최신이 아니면 409
+    async def patch_memo(self, patch: MemoPatch, user: User) -> MemoUpdatedResponse:
+        await self._flush_pending(user)
+        memo = await self.repository.get_memo_from_primary(user)
+        if memo is None:
+            raise HTTPException(status_code=404, detail="Memo Not Found")
+        if memo.version != patch.base_version:
+            raise HTTPException(status_code=409, detail="Memo version conflict")
+
+        try:
+            content = apply_edits(memo.content or "", patch.ops)
+        except InvalidEditError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        if len(content) > settings.MEMO_MAX_LENGTH:
+            raise HTTPException(status_code=422, detail="Memo too long")
+
+        # 조회 이후 다른 요청이 먼저 저장했다면 조건부 UPDATE가 0 rows
+        result = await self.repository.update_memo_if_version(content, patch.base_version, user)
+        if result is None:
+            raise HTTPException(status_code=409, detail="Memo version conflict")
+        self._changed(user)
+        return result
@@ -0,0 +1,178 @@
+# Prometheus 메트릭
+# : HTTP 라우트별 latency / in-flight 는 prometheus-fastapi-instrumentator가 수집하고,
+#   여기서는 DB 쿼리, 커넥션 풀, Google OAuth 호출, 메모 write-behind, todo rollover 메트릭을 정의
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_fastapi_instrumentator.routing import get_route_name
+from sqlalchemy import Engine, event
+from starlette.requests import Request
+
+DB_QUERY_DURATION = Histogram(
+    "nexlist_db_query_duration_seconds",
+    "SQL statement execution time",
+    ["engine", "statement"],
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "nexlist_db_queries_per_request",
+    "Number of SQL statements executed while handling a request",
+    ["handler"],
+    buckets=(0, 1, 2, 3, 4, 5, 8, 13, 21, 50, 100),
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "nexlist_db_query_seconds_per_request",
+    "Total SQL execution time spent while handling a request",
+    ["handler"],
+)
+DB_POOL_CHECKOUT_DURATION = Histogram(
+    "nexlist_db_pool_checkout_seconds",
+    "Time spent obtaining a connection from the pool (queue wait + new connection)",
+    ["engine"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+GOOGLE_OAUTH_DURATION = Histogram(
+    "nexlist_google_oauth_request_duration_seconds",
+    "Outbound Google OAuth call latency",
+    ["call", "status"],
+)
+# outcome: buffered(DB 쓰기 없이 응답) / coalesced(아직 flush되지 않은 이전 값을 덮어씀)
+#          flushed(DB에 기록) / failed(flush 실패, 다음 주기에 재시도)
+MEMO_WRITES = Counter(
+    "nexlist_memo_writes",
+    "Memo writes handled by the write-behind buffer",
+    ["outcome"],
+)
+MEMO_WRITES_PENDING = Gauge(
+    "nexlist_memo_writes_pending",
+    "Memo writes waiting in the write-behind buffer",
+)
+
+# step: promote(마감일이 된 todo를 오늘 할 일로) / clear_done(완료한 todo를 오늘 할 일에서 내림)
+TODO_ROLLOVER_ROWS = Counter(
+    "nexlist_todo_rollover_rows",
+    "Todos updated by the daily today rollover",
+    ["step"],
+)
+TODO_ROLLOVER_CHUNK_DURATION = Histogram(
+    "nexlist_todo_rollover_chunk_duration_seconds",
+    "Duration of one rollover chunk transaction",
+)
+
+
+
+# 요청 하나에서 실행된 SQL 통계
+@dataclass
+class RequestDbStats:
+    queries: int = 0
+    seconds: float = 0.0
+
+
+# 스레드풀 / greenlet 으로 context가 복사되므로 값을 바꾸지 않고 객체를 공유해서 누적
+request_db_stats: ContextVar[RequestDbStats | None] = ContextVar("request_db_stats", default=None)
+
+
+def statement_type(statement: str) -> str:
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return keyword if keyword in {"SELECT", "INSERT", "UPDATE", "DELETE"} else "OTHER"
+
+
+class PoolCollector:
+    """ 스크레이프 시점에 등록된 엔진의 커넥션 풀 점유 상태를 수집 """
+
+    def __init__(self):
+        self.engines: dict[str, Engine] = {}
+
+    def collect(self):
+        checked_out = GaugeMetricFamily("nexlist_db_pool_checked_out", "Connections currently checked out", labels=["engine"])
+        size = GaugeMetricFamily("nexlist_db_pool_size", "Configured pool size", labels=["engine"])
+        overflow = GaugeMetricFamily("nexlist_db_pool_overflow", "Connections opened beyond pool_size", labels=["engine"])
+        for name, engine in self.engines.items():
+            pool = engine.pool
+            if not hasattr(pool, "checkedout"):
+                continue
+            checked_out.add_metric([name], pool.checkedout())
+            size.add_metric([name], pool.size())
+            overflow.add_metric([name], max(pool.overflow(), 0))
+        yield from (checked_out, size, overflow)
+
+
+pool_collector = PoolCollector()
+REGISTRY.register(pool_collector)
+
+
+class CacheCollector:
+    """ 등록된 캐시(stats()가 hits / misses / size를 반환)의 hit/miss 카운터를 수집 """
+
+    def __init__(self):
+        self.caches = {}
+
+    def collect(self):
+        hits = CounterMetricFamily("nexlist_cache_hits", "Cache hits", labels=["cache"])
+        misses = CounterMetricFamily("nexlist_cache_misses", "Cache misses", labels=["cache"])
+        size = GaugeMetricFamily("nexlist_cache_entries", "Entries currently cached", labels=["cache"])
+        for name, cache in self.caches.items():
+            stats = cache.stats()
+            hits.add_metric([name], stats["hits"])
+            misses.add_metric([name], stats["misses"])
+            # 외부 저장소(redis 등)는 항목 수를 알 수 없음
+            if stats["size"] is not None:
+                size.add_metric([name], stats["size"])
+        yield from (hits, misses, size)
+
+
+cache_collector = CacheCollector()
+REGISTRY.register(cache_collector)
+
+
+def register_cache(name: str, cache):
+    cache_collector.caches[name] = cache
+
+
+def instrument_engine(engine: Engine, name: str):
+    """ SQL 실행 시간/횟수 이벤트 등록 (AsyncEngine은 .sync_engine 전달) """
+    if pool_collector.engines.get(name) is engine:
+        return
+    pool_collector.engines[name] = engine
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("nexlist_query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["nexlist_query_started"].pop()
+        DB_QUERY_DURATION.labels(name, statement_type(statement)).observe(elapsed)
+        stats = request_db_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.seconds += elapsed
+
+
+def observe_google_call(call: str, started: float, status: int | str):
+    GOOGLE_OAUTH_DURATION.labels(call, str(status)).observe(time.perf_counter() - started)
+
+
+class DbStatsMiddleware:
+    """ 요청별 SQL 실행 횟수/시간을 라우트 템플릿 기준으로 기록하는 ASGI 미들웨어 """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestDbStats()
+        token = request_db_stats.set(stats)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_db_stats.reset(token)
+            handler = get_route_name(Request(scope)) or "none"
+            DB_QUERIES_PER_REQUEST.labels(handler).observe(stats.queries)
+            DB_TIME_PER_REQUEST.labels(handler).observe(stats.seconds)
@@ -0,0 +1,256 @@
+# Todo 목록 read-through 캐시
+# : GET /todos/ 전체 목록(cursor / limit 없음)의 JSON 응답 바이트를 (user_id, today 필터) 단위로 캐싱
+# : 키에 사용자별 세대(generation) 카운터를 포함하고, TodoService의 쓰기 메서드가 세대를 올려서 이전 항목을 무효화
+#   (목록을 채우는 요청은 조회 전에 읽은 세대 키에 저장하므로, 조회 도중 다른 요청/워커의 쓰기가 있으면
+#    이전 세대에 저장되어 다시 조회되지 않음)
+# : 백엔드: memory(프로세스 내 LRU + TTL) / redis(세대 카운터까지 redis에 저장, redis 패키지 필요)
+#   redis여도 배포는 워커 1개 기준: 목록 캐시는 공유되지만 ETag 버전(nexlist.cache.versions), 통계 캐시,
+#   검색 색인은 프로세스별이므로 다른 워커의 쓰기를 보지 못함
+# : redis 오류는 기록만 하고 캐시 없이 DB로 처리 (조회는 miss, 저장은 생략)
+#   세대 증가가 실패한 쓰기의 이전 항목은 TTL이 지날 때까지 남을 수 있음
+# : GET /todos/stats 결과는 (user_id, 목록 버전, 날짜) 키로 프로세스 메모리에 캐싱
+#   (쓰기가 버전을 올리므로 다음 쓰기까지 재사용, overdue는 날짜가 바뀌면 다시 계산)
+
+import logging
+import threading
+from collections import OrderedDict
+
+from nexlist.cache.memory import TTLCache
+from nexlist.config import settings
+from nexlist.metrics import register_cache
+
+logger = logging.getLogger(__name__)
+
+# today 필터 -> 키 접미사
+TODAY_FILTERS = {None: "all", True: "today", False: "later"}
+
+
+class TodoListCacheBackend:
+    """ 캐시 저장소 인터페이스: 값은 JSON 바이트 """
+
+    async def get(self, key: str) -> bytes | None:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        raise NotImplementedError
+
+    async def delete(self, *keys: str) -> None:
+        raise NotImplementedError
+
+    async def counter(self, key: str) -> int | None:
+        """ 정수 카운터 값 (없으면 0, 저장소를 사용할 수 없으면 None) """
+        raise NotImplementedError
+
+    async def incr(self, key: str) -> int | None:
+        """ 정수 카운터를 1 올린 값 (저장소를 사용할 수 없으면 None) """
+        raise NotImplementedError
+
+    def size(self) -> int | None:
+        """ 현재 항목 수 (알 수 없으면 None) """
+        return None
+
+    async def clear(self) -> None:
+        raise NotImplementedError
+
+    async def aclose(self) -> None:
+        pass
+
+
+class MemoryBackend(TodoListCacheBackend):
+    def __init__(self, max_size: int, ttl_seconds: float, max_counters: int | None = None):
+        self.cache = TTLCache(max_size, ttl_seconds)
+        # 세대 카운터는 캐시 항목과 같이 LRU / TTL로 사라지면 이전 항목이 다시 조회될 수 있으므로 따로 보관
+        # : 최근에 올린 max_counters개만 보관, 방출된 카운터는 방출된 값 중 가장 큰 값(floor)부터 이어감
+        #   (키별 값은 줄어들지 않고 incr마다 커지므로 이전 세대 항목이 다시 조회되지 않음)
+        self.max_counters = max_size if max_counters is None else max_counters
+        self.counters: OrderedDict[str, int] = OrderedDict()
+        self._floor = 0
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> bytes | None:
+        return self.cache.get(key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self.cache.set(key, value, ttl_seconds)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.cache.delete(key)
+
+    async def counter(self, key: str) -> int | None:
+        return self.counters.get(key, self._floor)
+
+    async def incr(self, key: str) -> int | None:
+        with self._lock:
+            value = self.counters.get(key, self._floor) + 1
+            self.counters[key] = value
+            self.counters.move_to_end(key)
+            while len(self.counters) > self.max_counters:
+                _, evicted = self.counters.popitem(last=False)
+                self._floor = max(self._floor, evicted)
+            return value
+
+    def size(self) -> int | None:
+        return len(self.cache)
+
+    async def clear(self) -> None:
+        self.cache.clear()
+        with self._lock:
+            self.counters.clear()
+            self._floor = 0
+
+
+class RedisBackend(TodoListCacheBackend):
+    """ redis.asyncio.Redis 호환 클라이언트 (get / set(px=) / delete / incr / scan_iter / aclose) """
+
+    def __init__(self, client, prefix: str = ""):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "") -> "RedisBackend":
+        # redis 백엔드를 쓸 때만 필요한 의존성
+        from redis.asyncio import Redis
+
+        return cls(Redis.from_url(url), prefix)
+
+    # redis 장애가 목록 조회 / todo 쓰기 요청을 실패시키지 않도록 오류는 기록만 함
+    async def get(self, key: str) -> bytes | None:
+        try:
+            return await self.client.get(self.prefix + key)
+        except Exception:
+            logger.exception("todo list cache get failed")
+            return None
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        try:
+            await self.client.set(self.prefix + key, value, px=max(int(ttl_seconds * 1000), 1))
+        except Exception:
+            logger.exception("todo list cache set failed")
+
+    async def delete(self, *keys: str) -> None:
+        try:
+            await self.client.delete(*(self.prefix + key for key in keys))
+        except Exception:
+            logger.exception("todo list cache delete failed")
+
+    # 세대 카운터는 만료 없이 사용자당 키 하나 (만료로 0부터 다시 시작하면 이전 세대 항목이 다시 조회될 수 있음)
+    async def counter(self, key: str) -> int | None:
+        try:
+            value = await self.client.get(self.prefix + key)
+        except Exception:
+            logger.exception("todo list cache generation read failed")
+            return None
+        return int(value) if value is not None else 0
+
+    async def incr(self, key: str) -> int | None:
+        try:
+            return await self.client.incr(self.prefix + key)
+        except Exception:
+            logger.exception("todo list cache invalidation failed")
+            return None
+
+    async def clear(self) -> None:
+        keys = [key async for key in self.client.scan_iter(match=f"{self.prefix}todos:*")]
+        if keys:
+            await self.client.delete(*keys)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+class TodoListCache:
+    def __init__(self, backend: TodoListCacheBackend, ttl_seconds: float):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(user_id: int, today: bool | None, generation: int = 0) -> str:
+        return f"todos:{user_id}:{generation}:{TODAY_FILTERS[today]}"
+
+    @staticmethod
+    def generation_key(user_id: int) -> str:
+        return f"todos:{user_id}:generation"
+
+    async def generation(self, user_id: int) -> int | None:
+        """ 사용자의 현재 세대 (저장소를 사용할 수 없으면 None: 조회는 miss, 저장은 생략) """
+        return await self.backend.counter(self.generation_key(user_id))
+
+    async def get(self, user_id: int, today: bool | None, generation: int | None = None) -> bytes | None:
+        if generation is None:
+            generation = await self.generation(user_id)
+        value = None
+        if generation is not None:
+            value = await self.backend.get(self.key(user_id, today, generation))
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, user_id: int, today: bool | None, value: bytes, generation: int | None = None) -> None:
+        """ generation: 조회 전에 읽은 세대 (생략하면 현재 세대) """
+        if generation is None:
+            generation = await self.generation(user_id)
+        if generation is not None:
+            await self.backend.set(self.key(user_id, today, generation), value, self.ttl_seconds)
+
+    async def invalidate(self, user_id: int) -> None:
+        # 쓰기 한 번이 today 필터 3가지 목록 모두에 영향을 줄 수 있으므로 세대를 올려서 모두 무효화
+        generation = await self.backend.incr(self.generation_key(user_id))
+        if generation is not None:
+            # 이전 세대 항목은 더 이상 조회되지 않지만 TTL 전에 공간을 비움
+            await self.backend.delete(*(self.key(user_id, today, generation - 1) for today in TODAY_FILTERS))
+
+    async def clear(self) -> None:
+        await self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+
+    async def aclose(self) -> None:
+        await self.backend.aclose()
+
+    def stats(self) -> dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": self.backend.size(),
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def build_todo_list_cache() -> TodoListCache | None:
+    backend = settings.TODO_LIST_CACHE_BACKEND
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return TodoListCache(
+            MemoryBackend(settings.TODO_LIST_CACHE_SIZE, settings.TODO_LIST_CACHE_TTL_SECONDS),
+            settings.TODO_LIST_CACHE_TTL_SECONDS,
+        )
+    if backend == "redis":
+        return TodoListCache(
+            RedisBackend.from_url(settings.TODO_LIST_CACHE_REDIS_URL, settings.TODO_LIST_CACHE_REDIS_PREFIX),
+            settings.TODO_LIST_CACHE_TTL_SECONDS,
+        )
+    raise ValueError(f"Unknown TODO_LIST_CACHE_BACKEND: {backend}")
+
+
+todo_list_cache = build_todo_list_cache()
+if todo_list_cache is not None:
+    register_cache("todo_list", todo_list_cache)
+
+
+def get_todo_list_cache() -> TodoListCache | None:
+    return todo_list_cache
+
+
+todo_stats_cache = TTLCache(settings.TODO_STATS_CACHE_SIZE, settings.TODO_STATS_CACHE_TTL_SECONDS)
+register_cache("todo_stats", todo_stats_cache)
+
+
+def get_todo_stats_cache() -> TTLCache:
+    return todo_stats_cache
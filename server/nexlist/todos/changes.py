@@ -0,0 +1,22 @@
+# 증분 동기화 (GET /todos/changes?since=<cursor>)
+# : todos.updated_at / todo_tombstones.deleted_at이 cursor 이후인 행만 (user_id, 시각) 인덱스 범위로 조회
+#   -> 동기화 비용이 목록 크기가 아니라 변경 수에 비례
+# : cursor는 UTC 마이크로초 정수. 새 cursor는 조회 시각에서 CHANGES_SETTLE_SECONDS를 뺀 시각이므로
+#   시각을 정한 뒤 늦게 커밋된 쓰기도 다음 동기화에 포함됨 (그 사이 변경은 다시 전달될 수 있으므로 클라이언트는 멱등하게 적용)
+# : 클라이언트는 deleted를 먼저 적용하고 todos를 upsert
+
+from datetime import datetime, timedelta, timezone
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def to_cursor(moment: datetime) -> int:
+    return (moment - EPOCH) // timedelta(microseconds=1)
+
+
+def from_cursor(cursor: int) -> datetime:
+    return EPOCH + timedelta(microseconds=cursor)
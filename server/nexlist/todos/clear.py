@@ -0,0 +1,136 @@
+# DELETE /todos/ 백그라운드 삭제 작업
+# : TodoService.remove_all_todos가 요청 안에서 inline_max_rows까지 chunk 단위로 삭제하고,
+#   남은 행이 있으면 여기서 같은 chunk 삭제를 이어서 진행 (202 + GET /todos/clear-jobs/{id}로 상태 조회)
+# : chunk마다 커밋하고 chunk 사이에 pause_seconds만큼 쉬므로 다른 요청이 잠금을 오래 기다리지 않음
+# : 작업 목록은 프로세스 메모리에 있으므로 단일 프로세스 배포 기준
+#   (서버가 재시작되면 진행 중인 작업은 사라지고, DELETE /todos/를 다시 요청하면 남은 행부터 삭제)
+
+import asyncio
+import logging
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from nexlist.config import settings
+from nexlist.db.database import AsyncSessionLocal, SessionLocal
+from nexlist.db.threadpool import ThreadPoolRepository
+
+from .repository import AsyncTodoRepository, TodoRepository
+
+logger = logging.getLogger(__name__)
+
+# (user_id, max_id, limit) -> 삭제한 todo id
+ChunkDeleter = Callable[[int, int, int], Awaitable[list[int]]]
+# chunk 삭제 후 호출 (검색 색인 / 목록 버전 / 캐시 갱신)
+ChunkCallback = Callable[[list[int]], Awaitable[None]]
+
+
+# 백그라운드 chunk 삭제: 요청 밖에서 실행되므로 세션을 직접 생성
+async def remove_todo_chunk(user_id: int, max_id: int, limit: int) -> list[int]:
+    if settings.DB_ASYNC:
+        async with AsyncSessionLocal() as db:
+            return await AsyncTodoRepository(db).remove_todo_chunk(user_id, max_id, limit)
+
+    with SessionLocal() as db:
+        return await ThreadPoolRepository(TodoRepository(db)).remove_todo_chunk(user_id, max_id, limit)
+
+
+@dataclass
+class TodoClearJob:
+    id: str
+    user_id: int
+    max_id: int  # 삭제 요청 시점의 마지막 todo id (이후 추가된 todo는 삭제하지 않음)
+    deleted: int  # 지금까지 삭제한 행 수 (요청 안에서 삭제한 행 포함)
+    started_at: datetime
+    status: str = "running"  # running / done / failed
+    finished_at: datetime | None = None
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+
+class TodoClearJobs:
+    def __init__(
+        self,
+        deleter: ChunkDeleter = remove_todo_chunk,
+        batch_size: int = 500,
+        inline_max_rows: int = 2000,
+        pause_seconds: float = 0.0,
+        retention_seconds: float = 3600,
+    ):
+        self.deleter = deleter
+        self.batch_size = batch_size
+        self.inline_max_rows = inline_max_rows
+        self.pause_seconds = pause_seconds
+        self.retention_seconds = retention_seconds
+        self._jobs: dict[str, TodoClearJob] = {}
+
+    def get(self, job_id: str, user_id: int) -> TodoClearJob | None:
+        job = self._jobs.get(job_id)
+        return job if job is not None and job.user_id == user_id else None
+
+    def running(self, user_id: int) -> TodoClearJob | None:
+        """ 사용자당 작업은 하나: 진행 중인 작업이 있으면 DELETE /todos/는 그 작업을 반환 """
+        for job in self._jobs.values():
+            if job.user_id == user_id and job.status == "running":
+                return job
+        return None
+
+    def start(self, user_id: int, max_id: int, deleted: int, on_chunk: ChunkCallback) -> TodoClearJob:
+        self._prune()
+        job = TodoClearJob(id=uuid.uuid4().hex, user_id=user_id, max_id=max_id, deleted=deleted, started_at=datetime.now())
+        self._jobs[job.id] = job
+        job.task = asyncio.create_task(self._run(job, on_chunk))
+        return job
+
+    async def _run(self, job: TodoClearJob, on_chunk: ChunkCallback) -> None:
+        try:
+            while True:
+                deleted_ids = await self.deleter(job.user_id, job.max_id, self.batch_size)
+                job.deleted += len(deleted_ids)
+                if deleted_ids:
+                    await on_chunk(deleted_ids)
+                if len(deleted_ids) < self.batch_size:
+                    break
+                if self.pause_seconds > 0:
+                    await asyncio.sleep(self.pause_seconds)
+            job.status = "done"
+        except asyncio.CancelledError:
+            job.status = "failed"
+            raise
+        except Exception:
+            logger.exception("clearing todos of user %d failed (%d deleted)", job.user_id, job.deleted)
+            job.status = "failed"
+        finally:
+            job.finished_at = datetime.now()
+            job.task = None
+
+    def _prune(self) -> None:
+        now = datetime.now()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_at is not None and (now - job.finished_at).total_seconds() > self.retention_seconds
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    # lifespan 종료 시 진행 중인 작업 취소 (삭제한 chunk는 이미 커밋됨)
+    async def stop(self) -> None:
+        tasks = [job.task for job in self._jobs.values() if job.task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def clear(self) -> None:
+        self._jobs.clear()
+
+
+todo_clear_jobs = TodoClearJobs(
+    batch_size=settings.TODO_CLEAR_BATCH_SIZE,
+    inline_max_rows=settings.TODO_CLEAR_INLINE_MAX_ROWS,
+    pause_seconds=settings.TODO_CLEAR_PAUSE_SECONDS,
+    retention_seconds=settings.TODO_CLEAR_JOB_RETENTION_SECONDS,
+)
+
+
+def get_todo_clear_jobs() -> TodoClearJobs:
+    return todo_clear_jobs
@@ -1,13 +1,41 @@
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from nexlist.db.dependencies import get_db
+from nexlist.config import settings
+from nexlist.db.dependencies import get_async_db, get_db
+from nexlist.db.threadpool import ThreadPoolRepository
 
-from .repository import TodoRepository
+from .cache import get_todo_list_cache, get_todo_stats_cache
+from .clear import get_todo_clear_jobs
+from .repository import AsyncTodoRepository, TodoRepository
+from .search import get_todo_search_index
 from .service import TodoService
 
 
-# 서비스 의존성
-def get_todo_service(db: Session = Depends(get_db)) -> TodoService:
+# 서비스 의존성: 동기 Session (Repository 호출은 스레드풀에서 실행)
+def get_sync_todo_service(
+    db: Session = Depends(get_db),
+    cache = Depends(get_todo_list_cache),
+    search_index = Depends(get_todo_search_index),
+    stats_cache = Depends(get_todo_stats_cache),
+    clear_jobs = Depends(get_todo_clear_jobs),
+) -> TodoService:
     repo = TodoRepository(db)
-    return TodoService(repo)
+    return TodoService(ThreadPoolRepository(repo), cache, search_index, stats_cache, clear_jobs)
+
+
+# 서비스 의존성: AsyncSession
+def get_async_todo_service(
+    db: AsyncSession = Depends(get_async_db),
+    cache = Depends(get_todo_list_cache),
+    search_index = Depends(get_todo_search_index),
+    stats_cache = Depends(get_todo_stats_cache),
+    clear_jobs = Depends(get_todo_clear_jobs),
+) -> TodoService:
+    repo = AsyncTodoRepository(db)
+    return TodoService(repo, cache, search_index, stats_cache, clear_jobs)
+
+
+# Settings.DB_ASYNC에 따라 라우터가 사용할 서비스 의존성 선택
+get_todo_service = get_async_todo_service if settings.DB_ASYNC else get_sync_todo_service
@@ -1,13 +1,39 @@
 # 데이터 구조만 정의
 
-from sqlalchemy import Boolean, Column, Date, ForeignKey, Integer, String
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+)
+from sqlalchemy.dialects import mysql
 
 from nexlist.db.database import Base
 
+from .changes import utcnow
+
+# 증분 동기화 cursor용 시각: MySQL DATETIME 기본 정밀도(초)로는 같은 초의 변경을 구분할 수 없으므로 마이크로초까지
+Timestamp = DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql")
+
 
 # Base: DB 테이블 정의 선언
 class Todo(Base):
     __tablename__ = "todos"
+    __table_args__ = (
+        # TodoRepository.get_all_todos: filter_by(user_id=..., today=...)
+        # : InnoDB 보조 인덱스는 PK(id)를 포함하므로 id 순 정렬/조회도 이 인덱스로 처리
+        Index("ix_todos_user_id_today", "user_id", "today"),
+        # 마감일 기준 조회: user_id + due_date 범위
+        Index("ix_todos_user_id_due_date", "user_id", "due_date"),
+        # GET /todos/changes: user_id + updated_at 범위
+        Index("ix_todos_user_id_updated_at", "user_id", "updated_at"),
+        # GET /todos/search: 한글 검색을 위해 ngram parser 사용 (MySQL에서만 생성)
+        Index("ft_todos_task", "task", mysql_prefix="FULLTEXT", mysql_with_parser="ngram").ddl_if(dialect="mysql"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     is_done = Column(Boolean, default=False)
@@ -15,3 +41,33 @@ class Todo(Base):
     due_date = Column(Date)
     user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'))
     today = Column(Boolean, default=True)
+    # INSERT / UPDATE 문마다 갱신 (Core update(Todo)로 여러 행을 바꿀 때도 적용)
+    updated_at = Column(Timestamp, default=utcnow, onupdate=utcnow)
+
+
+# 삭제된 todo 기록 (GET /todos/changes가 삭제를 전달하기 위해 사용)
+# : todo DELETE와 같은 트랜잭션에서 추가, Settings.TODO_TOMBSTONE_RETENTION_DAYS가 지나면 nexlist.todos.tombstones가 정리
+class TodoTombstone(Base):
+    __tablename__ = "todo_tombstones"
+    __table_args__ = (
+        Index("ix_todo_tombstones_user_id_deleted_at", "user_id", "deleted_at"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    todo_id = Column(Integer, nullable=False)
+    user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    deleted_at = Column(Timestamp, nullable=False, default=utcnow)
+
+
+# "오늘 할 일" rollover 진행 상황 (실행 날짜별 1행)
+# : chunk UPDATE와 같은 트랜잭션에서 갱신되므로 중단된 실행은 기록된 위치부터 이어서 진행
+class TodoRolloverCheckpoint(Base):
+    __tablename__ = "todo_rollover_checkpoints"
+
+    run_date = Column(Date, primary_key=True)
+    step = Column(String(32), nullable=False)  # 진행 중인 단계 (nexlist.todos.rollover.STEPS)
+    last_id = Column(Integer, nullable=False, default=0)  # 해당 단계에서 처리한 마지막 todo id
+    updated_rows = Column(Integer, nullable=False, default=0)
+    started_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+    finished_at = Column(DateTime)
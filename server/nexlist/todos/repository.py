@@ -2,21 +2,186 @@
 # : CRUD 동작을 라우터 또는 서비스 계층에 노출하기 위한 중간 계층 역할
 
 from abc import abstractmethod
+from datetime import date, datetime
 
+from sqlalchemy import Insert, Row, Select, case, delete, func, insert, select, update
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from .models import Todo
-from .schemas import TodoCompletedState, TodoItem, TodoTodayState
+from nexlist.db.routing import use_primary
+
+from .changes import utcnow
+from .models import Todo, TodoTombstone
+from .schemas import TodoCompletedState, TodoItem, TodoListFilters, TodoTodayState
+from .search import boolean_mode_phrase
+
+# 스트리밍 조회 시 한 번에 가져올 행 수
+STREAM_BATCH_SIZE = 500
+
+
+# 목록 조회 쿼리 (동기/비동기 Repository 공용)
+# : id 오름차순으로 고정 정렬하고, cursor(이전 페이지의 마지막 id) 이후만 조회하는 keyset 방식
+# : 마감일 조건은 (user_id, due_date) 인덱스(ix_todos_user_id_due_date)의 범위 조회로 처리
+def todo_list_statement(
+    user_id: int,
+    today: bool | None,
+    cursor: int | None = None,
+    limit: int | None = None,
+    columns=None,
+    filters: TodoListFilters | None = None,
+) -> Select:
+    stmt = (select(*columns) if columns else select(Todo)).filter_by(user_id=user_id)
+    if today is not None:
+        stmt = stmt.filter_by(today=today)
+    if filters is not None:
+        stmt = apply_list_filters(stmt, filters)
+    if cursor is not None:
+        stmt = stmt.filter(Todo.id > cursor)
+    stmt = stmt.order_by(Todo.id)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def apply_list_filters(stmt: Select, filters: TodoListFilters) -> Select:
+    if filters.due_before is not None:
+        stmt = stmt.filter(Todo.due_date < filters.due_before)
+    if filters.due_after is not None:
+        stmt = stmt.filter(Todo.due_date > filters.due_after)
+    if filters.overdue:
+        stmt = stmt.filter(Todo.due_date < date.today(), Todo.is_done.isnot(True))
+    if filters.is_done is not None:
+        # is_done이 NULL인 이전 행은 미완료로 취급
+        stmt = stmt.filter(Todo.is_done.is_(True) if filters.is_done else Todo.is_done.isnot(True))
+    return stmt
+
+
+# 목록 응답(TodoResponse)에 필요한 컬럼만, 응답 키 순서대로
+TODO_LIST_COLUMNS = (Todo.id, Todo.task, Todo.due_date, Todo.is_done, Todo.today)
+
+
+# 검색 쿼리 (MySQL FULLTEXT, ngram parser): 관련도 내림차순, 같으면 최근 todo 먼저
+def todo_search_statement(user_id: int, query: str, limit: int, offset: int = 0) -> Select:
+    relevance = match(Todo.task, against=boolean_mode_phrase(query)).in_boolean_mode()
+    return (
+        select(*TODO_LIST_COLUMNS)
+        .where(Todo.user_id == user_id, relevance)
+        .order_by(relevance.desc(), Todo.id.desc())
+        .limit(limit)
+        .offset(offset)
+    )
+
+
+# 메모리 검색 색인 생성용 (id, task)
+def todo_texts_statement(user_id: int) -> Select:
+    return select(Todo.id, Todo.task).filter_by(user_id=user_id)
+
+
+# 목록 응답 컬럼을 id로 조회 (순서는 호출한 쪽에서 정렬)
+def todo_rows_by_ids_statement(todo_ids: list[int], user_id: int) -> Select:
+    return select(*TODO_LIST_COLUMNS).where(Todo.id.in_(todo_ids), Todo.user_id == user_id)
+
+
+# 통계 쿼리: 사용자의 todo를 한 번 훑으면서 조건부 집계 (SUM(CASE ...))
+def todo_stats_statement(user_id: int, today: date) -> Select:
+    def count_if(condition):
+        return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+    return select(
+        func.count(Todo.id).label("total"),
+        count_if(Todo.is_done.is_(True)).label("done"),
+        count_if(Todo.today.is_(True)).label("today"),
+        count_if(Todo.is_done.isnot(True) & (Todo.due_date < today)).label("overdue"),
+    ).where(Todo.user_id == user_id)
+
+
+# 목록 삭제 chunk: max_id 이하 todo를 id 순으로 최대 limit개 잠금 후 조회
+# : 삭제 요청 이후 추가된 todo(id > max_id)는 대상에서 제외
+def todo_chunk_ids_statement(user_id: int, max_id: int, limit: int) -> Select:
+    return (
+        select(Todo.id)
+        .where(Todo.user_id == user_id, Todo.id <= max_id)
+        .order_by(Todo.id)
+        .limit(limit)
+        .with_for_update()
+    )
+
+
+# 삭제한 todo의 tombstone 추가 (DELETE와 같은 트랜잭션에서 실행)
+def tombstones_statement(todo_ids: list[int], user_id: int) -> Insert:
+    deleted_at = utcnow()
+    return insert(TodoTombstone).values(
+        [{"todo_id": todo_id, "user_id": user_id, "deleted_at": deleted_at} for todo_id in todo_ids]
+    )
+
+
+# 증분 동기화: since 이후 변경된 todo (since가 None이면 전체 목록)
+def todo_changes_statement(user_id: int, since: datetime | None) -> Select:
+    stmt = select(*TODO_LIST_COLUMNS).where(Todo.user_id == user_id)
+    if since is None:
+        return stmt.order_by(Todo.id)
+    return stmt.where(Todo.updated_at > since).order_by(Todo.updated_at, Todo.id)
+
+
+# 증분 동기화: since 이후 삭제된 todo id
+def deleted_ids_statement(user_id: int, since: datetime) -> Select:
+    return (
+        select(TodoTombstone.todo_id)
+        .where(TodoTombstone.user_id == user_id, TodoTombstone.deleted_at > since)
+        .order_by(TodoTombstone.deleted_at, TodoTombstone.id)
+    )
+
+
+# 주어진 id 중 user_id가 소유한 id 조회 (배치 처리 결과 판단용)
+def owned_ids_statement(todo_ids: list[int], user_id: int) -> Select:
+    return select(Todo.id).where(Todo.id.in_(todo_ids), Todo.user_id == user_id).order_by(Todo.id)
 
 
 # Todo Interface
 class TodoRepositoryInterface:
+    @abstractmethod
+    def use_primary(self) -> None:
+        pass
+
     @abstractmethod
     def get_todo_by_id(self, todo_id: int, user_id: int) -> Todo | None:
         pass
 
     @abstractmethod
-    def get_all_todos(self, user_id: int) -> list[Todo]:
+    def get_all_todos(
+        self, user_id: int, today: bool | None, cursor: int | None = None, limit: int | None = None,
+        filters: TodoListFilters | None = None,
+    ) -> list[Todo]:
+        pass
+
+    @abstractmethod
+    def get_todo_rows(
+        self, user_id: int, today: bool | None, cursor: int | None = None, limit: int | None = None,
+        filters: TodoListFilters | None = None,
+    ) -> list[Row]:
+        pass
+
+    @abstractmethod
+    def iter_todos(
+        self, user_id: int, today: bool | None, cursor: int | None = None, filters: TodoListFilters | None = None
+    ):
+        pass
+
+    @abstractmethod
+    def get_todo_stats(self, user_id: int, today: date) -> Row:
+        pass
+
+    @abstractmethod
+    def search_todo_rows(self, user_id: int, query: str, limit: int, offset: int = 0) -> list[Row]:
+        pass
+
+    @abstractmethod
+    def get_todo_texts(self, user_id: int) -> list[Row]:
+        pass
+
+    @abstractmethod
+    def get_todo_rows_by_ids(self, todo_ids: list[int], user_id: int) -> list[Row]:
         pass
 
     @abstractmethod
@@ -24,7 +189,19 @@ class TodoRepositoryInterface:
         pass
 
     @abstractmethod
-    def remove_all_todos(self, user_id: int) -> int:
+    def get_max_todo_id(self, user_id: int) -> int | None:
+        pass
+
+    @abstractmethod
+    def get_changed_todo_rows(self, user_id: int, since: datetime | None) -> list[Row]:
+        pass
+
+    @abstractmethod
+    def get_deleted_todo_ids(self, user_id: int, since: datetime) -> list[int]:
+        pass
+
+    @abstractmethod
+    def remove_todo_chunk(self, user_id: int, max_id: int, limit: int) -> list[int]:
         pass
 
     @abstractmethod
@@ -37,6 +214,18 @@ class TodoRepositoryInterface:
     ) -> Todo:
         pass
 
+    @abstractmethod
+    def create_todos(self, todos: list[TodoItem], user_id: int) -> list[Todo]:
+        pass
+
+    @abstractmethod
+    def update_todos_by_ids(self, todo_ids: list[int], user_id: int, **values) -> list[int]:
+        pass
+
+    @abstractmethod
+    def remove_todos_by_ids(self, todo_ids: list[int], user_id: int) -> list[int]:
+        pass
+
     @abstractmethod
     def update_completed_state_by_id(
         todo_id: int, state: TodoCompletedState, user_id: int
@@ -49,6 +238,9 @@ class TodoRepository(TodoRepositoryInterface):
     def __init__(self, db: Session):
         self.db = db
 
+    # 이후 조회를 primary로 고정 (최근 쓰기가 있었던 사용자의 조회)
+    def use_primary(self) -> None:
+        use_primary(self.db)
 
     # READ: single todo
     def get_todo_by_id(self, todo_id: int, user_id: int) -> Todo | None:
@@ -57,13 +249,49 @@ class TodoRepository(TodoRepositoryInterface):
         )
 
     # READ: all todos
-    def get_all_todos(self, user_id: int, today: bool | None) -> list[Todo] | None:
-        # 오늘 할 일 여부와 상관 없이 USER_ID의 모든 Todo 반환
-        if today is None:
-            return self.db.query(Todo).filter_by(user_id=user_id).all()
+    # : today=None 이면 오늘 할 일 여부와 상관 없이 USER_ID의 모든 Todo 반환
+    def get_all_todos(
+        self, user_id: int, today: bool | None, cursor: int | None = None, limit: int | None = None,
+        filters: TodoListFilters | None = None,
+    ) -> list[Todo] | None:
+        return self.db.scalars(todo_list_statement(user_id, today, cursor, limit, filters=filters)).all()
+
+    # READ: all todos (컬럼 프로젝션)
+    # : ORM 객체 / identity map 없이 Row(named tuple)만 생성
+    def get_todo_rows(
+        self, user_id: int, today: bool | None, cursor: int | None = None, limit: int | None = None,
+        filters: TodoListFilters | None = None,
+    ) -> list[Row]:
+        return self.db.execute(todo_list_statement(user_id, today, cursor, limit, TODO_LIST_COLUMNS, filters)).all()
+
+    # READ: all todos (streaming)
+    # : yield_per로 STREAM_BATCH_SIZE 행씩 가져와서 목록 크기와 무관하게 메모리 사용량 유지
+    # : 응답 본문은 의존성(get_db)이 세션을 닫은 뒤에 전송되므로 닫힌 세션을 다시 열어 사용하고 순회가 끝나면 직접 닫음
+    def iter_todos(
+        self, user_id: int, today: bool | None, cursor: int | None = None, filters: TodoListFilters | None = None
+    ):
+        try:
+            stmt = todo_list_statement(user_id, today, cursor, filters=filters)
+            stmt = stmt.execution_options(yield_per=STREAM_BATCH_SIZE)
+            yield from self.db.scalars(stmt)
+        finally:
+            self.db.close()
+
+    # READ: 통계 (total, done, today, overdue)
+    def get_todo_stats(self, user_id: int, today: date) -> Row:
+        return self.db.execute(todo_stats_statement(user_id, today)).one()
+
+    # SEARCH: FULLTEXT 검색 (MySQL)
+    def search_todo_rows(self, user_id: int, query: str, limit: int, offset: int = 0) -> list[Row]:
+        return self.db.execute(todo_search_statement(user_id, query, limit, offset)).all()
 
-        # 오늘 할 일 여부에 따른 USER_ID의 Todo 반환
-        return self.db.query(Todo).filter_by(user_id=user_id, today=today).all()
+    # SEARCH: 메모리 검색 색인용 (id, task)
+    def get_todo_texts(self, user_id: int) -> list[Row]:
+        return self.db.execute(todo_texts_statement(user_id)).all()
+
+    # SEARCH: 검색 결과 페이지의 todo (컬럼 프로젝션)
+    def get_todo_rows_by_ids(self, todo_ids: list[int], user_id: int) -> list[Row]:
+        return self.db.execute(todo_rows_by_ids_statement(todo_ids, user_id)).all()
 
     # CREATE: single todo
     def create_todo(self, todo: TodoItem, user_id: int) -> Todo:
@@ -74,55 +302,287 @@ class TodoRepository(TodoRepositoryInterface):
         self.db.refresh(new_todo)
         return new_todo
 
-    # DELETE: all todos
-    def remove_all_todos(self, user_id: int):
-        self.db.query(Todo).filter(Todo.user_id == user_id).delete()
+    # CREATE: multiple todos (하나의 트랜잭션)
+    # : RETURNING을 지원하는 DB는 INSERT 한 번, MySQL은 행 단위 INSERT 후 commit 한 번
+    def create_todos(self, todos: list[TodoItem], user_id: int) -> list[Todo]:
+        new_todos = [Todo(**todo.model_dump(), user_id=user_id) for todo in todos]
+        self.db.add_all(new_todos)
+        self.db.flush()
+        # commit으로 인한 expire 이후 행마다 refresh SELECT가 나가지 않도록 세션에서 분리
+        for new_todo in new_todos:
+            self.db.expunge(new_todo)
+        self.db.commit()
+        return new_todos
+
+    # UPDATE: multiple todos, 실제로 갱신된(소유한) id 목록 반환
+    # : 소유권 조건을 포함한 UPDATE 한 번 + 같은 트랜잭션에서 갱신된 id 조회
+    def update_todos_by_ids(self, todo_ids: list[int], user_id: int, **values) -> list[int]:
+        (
+            self.db.query(Todo)
+            .filter(Todo.id.in_(todo_ids), Todo.user_id == user_id)
+            .update(values, synchronize_session=False)
+        )
+        updated_ids = self.db.scalars(owned_ids_statement(todo_ids, user_id)).all()
+        self.db.commit()
+        return updated_ids
+
+    # DELETE: multiple todos, 실제로 삭제된 id 목록 반환
+    # : 대상 행을 잠근 뒤(FOR UPDATE) DELETE 한 번
+    def remove_todos_by_ids(self, todo_ids: list[int], user_id: int) -> list[int]:
+        deleted_ids = self.db.scalars(owned_ids_statement(todo_ids, user_id).with_for_update()).all()
+        if deleted_ids:
+            (
+                self.db.query(Todo)
+                .filter(Todo.id.in_(deleted_ids), Todo.user_id == user_id)
+                .delete(synchronize_session=False)
+            )
+            self.db.execute(tombstones_statement(deleted_ids, user_id))
+        self.db.commit()
+        return deleted_ids
+
+    # 목록 삭제 범위: 삭제 요청 시점의 마지막 id
+    # : replica 지연으로 방금 추가된 todo가 범위에서 빠지지 않도록 primary에서 조회
+    def get_max_todo_id(self, user_id: int) -> int | None:
+        use_primary(self.db)
+        return self.db.scalar(select(func.max(Todo.id)).where(Todo.user_id == user_id))
+
+    # DELETE: todos chunk
+    # : 목록 전체를 DELETE 한 번으로 지우면 끝날 때까지 모든 행의 잠금이 유지되므로 limit개씩 나눠서 커밋
+    def remove_todo_chunk(self, user_id: int, max_id: int, limit: int) -> list[int]:
+        deleted_ids = self.db.scalars(todo_chunk_ids_statement(user_id, max_id, limit)).all()
+        if deleted_ids:
+            self.db.execute(delete(Todo).where(Todo.id.in_(deleted_ids)).execution_options(synchronize_session=False))
+            self.db.execute(tombstones_statement(deleted_ids, user_id))
         self.db.commit()
+        return deleted_ids
+
+    # 증분 동기화: 조회 결과로 다음 cursor를 정하므로 replica 지연으로 변경을 건너뛰지 않도록 primary에서 조회
+    def get_changed_todo_rows(self, user_id: int, since: datetime | None) -> list[Row]:
+        use_primary(self.db)
+        return self.db.execute(todo_changes_statement(user_id, since)).all()
+
+    def get_deleted_todo_ids(self, user_id: int, since: datetime) -> list[int]:
+        use_primary(self.db)
+        return self.db.scalars(deleted_ids_statement(user_id, since)).all()
 
     # DELETE: single todo
+    # : 소유권 조건을 포함한 DELETE 한 번으로 처리하고 rowcount로 존재 여부 판단
     def remove_todo_by_id(
         self, todo_id: int, user_id: int
     ) -> int | None:
-        todo = self.get_todo_by_id(todo_id, user_id)
-        if not todo:
-            return None
         deleted = (
-            self.db.query(Todo).filter(Todo.id == todo_id, Todo.user_id == user_id).delete()
+            self.db.query(Todo)
+            .filter(Todo.id == todo_id, Todo.user_id == user_id)
+            .delete(synchronize_session=False)
         )
+        if deleted:
+            self.db.execute(tombstones_statement([todo_id], user_id))
         self.db.commit()
-        return deleted
+        return deleted or None
 
     # UPDATE: todo
     def update_todo_by_id(
         self, todo_id: int, change: TodoItem, user_id: int
     ) -> Todo:
-        todo = self.get_todo_by_id(todo_id, user_id)
-        if not todo:
-            return None
-        todo.task = change.task
-        todo.due_date = change.due_date
-        self.db.commit()
-        self.db.refresh(todo)
-        return todo
+        return self._update_owned_todo(
+            todo_id, user_id, task=change.task, due_date=change.due_date
+        )
 
     def update_completed_state_by_id(
         self, todo_id: int, state: TodoCompletedState, user_id: int
     ) -> Todo:
-        todo = self.get_todo_by_id(todo_id, user_id)
-        if not todo:
-            return None
-        todo.is_done = state.is_done
-        self.db.commit()
-        self.db.refresh(todo)
-        return todo
+        return self._update_owned_todo(todo_id, user_id, is_done=state.is_done)
 
     def update_today_state_by_id(
         self, todo_id: int, state: TodoTodayState, user_id: int
     ) -> Todo:
-        todo = self.get_todo_by_id(todo_id, user_id)
-        if not todo:
-            return None
-        todo.today = state.today
+        return self._update_owned_todo(todo_id, user_id, today=state.today)
+
+    # 소유권 조건을 포함한 UPDATE 한 번 + 응답용 SELECT 한 번 (SELECT-commit-refresh 대신)
+    # : MySQL dialect는 CLIENT_FOUND_ROWS로 연결하므로 rowcount는 '변경된' 행이 아닌 '조건에 맞는' 행 수
+    def _update_owned_todo(self, todo_id: int, user_id: int, **values) -> Todo | None:
+        updated = (
+            self.db.query(Todo)
+            .filter(Todo.id == todo_id, Todo.user_id == user_id)
+            .update(values, synchronize_session=False)
+        )
         self.db.commit()
-        self.db.refresh(todo)
-        return todo
+        if not updated:
+            return None
+        # commit 이후에 조회해야 expire_on_commit으로 인한 재조회(refresh)가 생기지 않음
+        return self.get_todo_by_id(todo_id, user_id)
+
+
+# TodoRepository 비동기 구현체 (AsyncSession)
+class AsyncTodoRepository(TodoRepositoryInterface):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def use_primary(self) -> None:
+        use_primary(self.db)
+
+    # READ: single todo
+    async def get_todo_by_id(self, todo_id: int, user_id: int) -> Todo | None:
+        result = await self.db.execute(
+            select(Todo).filter(Todo.id == todo_id, Todo.user_id == user_id)
+        )
+        return result.scalars().first()
+
+    # READ: all todos
+    async def get_all_todos(
+        self, user_id: int, today: bool | None, cursor: int | None = None, limit: int | None = None,
+        filters: TodoListFilters | None = None,
+    ) -> list[Todo] | None:
+        result = await self.db.execute(todo_list_statement(user_id, today, cursor, limit, filters=filters))
+        return result.scalars().all()
+
+    # READ: all todos (컬럼 프로젝션)
+    async def get_todo_rows(
+        self, user_id: int, today: bool | None, cursor: int | None = None, limit: int | None = None,
+        filters: TodoListFilters | None = None,
+    ) -> list[Row]:
+        result = await self.db.execute(todo_list_statement(user_id, today, cursor, limit, TODO_LIST_COLUMNS, filters))
+        return result.all()
+
+    # READ: all todos (streaming)
+    async def iter_todos(
+        self, user_id: int, today: bool | None, cursor: int | None = None, filters: TodoListFilters | None = None
+    ):
+        try:
+            stmt = todo_list_statement(user_id, today, cursor, filters=filters)
+            stmt = stmt.execution_options(yield_per=STREAM_BATCH_SIZE)
+            result = await self.db.stream_scalars(stmt)
+            async for todo in result:
+                yield todo
+        finally:
+            await self.db.close()
+
+    # READ: 통계 (total, done, today, overdue)
+    async def get_todo_stats(self, user_id: int, today: date) -> Row:
+        result = await self.db.execute(todo_stats_statement(user_id, today))
+        return result.one()
+
+    # SEARCH: FULLTEXT 검색 (MySQL)
+    async def search_todo_rows(self, user_id: int, query: str, limit: int, offset: int = 0) -> list[Row]:
+        result = await self.db.execute(todo_search_statement(user_id, query, limit, offset))
+        return result.all()
+
+    # SEARCH: 메모리 검색 색인용 (id, task)
+    async def get_todo_texts(self, user_id: int) -> list[Row]:
+        result = await self.db.execute(todo_texts_statement(user_id))
+        return result.all()
+
+    # SEARCH: 검색 결과 페이지의 todo (컬럼 프로젝션)
+    async def get_todo_rows_by_ids(self, todo_ids: list[int], user_id: int) -> list[Row]:
+        result = await self.db.execute(todo_rows_by_ids_statement(todo_ids, user_id))
+        return result.all()
+
+    # CREATE: single todo
+    async def create_todo(self, todo: TodoItem, user_id: int) -> Todo:
+        new_todo = Todo(**todo.model_dump())
+        new_todo.user_id = user_id
+        self.db.add(new_todo)
+        await self.db.commit()
+        await self.db.refresh(new_todo)
+        return new_todo
+
+    # CREATE: multiple todos (하나의 트랜잭션)
+    async def create_todos(self, todos: list[TodoItem], user_id: int) -> list[Todo]:
+        new_todos = [Todo(**todo.model_dump(), user_id=user_id) for todo in todos]
+        self.db.add_all(new_todos)
+        await self.db.commit()
+        return new_todos
+
+    # UPDATE: multiple todos, 실제로 갱신된(소유한) id 목록 반환
+    async def update_todos_by_ids(self, todo_ids: list[int], user_id: int, **values) -> list[int]:
+        await self.db.execute(
+            update(Todo)
+            .where(Todo.id.in_(todo_ids), Todo.user_id == user_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        updated_ids = (await self.db.scalars(owned_ids_statement(todo_ids, user_id))).all()
+        await self.db.commit()
+        return updated_ids
+
+    # DELETE: multiple todos, 실제로 삭제된 id 목록 반환
+    async def remove_todos_by_ids(self, todo_ids: list[int], user_id: int) -> list[int]:
+        deleted_ids = (await self.db.scalars(owned_ids_statement(todo_ids, user_id).with_for_update())).all()
+        if deleted_ids:
+            await self.db.execute(
+                delete(Todo)
+                .where(Todo.id.in_(deleted_ids), Todo.user_id == user_id)
+                .execution_options(synchronize_session=False)
+            )
+            await self.db.execute(tombstones_statement(deleted_ids, user_id))
+        await self.db.commit()
+        return deleted_ids
+
+    # 목록 삭제 범위: 삭제 요청 시점의 마지막 id
+    async def get_max_todo_id(self, user_id: int) -> int | None:
+        use_primary(self.db)
+        return await self.db.scalar(select(func.max(Todo.id)).where(Todo.user_id == user_id))
+
+    # DELETE: todos chunk
+    async def remove_todo_chunk(self, user_id: int, max_id: int, limit: int) -> list[int]:
+        deleted_ids = (await self.db.scalars(todo_chunk_ids_statement(user_id, max_id, limit))).all()
+        if deleted_ids:
+            await self.db.execute(
+                delete(Todo).where(Todo.id.in_(deleted_ids)).execution_options(synchronize_session=False)
+            )
+            await self.db.execute(tombstones_statement(deleted_ids, user_id))
+        await self.db.commit()
+        return deleted_ids
+
+    # 증분 동기화
+    async def get_changed_todo_rows(self, user_id: int, since: datetime | None) -> list[Row]:
+        use_primary(self.db)
+        return (await self.db.execute(todo_changes_statement(user_id, since))).all()
+
+    async def get_deleted_todo_ids(self, user_id: int, since: datetime) -> list[int]:
+        use_primary(self.db)
+        return (await self.db.scalars(deleted_ids_statement(user_id, since))).all()
+
+    # DELETE: single todo
+    async def remove_todo_by_id(
+        self, todo_id: int, user_id: int
+    ) -> int | None:
+        result = await self.db.execute(
+            delete(Todo)
+            .where(Todo.id == todo_id, Todo.user_id == user_id)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            await self.db.execute(tombstones_statement([todo_id], user_id))
+        await self.db.commit()
+        return result.rowcount or None
+
+    # UPDATE: todo
+    async def update_todo_by_id(
+        self, todo_id: int, change: TodoItem, user_id: int
+    ) -> Todo:
+        return await self._update_owned_todo(
+            todo_id, user_id, task=change.task, due_date=change.due_date
+        )
+
+    async def update_completed_state_by_id(
+        self, todo_id: int, state: TodoCompletedState, user_id: int
+    ) -> Todo:
+        return await self._update_owned_todo(todo_id, user_id, is_done=state.is_done)
+
+    async def update_today_state_by_id(
+        self, todo_id: int, state: TodoTodayState, user_id: int
+    ) -> Todo:
+        return await self._update_owned_todo(todo_id, user_id, today=state.today)
+
+    async def _update_owned_todo(self, todo_id: int, user_id: int, **values) -> Todo | None:
+        result = await self.db.execute(
+            update(Todo)
+            .where(Todo.id == todo_id, Todo.user_id == user_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+        if not result.rowcount:
+            return None
+        return await self.get_todo_by_id(todo_id, user_id)
@@ -0,0 +1,364 @@
+""" "오늘 할 일" rollover: 하루 한 번 모든 사용자의 today 플래그를 set-based UPDATE로 정리
+
+- promote: 마감일이 실행 날짜 이전(당일 포함)이고 완료하지 않은 todo를 오늘 할 일로 (today=True)
+- clear_done: 완료한 todo를 오늘 할 일에서 내림 (today=False, Settings.TODO_ROLLOVER_CLEAR_DONE)
+
+단계마다 id 순 keyset으로 최대 batch_size 행씩 나눠서 chunk 하나를 짧은 트랜잭션 하나로 UPDATE한다.
+(전체를 UPDATE 한 번으로 처리하면 끝날 때까지 대상 행 잠금이 유지되어 사용자 요청이 기다림)
+chunk 트랜잭션이 max_lock_seconds를 넘으면 이후 chunk 크기를 절반으로 줄인다.
+
+진행 위치(단계, 마지막 id)는 chunk UPDATE와 같은 트랜잭션에서 todo_rollover_checkpoints에 기록하므로,
+중단된 실행은 같은 날짜로 다시 실행하면 이어서 진행하고 이미 끝난 날짜는 건너뛴다.
+
+변경된 사용자는 chunk마다 목록 버전 증가 / 목록 캐시 삭제 / 변경 알림(todos_changed)을 보낸다.
+버전 카운터(ETag)와 memory 캐시는 서버 프로세스 메모리에 있으므로 실행은 항상 서버 안에서 한다.
+- 서버 안의 스케줄러 (Settings.TODO_ROLLOVER_ENABLED)
+- CLI: 서버의 POST /todos/rollover를 호출 (Settings.OPS_TOKEN), 다른 프로세스에서 실행하면
+  서버의 ETag / memory 캐시가 이전 값을 유지해서 클라이언트가 다음 쓰기 전까지 rollover 결과를 보지 못함
+- CLI --offline: 이 프로세스에서 직접 실행, 서버가 꺼져 있을 때만 사용
+  (서버가 다시 시작되면 버전 epoch / memory 캐시가 새로 만들어지므로 이전 ETag와 겹치지 않음)
+
+    cd server
+    python -m nexlist.todos.rollover                    # 오늘 날짜로 실행 (이미 끝났으면 건너뜀)
+    python -m nexlist.todos.rollover --date 2026-10-18 --server http://localhost:8000
+    python -m nexlist.todos.rollover --restart          # 해당 날짜 checkpoint를 지우고 처음부터
+    python -m nexlist.todos.rollover --offline --batch-size 500
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from datetime import time as clock_time
+
+import httpx
+from sqlalchemy import delete, select, update
+from starlette.concurrency import run_in_threadpool
+
+from nexlist.config import settings
+from nexlist.db.database import SessionLocal
+from nexlist.db.routing import use_primary
+from nexlist.metrics import TODO_ROLLOVER_CHUNK_DURATION, TODO_ROLLOVER_ROWS
+
+from .cache import TodoListCache, get_todo_list_cache
+from .models import Todo, TodoRolloverCheckpoint
+from .service import todos_changed
+
+logger = logging.getLogger(__name__)
+
+# 실패한 실행을 같은 날 다시 시도하기 전 대기 시간
+RETRY_SECONDS = 60
+
+
+# 단계 -> (대상 조건, 변경 값)
+# : 조건에 변경 후 상태가 포함되지 않으므로 이미 처리된 행은 다시 대상이 되지 않음 (재실행해도 결과 동일)
+def promote_step(run_date: date):
+    return (Todo.today.isnot(True), Todo.is_done.isnot(True), Todo.due_date <= run_date), {"today": True}
+
+
+def clear_done_step(run_date: date):
+    return (Todo.today.is_(True), Todo.is_done.is_(True)), {"today": False}
+
+
+STEPS = {"promote": promote_step, "clear_done": clear_done_step}
+
+
+@dataclass
+class RolloverChunk:
+    updated: int
+    user_ids: set[int]
+    next_step: str | None  # None이면 실행 완료
+    next_id: int
+    elapsed: float
+
+
+@dataclass
+class RolloverResult:
+    run_date: date
+    skipped: bool = False  # 이미 끝난 날짜
+    chunks: int = 0
+    updated_rows: int = 0
+    user_ids: set[int] = field(default_factory=set)
+
+
+class TodoRollover:
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        steps: tuple[str, ...] = tuple(STEPS),
+        batch_size: int = 1000,
+        max_lock_seconds: float = 0.5,
+        pause_seconds: float = 0.0,
+        cache: TodoListCache | None = None,
+    ):
+        self.session_factory = session_factory
+        self.steps = steps
+        self.batch_size = batch_size
+        self.max_lock_seconds = max_lock_seconds
+        self.pause_seconds = pause_seconds
+        self.cache = cache
+
+    def load_checkpoint(self, run_date: date, restart: bool = False) -> TodoRolloverCheckpoint | None:
+        with self.session_factory() as db:
+            if restart:
+                db.execute(delete(TodoRolloverCheckpoint).where(TodoRolloverCheckpoint.run_date == run_date))
+                db.commit()
+                return None
+            return db.get(TodoRolloverCheckpoint, run_date)
+
+    def run_chunk(self, run_date: date, step: str, last_id: int, limit: int) -> RolloverChunk:
+        """ step의 last_id 이후 대상 행을 최대 limit개 변경하고 checkpoint를 같은 트랜잭션에서 갱신 """
+        started = time.perf_counter()
+        where, values = STEPS[step](run_date)
+        with self.session_factory() as db:
+            # 대상 조회도 primary에서 (replica 지연으로 범위를 건너뛰지 않도록)
+            use_primary(db)
+            rows = db.execute(
+                select(Todo.id, Todo.user_id).where(Todo.id > last_id, *where).order_by(Todo.id).limit(limit)
+            ).all()
+
+            updated = 0
+            next_step, next_id = step, last_id
+            if rows:
+                next_id = rows[-1].id
+                # 조회한 행만 조건을 다시 확인하며 변경 (조회 이후 사용자가 바꾼 행은 건너뜀)
+                # : 범위로 변경하면 조회 이후 조건을 만족하게 된 행도 바뀌는데 그 사용자는 user_ids에 없어 무효화되지 않음
+                #   (그런 행은 사용자의 쓰기로 이미 무효화되었고, 다음 실행에서 처리)
+                stmt = (
+                    update(Todo)
+                    .where(Todo.id.in_([row.id for row in rows]), *where)
+                    .values(**values)
+                    .execution_options(synchronize_session=False)
+                )
+                updated = db.execute(stmt).rowcount
+            if len(rows) < limit:
+                # 이 단계의 마지막 chunk
+                position = self.steps.index(step) + 1
+                next_step = self.steps[position] if position < len(self.steps) else None
+                next_id = 0
+
+            now = datetime.now()
+            checkpoint = db.get(TodoRolloverCheckpoint, run_date)
+            if checkpoint is None:
+                checkpoint = TodoRolloverCheckpoint(run_date=run_date, updated_rows=0, started_at=now)
+                db.add(checkpoint)
+            checkpoint.step = next_step or step
+            checkpoint.last_id = next_id
+            checkpoint.updated_rows += updated
+            checkpoint.updated_at = now
+            if next_step is None:
+                checkpoint.finished_at = now
+            db.commit()
+
+        return RolloverChunk(
+            updated=updated,
+            user_ids={row.user_id for row in rows},
+            next_step=next_step,
+            next_id=next_id,
+            elapsed=time.perf_counter() - started,
+        )
+
+    async def run(self, run_date: date | None = None, restart: bool = False) -> RolloverResult:
+        run_date = run_date or date.today()
+        result = RolloverResult(run_date)
+        checkpoint = await run_in_threadpool(self.load_checkpoint, run_date, restart)
+        if checkpoint is not None and checkpoint.finished_at is not None:
+            result.skipped = True
+            return result
+
+        if checkpoint is not None and checkpoint.step in self.steps:
+            step, last_id = checkpoint.step, checkpoint.last_id
+            logger.info("resuming todo rollover for %s at %s (id > %d)", run_date, step, last_id)
+        else:
+            step, last_id = self.steps[0], 0
+
+        limit = self.batch_size
+        while step is not None:
+            chunk = await run_in_threadpool(self.run_chunk, run_date, step, last_id, limit)
+            TODO_ROLLOVER_ROWS.labels(step).inc(chunk.updated)
+            TODO_ROLLOVER_CHUNK_DURATION.observe(chunk.elapsed)
+            result.chunks += 1
+            result.updated_rows += chunk.updated
+            result.user_ids |= chunk.user_ids
+            for user_id in sorted(chunk.user_ids):
+                await todos_changed(user_id, self.cache)
+
+            if chunk.elapsed > self.max_lock_seconds and limit > 1:
+                limit = max(limit // 2, 1)
+                logger.warning(
+                    "todo rollover chunk took %.3fs (> %.3fs), batch size -> %d",
+                    chunk.elapsed, self.max_lock_seconds, limit,
+                )
+
+            step, last_id = chunk.next_step, chunk.next_id
+            if step is not None and self.pause_seconds > 0:
+                await asyncio.sleep(self.pause_seconds)
+        return result
+
+
+def build_todo_rollover(**overrides) -> TodoRollover:
+    options = {
+        "steps": tuple(STEPS) if settings.TODO_ROLLOVER_CLEAR_DONE else ("promote",),
+        "batch_size": settings.TODO_ROLLOVER_BATCH_SIZE,
+        "max_lock_seconds": settings.TODO_ROLLOVER_MAX_LOCK_SECONDS,
+        "pause_seconds": settings.TODO_ROLLOVER_PAUSE_SECONDS,
+        "cache": get_todo_list_cache(),
+    }
+    return TodoRollover(**{**options, **overrides})
+
+
+class RolloverScheduler:
+    """ 매일 at(서버 로컬 시각)에 rollover 실행 (lifespan에서 시작/종료) """
+
+    def __init__(self, rollover: TodoRollover, at: clock_time):
+        self.rollover = rollover
+        self.at = at
+        self._task: asyncio.Task | None = None
+        # 예약 실행과 POST /todos/rollover 실행이 겹치지 않도록
+        self._lock = asyncio.Lock()
+
+    def next_run(self, now: datetime) -> datetime:
+        target = datetime.combine(now.date(), self.at)
+        return target if target > now else target + timedelta(days=1)
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        # 진행 중인 chunk 트랜잭션은 스레드에서 끝까지 실행되고, 다음 시작 시 checkpoint부터 이어서 진행
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        # 오늘 실행 시각이 이미 지났으면 바로 실행 (서버가 꺼져 있었거나 중단된 실행, 끝난 날짜는 건너뜀)
+        if datetime.now().time() >= self.at:
+            await self.run_day(date.today())
+        while True:
+            target = self.next_run(datetime.now())
+            await asyncio.sleep((target - datetime.now()).total_seconds())
+            await self.run_day(target.date())
+
+    async def run_now(self, run_date: date | None = None, restart: bool = False) -> RolloverResult:
+        """ 요청한 실행 (POST /todos/rollover): 진행 중인 실행이 있으면 끝난 뒤 실행 """
+        async with self._lock:
+            return await self.rollover.run(run_date, restart=restart)
+
+    async def run_day(self, run_date: date) -> RolloverResult | None:
+        # 실패하면 날짜가 바뀌기 전까지 RETRY_SECONDS마다 checkpoint부터 다시 시도
+        while True:
+            try:
+                async with self._lock:
+                    result = await self.rollover.run(run_date)
+            except Exception:
+                logger.exception("todo rollover for %s failed", run_date)
+            else:
+                if not result.skipped:
+                    logger.info(
+                        "todo rollover for %s: %d rows, %d users, %d chunks",
+                        run_date, result.updated_rows, len(result.user_ids), result.chunks,
+                    )
+                return result
+            if date.today() != run_date:
+                return None
+            await asyncio.sleep(RETRY_SECONDS)
+
+
+todo_rollover_scheduler = RolloverScheduler(build_todo_rollover(), clock_time.fromisoformat(settings.TODO_ROLLOVER_AT))
+
+
+def get_todo_rollover_scheduler() -> RolloverScheduler:
+    return todo_rollover_scheduler
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--date", type=date.fromisoformat, default=None, help="실행 날짜 YYYY-MM-DD (기본값: 오늘)")
+    parser.add_argument("--restart", action="store_true", help="해당 날짜 checkpoint를 지우고 처음부터 실행")
+    parser.add_argument(
+        "--server", default=settings.BASE_URL or "http://localhost:8000",
+        help="실행을 요청할 서버 (기본값: Settings.BASE_URL), 토큰은 NEXLIST_OPS_TOKEN",
+    )
+    parser.add_argument("--offline", action="store_true", help="서버 없이 이 프로세스에서 실행 (서버가 꺼져 있을 때만)")
+    parser.add_argument("--batch-size", type=int, default=settings.TODO_ROLLOVER_BATCH_SIZE, help="--offline chunk 최대 행 수")
+    parser.add_argument(
+        "--max-lock-seconds", type=float, default=settings.TODO_ROLLOVER_MAX_LOCK_SECONDS,
+        help="chunk 트랜잭션이 이보다 오래 걸리면 batch 크기를 절반으로",
+    )
+    parser.add_argument(
+        "--pause-seconds", type=float, default=settings.TODO_ROLLOVER_PAUSE_SECONDS, help="chunk 사이 대기 시간"
+    )
+    return parser.parse_args(argv)
+
+
+def request_rollover(args: argparse.Namespace) -> int:
+    """ 서버에 실행 요청 (rollover 전체가 끝날 때까지 응답을 기다림) """
+    token = settings.OPS_TOKEN
+    if not token:
+        print("NEXLIST_OPS_TOKEN is not set (the server's OPS_TOKEN)", file=sys.stderr)
+        return 2
+    params = {"restart": str(args.restart).lower()}
+    if args.date is not None:
+        params["date"] = args.date.isoformat()
+    try:
+        response = httpx.post(
+            f"{args.server.rstrip('/')}/todos/rollover",
+            params=params,
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=None,
+        )
+    except httpx.HTTPError as e:
+        print(f"could not reach {args.server}: {e} (use --offline only while the server is stopped)", file=sys.stderr)
+        return 1
+    if response.status_code != 200:
+        print(f"rollover request failed: {response.status_code} {response.text}", file=sys.stderr)
+        return 1
+
+    result = response.json()
+    if result["skipped"]:
+        print(f"rollover for {result['run_date']} already finished (use --restart to run again)")
+    else:
+        print(
+            f"rollover for {result['run_date']}: {result['updated_rows']} rows, "
+            f"{result['users']} users, {result['chunks']} chunks"
+        )
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if not args.offline:
+        return request_rollover(args)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    rollover = build_todo_rollover(
+        batch_size=args.batch_size, max_lock_seconds=args.max_lock_seconds, pause_seconds=args.pause_seconds
+    )
+
+    async def run() -> RolloverResult:
+        try:
+            return await rollover.run(args.date, restart=args.restart)
+        finally:
+            if rollover.cache is not None:
+                await rollover.cache.aclose()
+
+    result = asyncio.run(run())
+    if result.skipped:
+        print(f"rollover for {result.run_date} already finished (use --restart to run again)")
+    else:
+        print(
+            f"rollover for {result.run_date}: {result.updated_rows} rows, "
+            f"{len(result.user_ids)} users, {result.chunks} chunks"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
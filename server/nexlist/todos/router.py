@@ -1,32 +1,122 @@
+from datetime import date
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
 
-from nexlist.auth.dependencies import get_current_user
+from nexlist.auth.dependencies import get_current_user, require_ops_token
 from nexlist.auth.models import User
+from nexlist.cache.versions import etag_matches
+from nexlist.config import settings
+
 from .dependencies import get_todo_service
+from .rollover import RolloverScheduler, get_todo_rollover_scheduler
 from .schemas import (
+    TodoBatchCompletedState,
+    TodoBatchCreate,
+    TodoBatchResult,
+    TodoBatchTodayState,
+    TodoChangesResponse,
+    TodoClearJobResponse,
     TodoCompletedState,
+    TodoIds,
     TodoItem,
+    TodoListFilters,
     TodoResponse,
+    TodoRolloverResponse,
+    TodoStatsResponse,
     TodoTodayState,
 )
+from .search import SEARCH_MAX_LENGTH, SEARCH_MIN_LENGTH
+from .serializers import dump_todo_rows
 from .service import TodoService
 
 router = APIRouter(prefix="/todos", tags=["Todos"])
 
 
+# Todo 하나를 NDJSON 한 줄로 직렬화
+def to_ndjson_line(todo) -> str:
+    return TodoResponse.model_validate(todo).model_dump_json() + "\n"
+
+
+# 동기(Iterator) / 비동기(AsyncIterator) 스트림을 NDJSON 본문으로 변환
+def ndjson_stream(todos):
+    if hasattr(todos, "__aiter__"):
+        async def lines():
+            async for todo in todos:
+                yield to_ndjson_line(todo)
+        return lines()
+    return (to_ndjson_line(todo) for todo in todos)
+
+
 # 할 일 추가하기
 @router.post(
     "/",
     response_model=TodoResponse,
     status_code=status.HTTP_201_CREATED
 )
-def create_todo_item(
+async def create_todo_item(
     todo: TodoItem,
     service: TodoService = Depends(get_todo_service),
     user: User = Depends(get_current_user)
 ):
-    return service.create_todo(todo, user)
+    return await service.create_todo(todo, user)
+
+
+# 배치: 여러 할 일 한 번에 추가하기
+# : /batch 경로는 /{id} 경로보다 먼저 등록해야 함
+@router.post(
+    "/batch",
+    response_model=list[TodoResponse],
+    status_code=status.HTTP_201_CREATED
+)
+async def create_todo_items(
+    batch: TodoBatchCreate,
+    service: TodoService = Depends(get_todo_service),
+    user: User = Depends(get_current_user)
+):
+    return await service.create_todos(batch, user)
+
+
+# 배치: 완료 상태 일괄 변경하기
+@router.put(
+    "/batch/completed",
+    response_model=list[TodoBatchResult],
+    status_code=status.HTTP_200_OK
+)
+async def update_todos_completed_state(
+    update: TodoBatchCompletedState,
+    service: TodoService = Depends(get_todo_service),
+    user: User = Depends(get_current_user)
+):
+    return await service.update_completed_state_for_ids(update, user)
+
+
+# 배치: today 상태 일괄 변경하기
+@router.put(
+    "/batch/move",
+    response_model=list[TodoBatchResult],
+    status_code=status.HTTP_200_OK
+)
+async def update_todos_today_state(
+    update: TodoBatchTodayState,
+    service: TodoService = Depends(get_todo_service),
+    user: User = Depends(get_current_user)
+):
+    return await service.update_today_state_for_ids(update, user)
+
+
+# 배치: 여러 할 일 삭제하기 (DELETE는 요청 본문을 보장하지 않으므로 POST 사용)
+@router.post(
+    "/batch/delete",
+    response_model=list[TodoBatchResult],
+    status_code=status.HTTP_200_OK
+)
+async def delete_todos(
+    batch: TodoIds,
+    service: TodoService = Depends(get_todo_service),
+    user: User = Depends(get_current_user)
+):
+    return await service.remove_todos_by_ids(batch, user)
 
 
 # 할 일 목록 불러오기
@@ -35,15 +125,153 @@ def create_todo_item(
     response_model=list[TodoResponse],
     status_code=status.HTTP_200_OK
 )
-def read_todo_list(
+async def read_todo_list(
+    request: Request,
+    response: Response,
     service: TodoService = Depends(get_todo_service),
     user: User = Depends(get_current_user),
     today: bool | None = Query(
         default=None,
         description="오늘 할 일만: true, 오늘 할 일이 아닌 것만: false, 전체: 생략"
-    )
+    ),
+    cursor: int | None = Query(
+        default=None,
+        description="이전 페이지 응답의 X-Next-Cursor 값. id 오름차순으로 이 cursor 이후의 todo부터 반환"
+    ),
+    limit: int | None = Query(
+        default=None, ge=1, le=1000,
+        description="페이지 크기. 생략하면 cursor 이후 전체 반환"
+    ),
+    stream: bool = Query(
+        default=False,
+        description="true: application/x-ndjson 스트리밍 응답 (limit 무시)"
+    ),
+    due_before: date | None = Query(
+        default=None,
+        description="마감일이 이 날짜보다 이전인 todo만 (해당 날짜 미포함, 마감일 없는 todo 제외)"
+    ),
+    due_after: date | None = Query(
+        default=None,
+        description="마감일이 이 날짜보다 이후인 todo만 (해당 날짜 미포함, 마감일 없는 todo 제외)"
+    ),
+    overdue: bool = Query(
+        default=False,
+        description="true: 마감일이 오늘보다 이전이고 완료하지 않은 todo만"
+    ),
+    is_done: bool | None = Query(
+        default=None,
+        description="완료한 todo만: true, 완료하지 않은 todo만: false, 전체: 생략"
+    ),
 ):
-    return service.get_all_todos(user, today)
+    filters = TodoListFilters(due_before=due_before, due_after=due_after, overdue=overdue, is_done=is_done)
+
+    # 조건부 GET: 목록이 바뀌지 않았으면 todos 테이블을 조회하지 않고 304
+    etag = service.get_list_etag(user, filters)
+    cache_headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("If-None-Match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    if stream:
+        todos = await service.stream_todos(user, today, cursor, filters)
+        return StreamingResponse(ndjson_stream(todos), media_type="application/x-ndjson", headers=cache_headers)
+
+    if settings.TODO_FAST_JSON:
+        # 필요한 컬럼만 조회해서 바로 JSON 바이트로 응답 (ORM 객체 생성 / response_model 검증 생략)
+        body, next_cursor = await service.get_todo_list_json(user, today, cursor, limit, filters)
+        fast_response = Response(content=body, media_type="application/json", headers=cache_headers)
+        if next_cursor is not None:
+            fast_response.headers["X-Next-Cursor"] = str(next_cursor)
+        return fast_response
+
+    todos, next_cursor = await service.get_todo_page(user, today, cursor, limit, filters)
+    response.headers.update(cache_headers)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    return todos
+
+
+# 증분 동기화: since 이후 변경된 todo / 삭제된 todo id와 다음 since 값
+# : /changes 경로는 /{id} 경로보다 먼저 등록해야 함
+@router.get(
+    "/changes",
+    response_model=TodoChangesResponse,
+    status_code=status.HTTP_200_OK,
+    responses={status.HTTP_410_GONE: {"description": "since가 너무 오래됨, 전체 목록을 다시 받아야 함"}}
+)
+async def read_todo_changes(
+    service: TodoService = Depends(get_todo_service),
+    user: User = Depends(get_current_user),
+    since: int | None = Query(
+        default=None, ge=0,
+        description="이전 응답의 cursor 값. 생략하면 전체 목록(deleted는 빈 목록)과 cursor 반환"
+    ),
+):
+    return await service.get_todo_changes(user, since)
+
+
+# 할 일 통계 (전체 / 완료 / 미완료 / 오늘 / 마감 지남 개수)
+# : /stats 경로는 /{id} 경로보다 먼저 등록해야 함
+@router.get(
+    "/stats",
+    response_model=TodoStatsResponse,
+    status_code=status.HTTP_200_OK
+)
+async def read_todo_stats(
+    service: TodoService = Depends(get_todo_service),
+    user: User = Depends(get_current_user)
+):
+    return await service.get_todo_stats(user)
+
+
+# 할 일 검색 (task 부분 일치, 관련도 순)
+# : /search 경로는 /{id} 경로보다 먼저 등록해야 함
+@router.get(
+    "/search",
+    response_model=list[TodoResponse],
+    status_code=status.HTTP_200_OK
+)
+async def search_todo_list(
+    service: TodoService = Depends(get_todo_service),
+    user: User = Depends(get_current_user),
+    q: str = Query(
+        min_length=SEARCH_MIN_LENGTH, max_length=SEARCH_MAX_LENGTH,
+        description="검색어. 공백을 포함한 전체를 하나의 구로 검색"
+    ),
+    cursor: int = Query(
+        default=0, ge=0,
+        description="이전 페이지 응답의 X-Next-Cursor 값"
+    ),
+    limit: int = Query(default=20, ge=1, le=100, description="페이지 크기"),
+):
+    rows, next_cursor = await service.search_todo_rows(user, q, limit, cursor)
+    response = Response(content=dump_todo_rows(rows), media_type="application/json")
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    return response
+
+
+# 운영: rollover 실행 (today 플래그 갱신), 버전 / memory 캐시가 이 서버 프로세스에 있으므로 CLI도 여기로 요청
+# : Settings.OPS_TOKEN Bearer 토큰 필요, 전체 실행이 끝난 뒤 응답
+@router.post(
+    "/rollover",
+    response_model=TodoRolloverResponse,
+    status_code=status.HTTP_200_OK,
+    include_in_schema=False,
+    dependencies=[Depends(require_ops_token)]
+)
+async def run_todo_rollover(
+    scheduler: RolloverScheduler = Depends(get_todo_rollover_scheduler),
+    run_date: date | None = Query(default=None, alias="date", description="실행 날짜 (기본값: 오늘)"),
+    restart: bool = Query(default=False, description="true: 해당 날짜 checkpoint를 지우고 처음부터"),
+):
+    result = await scheduler.run_now(run_date, restart=restart)
+    return TodoRolloverResponse(
+        run_date=result.run_date,
+        skipped=result.skipped,
+        chunks=result.chunks,
+        updated_rows=result.updated_rows,
+        users=len(result.user_ids),
+    )
 
 
 # 하나의 todo만 불러오기
@@ -52,24 +280,47 @@ def read_todo_list(
     response_model=TodoResponse,
     status_code=status.HTTP_200_OK
 )
-def read_todo(
+async def read_todo(
     id: int,
     service: TodoService = Depends(get_todo_service),
     user: User = Depends(get_current_user)
 ):
-    return service.get_todo_by_id(id, user)
+    return await service.get_todo_by_id(id, user)
 
 
 # 리스트 초기화
+# : 목록이 크면 일부만 삭제하고 나머지는 백그라운드에서 삭제 (202 + Location: 작업 상태 URL)
 @router.delete(
     "/",
-    status_code=status.HTTP_204_NO_CONTENT
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={status.HTTP_202_ACCEPTED: {"model": TodoClearJobResponse, "description": "백그라운드 삭제 진행 중"}}
+)
+async def delete_todo_list(
+    service: TodoService = Depends(get_todo_service),
+    user: User = Depends(get_current_user)
+):
+    job = await service.remove_all_todos(user)
+    if job is None:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=TodoClearJobResponse.model_validate(job).model_dump(mode="json"),
+        headers={"Location": f"/todos/clear-jobs/{job.id}"},
+    )
+
+
+# 백그라운드 삭제 작업 상태
+@router.get(
+    "/clear-jobs/{job_id}",
+    response_model=TodoClearJobResponse,
+    status_code=status.HTTP_200_OK
 )
-def delete_todo_list(
+async def read_todo_clear_job(
+    job_id: str,
     service: TodoService = Depends(get_todo_service),
     user: User = Depends(get_current_user)
 ):
-    service.remove_all_todos(user)
+    return await service.get_clear_job(job_id, user)
 
 
 # 단일 아이템 삭제
@@ -77,12 +328,12 @@ def delete_todo_list(
     "/{id}",
     status_code=status.HTTP_204_NO_CONTENT
 )
-def delete_todo(
+async def delete_todo(
     id: int,
     service: TodoService = Depends(get_todo_service),
     user: User = Depends(get_current_user)
 ):
-    service.remove_todo_by_id(id, user)
+    await service.remove_todo_by_id(id, user)
 
 
 # todo 내용 변경하기
@@ -91,13 +342,13 @@ def delete_todo(
     response_model=TodoResponse,
     status_code=status.HTTP_200_OK
 )
-def update_todo(
+async def update_todo(
     id: int,
     todo: TodoItem,
     service: TodoService = Depends(get_todo_service),
     user: User = Depends(get_current_user)
 ):
-    return service.update_todo_by_id(todo, id, user)
+    return await service.update_todo_by_id(todo, id, user)
 
 
 # todo 완료 상태 변경하기
@@ -106,13 +357,13 @@ def update_todo(
     response_model=TodoResponse,
     status_code=status.HTTP_200_OK
 )
-def update_todo_completed_state(
+async def update_todo_completed_state(
     id: int,
     update: TodoCompletedState,
     service: TodoService = Depends(get_todo_service),
     user: User = Depends(get_current_user)
 ):
-    return service.update_todo_completed_state_by_id(id, update, user)
+    return await service.update_todo_completed_state_by_id(id, update, user)
 
 
 # today: <boolean> 전환하기
@@ -121,10 +372,10 @@ def update_todo_completed_state(
     response_model=TodoResponse,
     status_code=status.HTTP_200_OK
 )
-def update_todo_today_state(
+async def update_todo_today_state(
     id: int,
     update: TodoTodayState,
     service: TodoService = Depends(get_todo_service),
     user: User = Depends(get_current_user)
 ):
-    return service.update_todo_today_state_by_id(id, update, user)
+    return await service.update_todo_today_state_by_id(id, update, user)
@@ -1,8 +1,11 @@
 # 요청 & 응답 데이터 스키마
 
-from datetime import date
+from datetime import date, datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+# 배치 요청 한 번에 처리할 수 있는 최대 항목 수
+BATCH_MAX_ITEMS = 500
 
 
 # Request
@@ -22,6 +25,44 @@ class TodoTodayState(BaseModel):
     today: bool
 
 
+# Request: 여러 todo 한 번에 추가
+class TodoBatchCreate(BaseModel):
+    items: list[TodoItem] = Field(min_length=1, max_length=BATCH_MAX_ITEMS)
+
+
+# Request: 여러 todo에 대한 일괄 처리 (삭제)
+class TodoIds(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=BATCH_MAX_ITEMS)
+
+
+# Request: 여러 todo의 완료 상태 일괄 변경
+class TodoBatchCompletedState(TodoIds):
+    is_done: bool
+
+
+# Request: 여러 todo의 'today' 상태 일괄 변경
+class TodoBatchTodayState(TodoIds):
+    today: bool
+
+
+# 목록 조회 필터 (GET /todos/ 쿼리 파라미터, SQL WHERE로 변환)
+# : due_before / due_after는 해당 날짜를 포함하지 않음, overdue는 조회 시점 날짜 기준 마감 지남 + 미완료
+class TodoListFilters(BaseModel):
+    due_before: date | None = None
+    due_after: date | None = None
+    overdue: bool = False
+    is_done: bool | None = None
+
+    def is_empty(self) -> bool:
+        return self == TodoListFilters()
+
+
+# Response: 배치 요청의 id별 처리 결과 (ok=False: 존재하지 않거나 다른 사용자의 todo)
+class TodoBatchResult(BaseModel):
+    id: int
+    ok: bool
+
+
 # Response
 class TodoResponse(BaseModel):
     id: int
@@ -32,3 +73,43 @@ class TodoResponse(BaseModel):
 
     class Config:
         from_attributes = True  # (deprecated) orm_mode
+
+
+# Response: DELETE /todos/ 백그라운드 삭제 작업 (202) / GET /todos/clear-jobs/{id}
+# : status = running / done / failed, deleted = 지금까지 삭제한 todo 수
+class TodoClearJobResponse(BaseModel):
+    id: str
+    status: str
+    deleted: int
+    started_at: datetime
+    finished_at: datetime | None
+
+    class Config:
+        from_attributes = True
+
+
+# Response: GET /todos/changes
+# : deleted = cursor 이후 삭제된 todo id (todos보다 먼저 적용), cursor = 다음 요청의 since 값
+class TodoChangesResponse(BaseModel):
+    todos: list[TodoResponse]
+    deleted: list[int]
+    cursor: int
+
+
+# Response: POST /todos/rollover (운영), users = today 플래그가 바뀐 사용자 수
+class TodoRolloverResponse(BaseModel):
+    run_date: date
+    skipped: bool
+    chunks: int
+    updated_rows: int
+    users: int
+
+
+# Response: GET /todos/stats
+# : open = total - done, today = today 플래그가 켜진 todo(완료 포함), overdue = 마감일이 지났는데 완료하지 않은 todo
+class TodoStatsResponse(BaseModel):
+    total: int
+    done: int
+    open: int
+    today: int
+    overdue: int
@@ -0,0 +1,158 @@
+# Todo 검색 (GET /todos/search)
+# : MySQL은 todos.task의 FULLTEXT(ngram parser) 인덱스로 검색 (TodoRepository.search_todo_rows)
+# : 그 외 DB(SQLite 개발 환경 / 테스트)는 프로세스 메모리의 n-gram 역색인으로 검색
+#   - 사용자별로 첫 검색 때 (id, task)만 읽어서 색인하고, 이후 쓰기는 TodoService가 색인에 바로 반영
+#   - 검색 비용은 목록 크기가 아니라 검색어 n-gram의 posting 크기에 비례
+# : 두 방식 모두 검색어를 하나의 구(phrase)로 취급하고 (부분 문자열 일치), 2글자 이상만 허용
+
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+
+from nexlist.config import settings
+from nexlist.db.database import PRIMARY_DB_URL
+
+# MySQL ngram_token_size 기본값과 같은 bigram
+NGRAM_SIZE = 2
+SEARCH_MIN_LENGTH = NGRAM_SIZE
+SEARCH_MAX_LENGTH = 100
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    """ 전각/반각 통일(NFKC), 대소문자 무시, 연속 공백 하나로 """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text).casefold()).strip()
+
+
+def ngrams(text: str) -> set[str]:
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+def boolean_mode_phrase(query: str) -> str:
+    """ MATCH ... AGAINST (... IN BOOLEAN MODE)용 구 검색어: 연산자로 해석되는 큰따옴표 제거 """
+    return '"' + normalize(query.replace('"', " ")) + '"'
+
+
+class UserIndex:
+    """ 사용자 한 명의 역색인: n-gram -> todo id 집합 """
+
+    __slots__ = ("texts", "postings")
+
+    def __init__(self):
+        self.texts: dict[int, str] = {}
+        self.postings: dict[str, set[int]] = {}
+
+    def add(self, todo_id: int, task: str | None) -> None:
+        self.remove(todo_id)
+        text = normalize(task or "")
+        self.texts[todo_id] = text
+        for gram in ngrams(text):
+            self.postings.setdefault(gram, set()).add(todo_id)
+
+    def remove(self, todo_id: int) -> None:
+        text = self.texts.pop(todo_id, None)
+        if text is None:
+            return
+        for gram in ngrams(text):
+            ids = self.postings.get(gram)
+            if ids is not None:
+                ids.discard(todo_id)
+                if not ids:
+                    del self.postings[gram]
+
+    def search(self, query: str) -> list[int]:
+        """ 관련도 순 todo id 목록: 일치 횟수가 많을수록, task가 짧을수록, 최근(id가 클수록) 앞 """
+        phrase = normalize(query)
+        grams = ngrams(phrase)
+        if not grams:
+            return []
+
+        # 가장 짧은 posting부터 교집합
+        candidates = None
+        for gram in sorted(grams, key=lambda gram: len(self.postings.get(gram, ()))):
+            ids = self.postings.get(gram)
+            if not ids:
+                return []
+            candidates = set(ids) if candidates is None else candidates & ids
+            if not candidates:
+                return []
+
+        # bigram이 모두 있어도 연속으로 나타나지 않을 수 있으므로 구 일치 확인
+        scored = []
+        for todo_id in candidates:
+            text = self.texts[todo_id]
+            count = text.count(phrase)
+            if count:
+                scored.append((-count, len(text), -todo_id))
+        scored.sort()
+        return [-todo_id for _, _, todo_id in scored]
+
+
+class NgramSearchIndex:
+    """ 사용자별 UserIndex를 최대 max_users명까지 보관 (LRU). 단일 프로세스 배포 기준 """
+
+    def __init__(self, max_users: int):
+        self.max_users = max_users
+        self._users: OrderedDict[int, UserIndex] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> UserIndex | None:
+        with self._lock:
+            index = self._users.get(user_id)
+            if index is not None:
+                self._users.move_to_end(user_id)
+            return index
+
+    def build(self, rows) -> UserIndex:
+        index = UserIndex()
+        for row in rows:
+            index.add(row.id, row.task)
+        return index
+
+    def store(self, user_id: int, index: UserIndex) -> None:
+        if self.max_users <= 0:
+            return
+        with self._lock:
+            self._users[user_id] = index
+            self._users.move_to_end(user_id)
+            while len(self._users) > self.max_users:
+                self._users.popitem(last=False)
+
+    # 쓰기 반영: 아직 색인하지 않은 사용자는 다음 검색 때 DB에서 읽으므로 무시
+    def add(self, user_id: int, todo_id: int, task: str | None) -> None:
+        with self._lock:
+            index = self._users.get(user_id)
+            if index is not None:
+                index.add(todo_id, task)
+
+    def remove(self, user_id: int, todo_ids: list[int]) -> None:
+        with self._lock:
+            index = self._users.get(user_id)
+            if index is not None:
+                for todo_id in todo_ids:
+                    index.remove(todo_id)
+
+    def drop(self, user_id: int) -> None:
+        with self._lock:
+            self._users.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._users.clear()
+
+
+def use_fulltext() -> bool:
+    backend = settings.TODO_SEARCH_BACKEND
+    if backend == "auto":
+        return PRIMARY_DB_URL.startswith("mysql")
+    return backend == "fulltext"
+
+
+todo_search_index = NgramSearchIndex(settings.TODO_SEARCH_INDEX_USERS)
+
+
+def get_todo_search_index() -> NgramSearchIndex | None:
+    """ None이면 MySQL FULLTEXT 검색 """
+    return None if use_fulltext() else todo_search_index
@@ -0,0 +1,10 @@
+# 목록 응답 빠른 직렬화
+# : 프로젝션한 Row를 response_model 검증(from_attributes) 없이 orjson으로 바로 JSON 바이트로 변환
+# : 키 순서 / 날짜 형식(YYYY-MM-DD) / 공백 없는 출력이 기존 TodoResponse 응답과 같음
+
+import orjson
+from sqlalchemy import Row
+
+
+def dump_todo_rows(rows: list[Row]) -> bytes:
+    return orjson.dumps([row._asdict() for row in rows])
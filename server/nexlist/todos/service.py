@@ -1,58 +1,345 @@
+from datetime import date, timedelta
+
 from fastapi import HTTPException
+from sqlalchemy import Row
 
 from nexlist.auth.models import User
+from nexlist.cache.memory import TTLCache
+from nexlist.cache.versions import versions
+from nexlist.config import settings
+from nexlist.events.broker import broker
 
+from .cache import TodoListCache
+from .changes import from_cursor, to_cursor, utcnow
+from .clear import TodoClearJob, TodoClearJobs
 from .models import Todo
 from .repository import TodoRepositoryInterface
 from .schemas import *
+from .search import NgramSearchIndex, UserIndex
+from .serializers import dump_todo_rows
+
+# 버전 카운터(ETag) scope
+TODOS_SCOPE = "todos"
+
+
+# 사용자의 todo가 바뀐 뒤 호출: 목록 버전 증가, 목록 캐시 삭제, 변경 알림
+# : 요청 밖에서 여러 사용자의 todo를 바꾸는 작업(rollover)도 사용
+async def todos_changed(user_id: int, cache: TodoListCache | None) -> None:
+    versions.bump(TODOS_SCOPE, user_id)
+    if cache is not None:
+        await cache.invalidate(user_id)
+    broker.publish(user_id, TODOS_SCOPE, versions.etag(TODOS_SCOPE, user_id))
 
 
 class TodoService:
-    def __init__(self, repository: TodoRepositoryInterface):
+    def __init__(
+        self,
+        repository: TodoRepositoryInterface,
+        cache: TodoListCache | None = None,
+        search_index: NgramSearchIndex | None = None,
+        stats_cache: TTLCache | None = None,
+        clear_jobs: TodoClearJobs | None = None,
+    ):
         self.repository = repository
+        self.cache = cache
+        # None이면 DB(MySQL FULLTEXT)로 검색
+        self.search_index = search_index
+        self.stats_cache = stats_cache
+        # None이면 목록 전체를 요청 안에서 삭제
+        self.clear_jobs = clear_jobs
+
+
+    # 목록 조회용 ETag: 조회 쿼리보다 먼저 읽어야 함
+    # (조회 도중 쓰기가 일어나면 최신 데이터에 이전 ETag가 붙을 뿐, 오래된 데이터에 최신 ETag가 붙지는 않음)
+    # : overdue 필터 결과는 쓰기가 없어도 날짜가 바뀌면 달라지므로 ETag에 날짜 포함
+    def get_list_etag(self, user: User, filters: TodoListFilters | None = None) -> str:
+        etag = versions.etag(TODOS_SCOPE, user.id)
+        if filters is not None and filters.overdue:
+            etag = f'{etag[:-1]}-{date.today().isoformat()}"'
+        return etag
+
+
+    # 최근에 쓰기가 있었던 사용자의 조회는 primary에서
+    # : 버전(ETag)은 쓰기 직후 이미 올라가 있으므로 replica 지연 중 읽은 본문에 최신 ETag가 붙으면
+    #   클라이언트가 다음 쓰기 전까지 304로 오래된 목록을 계속 사용하게 됨 (통계 / 검색 색인 캐시도 같은 버전 키 사용)
+    async def _read_your_writes(self, user: User):
+        if versions.changed_within(TODOS_SCOPE, user.id, settings.DB_REPLICA_STICKY_SECONDS):
+            await self.repository.use_primary()
+
+
+    # 쓰기 이후 호출: 사용자의 todo 목록 버전 증가, 목록 캐시 삭제
+    async def _changed(self, user: User):
+        await todos_changed(user.id, self.cache)
+
+
+    async def create_todo(self, todo: TodoItem, user: User) -> Todo:
+        new_todo = await self.repository.create_todo(todo, user.id)
+        if self.search_index is not None:
+            self.search_index.add(user.id, new_todo.id, new_todo.task)
+        await self._changed(user)
+        return new_todo
+
+
+    async def create_todos(self, batch: TodoBatchCreate, user: User) -> list[Todo]:
+        new_todos = await self.repository.create_todos(batch.items, user.id)
+        if self.search_index is not None:
+            for new_todo in new_todos:
+                self.search_index.add(user.id, new_todo.id, new_todo.task)
+        await self._changed(user)
+        return new_todos
+
+
+    async def get_all_todos(self, user: User, today: bool | None) -> list[Todo]:
+        await self._read_your_writes(user)
+        return await self.repository.get_all_todos(user.id, today)
+
+
+    # keyset 페이지네이션: (현재 페이지, 다음 페이지 cursor) 반환. 마지막 페이지면 cursor는 None
+    async def get_todo_page(
+        self, user: User, today: bool | None, cursor: int | None = None, limit: int | None = None,
+        filters: TodoListFilters | None = None,
+    ) -> tuple[list[Todo], int | None]:
+        return await self._page(self.repository.get_all_todos, user, today, cursor, limit, filters)
+
+
+    # get_todo_page와 같지만 ORM 객체 대신 목록 응답 컬럼만 담은 Row 반환 (빠른 JSON 경로)
+    async def get_todo_row_page(
+        self, user: User, today: bool | None, cursor: int | None = None, limit: int | None = None,
+        filters: TodoListFilters | None = None,
+    ) -> tuple[list[Row], int | None]:
+        return await self._page(self.repository.get_todo_rows, user, today, cursor, limit, filters)
+
+
+    # 목록 JSON 바이트와 다음 페이지 cursor (빠른 JSON 경로)
+    # : 전체 목록(cursor / limit / 필터 없음)은 목록 캐시를 먼저 확인하고, 없으면 primary에서 조회 후 저장
+    #   (replica 지연 중 읽은 목록이 TTL 동안 캐시에 남지 않도록)
+    async def get_todo_list_json(
+        self, user: User, today: bool | None, cursor: int | None = None, limit: int | None = None,
+        filters: TodoListFilters | None = None,
+    ) -> tuple[bytes, int | None]:
+        filtered = filters is not None and not filters.is_empty()
+        if self.cache is None or cursor is not None or limit is not None or filtered:
+            rows, next_cursor = await self.get_todo_row_page(user, today, cursor, limit, filters)
+            return dump_todo_rows(rows), next_cursor
+
+        # 조회 전에 읽은 세대에 저장: 조회 도중 (다른 워커를 포함한) 쓰기가 세대를 올리면 저장한 목록은 조회되지 않음
+        generation = await self.cache.generation(user.id)
+        cached = await self.cache.get(user.id, today, generation)
+        if cached is not None:
+            return cached, None
+
+        await self.repository.use_primary()
+        body = dump_todo_rows(await self.repository.get_todo_rows(user.id, today))
+        await self.cache.set(user.id, today, body, generation)
+        return body, None
+
 
+    async def _page(
+        self, fetch, user: User, today: bool | None, cursor: int | None, limit: int | None,
+        filters: TodoListFilters | None = None,
+    ):
+        await self._read_your_writes(user)
+        if limit is None:
+            return await fetch(user.id, today, cursor, filters=filters), None
 
-    def create_todo(self, todo: TodoItem, user: User) -> Todo:
-        return self.repository.create_todo(todo, user.id)
+        # 한 행을 더 조회해서 다음 페이지 존재 여부 판단
+        todos = await fetch(user.id, today, cursor, limit + 1, filters=filters)
+        if len(todos) > limit:
+            todos = todos[:limit]
+            return todos, todos[-1].id
+        return todos, None
 
 
-    def get_all_todos(self, user: User, today: bool | None) -> list[Todo]:
-        return self.repository.get_all_todos(user.id, today)
+    # 통계: 다음 쓰기(버전 증가) 전까지, 같은 날짜 안에서는 캐시된 값 사용
+    # : 버전을 조회 전에 읽으므로 조회 도중 쓰기가 일어나면 이전 버전 키에 저장될 뿐 최신 키를 덮어쓰지 않음
+    async def get_todo_stats(self, user: User) -> TodoStatsResponse:
+        today = date.today()
+        key = (user.id, versions.get(TODOS_SCOPE, user.id), today)
+        if self.stats_cache is not None:
+            stats = self.stats_cache.get(key)
+            if stats is not None:
+                return stats
 
+        await self._read_your_writes(user)
+        row = await self.repository.get_todo_stats(user.id, today)
+        stats = TodoStatsResponse(
+            total=row.total, done=row.done, open=row.total - row.done, today=row.today, overdue=row.overdue
+        )
+        if self.stats_cache is not None:
+            self.stats_cache.set(key, stats)
+        return stats
 
-    def get_todo_by_id(self, id: int, user: User) -> Todo:
-        todo = self.repository.get_todo_by_id(id, user.id)
+
+    # 검색: 관련도 순 한 페이지와 다음 페이지 cursor(offset). 마지막 페이지면 cursor는 None
+    async def search_todo_rows(self, user: User, query: str, limit: int, offset: int = 0) -> tuple[list[Row], int | None]:
+        if self.search_index is None:
+            # 한 행을 더 조회해서 다음 페이지 존재 여부 판단
+            rows = await self.repository.search_todo_rows(user.id, query, limit + 1, offset)
+            if len(rows) > limit:
+                return rows[:limit], offset + limit
+            return rows, None
+
+        ranked = (await self._user_search_index(user)).search(query)
+        page = ranked[offset:offset + limit]
+        rows = await self.repository.get_todo_rows_by_ids(page, user.id) if page else []
+        by_id = {row.id: row for row in rows}
+        rows = [by_id[todo_id] for todo_id in page if todo_id in by_id]
+        return rows, offset + limit if len(ranked) > offset + limit else None
+
+
+    # 사용자의 메모리 검색 색인: 없으면 (id, task)를 읽어서 생성
+    # : 읽는 도중 쓰기가 커밋되면 그 변경이 빠진 색인일 수 있으므로 버전이 그대로일 때만 보관
+    async def _user_search_index(self, user: User) -> UserIndex:
+        index = self.search_index.get(user.id)
+        if index is None:
+            version = versions.get(TODOS_SCOPE, user.id)
+            await self._read_your_writes(user)
+            index = self.search_index.build(await self.repository.get_todo_texts(user.id))
+            if versions.get(TODOS_SCOPE, user.id) == version:
+                self.search_index.store(user.id, index)
+        return index
+
+
+    # 증분 동기화: since(cursor) 이후 변경/삭제된 todo와 다음 cursor (since가 None이면 전체 목록)
+    async def get_todo_changes(self, user: User, since: int | None) -> TodoChangesResponse:
+        now = utcnow()
+        deleted_ids = []
+        if since is None:
+            rows = await self.repository.get_changed_todo_rows(user.id, None)
+        else:
+            since_at = from_cursor(since)
+            # 보관 기간이 지난 tombstone은 정리되었을 수 있으므로 삭제를 빠짐없이 전달할 수 없음
+            if since_at < now - timedelta(days=settings.TODO_TOMBSTONE_RETENTION_DAYS):
+                raise HTTPException(status_code=410, detail="Cursor expired, fetch the full list again")
+            # 삭제를 먼저 조회: 두 조회 사이에 삭제된 todo는 todos에서 빠지고 tombstone은 다음 동기화에서 전달
+            # (순서가 반대면 이미 전달한 삭제 뒤에 같은 todo를 다시 upsert하게 됨)
+            deleted_ids = await self.repository.get_deleted_todo_ids(user.id, since_at)
+            rows = await self.repository.get_changed_todo_rows(user.id, since_at)
+
+        cursor = to_cursor(now - timedelta(seconds=settings.TODO_CHANGES_SETTLE_SECONDS))
+        if since is not None:
+            cursor = max(cursor, since)
+        return TodoChangesResponse(
+            todos=[TodoResponse.model_validate(row) for row in rows], deleted=deleted_ids, cursor=cursor
+        )
+
+
+    # 스트리밍 조회: 동기 모드는 Iterator, 비동기 모드는 AsyncIterator 반환
+    async def stream_todos(
+        self, user: User, today: bool | None, cursor: int | None = None, filters: TodoListFilters | None = None
+    ):
+        await self._read_your_writes(user)
+        return self.repository.iter_todos(user.id, today, cursor, filters)
+
+
+    async def get_todo_by_id(self, id: int, user: User) -> Todo:
+        todo = await self.repository.get_todo_by_id(id, user.id)
         if todo is None:
             raise HTTPException(status_code=404, detail="Todo not found")
         return todo
 
 
-    def remove_all_todos(self, user: User):
-        self.repository.remove_all_todos(user.id)
+    # 목록 전체 삭제: batch_size개씩 나눠서 삭제 (chunk마다 커밋해서 잠금 유지 시간을 목록 크기와 무관하게 제한)
+    # : inline_max_rows까지는 요청 안에서 삭제하고 None 반환
+    #   남은 행이 있으면 백그라운드 작업으로 넘기고 작업 반환 (진행 중인 작업이 있으면 그 작업 반환)
+    async def remove_all_todos(self, user: User) -> TodoClearJob | None:
+        if self.clear_jobs is not None:
+            running = self.clear_jobs.running(user.id)
+            if running is not None:
+                return running
+
+        max_id = await self.repository.get_max_todo_id(user.id)
+        if max_id is None:
+            return None
 
+        async def removed(todo_ids: list[int]):
+            if self.search_index is not None:
+                self.search_index.remove(user.id, todo_ids)
+            await self._changed(user)
 
-    def remove_todo_by_id(self, id: int, user: User):
-        deleted_todo = self.repository.remove_todo_by_id(id, user.id)
+        batch_size = self.clear_jobs.batch_size if self.clear_jobs is not None else settings.TODO_CLEAR_BATCH_SIZE
+        deleted_ids = []
+        while True:
+            chunk = await self.repository.remove_todo_chunk(user.id, max_id, batch_size)
+            deleted_ids.extend(chunk)
+            if len(chunk) < batch_size:
+                await removed(deleted_ids)
+                return None
+            if self.clear_jobs is not None and len(deleted_ids) >= self.clear_jobs.inline_max_rows:
+                await removed(deleted_ids)
+                return self.clear_jobs.start(user.id, max_id, len(deleted_ids), removed)
+
+
+    async def get_clear_job(self, job_id: str, user: User) -> TodoClearJob:
+        job = self.clear_jobs.get(job_id, user.id) if self.clear_jobs is not None else None
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return job
+
+
+    async def remove_todo_by_id(self, id: int, user: User):
+        deleted_todo = await self.repository.remove_todo_by_id(id, user.id)
         if deleted_todo is None:
             raise HTTPException(status_code=404, detail="Todo not found")
+        if self.search_index is not None:
+            self.search_index.remove(user.id, [id])
+        await self._changed(user)
 
 
-    def update_todo_by_id(self, todo: TodoItem, id: int, user: User) -> Todo:
-        updated_todo = self.repository.update_todo_by_id(id, todo, user.id)
+    async def update_todo_by_id(self, todo: TodoItem, id: int, user: User) -> Todo:
+        updated_todo = await self.repository.update_todo_by_id(id, todo, user.id)
         if updated_todo is None:
             raise HTTPException(status_code=404, detail="Todo not found")
+        if self.search_index is not None:
+            self.search_index.add(user.id, updated_todo.id, updated_todo.task)
+        await self._changed(user)
         return updated_todo
 
 
-    def update_todo_completed_state_by_id(self, id: int, update: TodoCompletedState, user: User) -> Todo:
-        updated_todo = self.repository.update_completed_state_by_id(id, update, user.id)
+    async def update_todo_completed_state_by_id(self, id: int, update: TodoCompletedState, user: User) -> Todo:
+        updated_todo = await self.repository.update_completed_state_by_id(id, update, user.id)
         if updated_todo is None:
             raise HTTPException(status_code=404, detail="Todo not found")
+        await self._changed(user)
         return updated_todo
 
 
-    def update_todo_today_state_by_id(self, id: int, update: TodoTodayState, user: User) -> Todo:
-        updated_todo = self.repository.update_today_state_by_id(id, update, user.id)
+    async def update_todo_today_state_by_id(self, id: int, update: TodoTodayState, user: User) -> Todo:
+        updated_todo = await self.repository.update_today_state_by_id(id, update, user.id)
         if updated_todo is None:
             raise HTTPException(status_code=404, detail="Todo not found")
+        await self._changed(user)
         return updated_todo
+
+
+    # 배치 처리: 요청한 id 순서대로 처리 결과 반환 (중복 id는 한 번만)
+    async def update_completed_state_for_ids(self, update: TodoBatchCompletedState, user: User) -> list[TodoBatchResult]:
+        ids = list(dict.fromkeys(update.ids))
+        updated_ids = await self.repository.update_todos_by_ids(ids, user.id, is_done=update.is_done)
+        if updated_ids:
+            await self._changed(user)
+        return self._batch_results(ids, updated_ids)
+
+
+    async def update_today_state_for_ids(self, update: TodoBatchTodayState, user: User) -> list[TodoBatchResult]:
+        ids = list(dict.fromkeys(update.ids))
+        updated_ids = await self.repository.update_todos_by_ids(ids, user.id, today=update.today)
+        if updated_ids:
+            await self._changed(user)
+        return self._batch_results(ids, updated_ids)
+
+
+    async def remove_todos_by_ids(self, batch: TodoIds, user: User) -> list[TodoBatchResult]:
+        ids = list(dict.fromkeys(batch.ids))
+        deleted_ids = await self.repository.remove_todos_by_ids(ids, user.id)
+        if deleted_ids:
+            if self.search_index is not None:
+                self.search_index.remove(user.id, deleted_ids)
+            await self._changed(user)
+        return self._batch_results(ids, deleted_ids)
+
+
+    @staticmethod
+    def _batch_results(ids: list[int], processed_ids: list[int]) -> list[TodoBatchResult]:
+        processed = set(processed_ids)
+        return [TodoBatchResult(id=id, ok=id in processed) for id in ids]
@@ -0,0 +1,145 @@
+""" todo_tombstones 정리: 보관 기간(Settings.TODO_TOMBSTONE_RETENTION_DAYS)이 지난 tombstone 삭제
+
+GET /todos/changes는 보관 기간보다 오래된 cursor에 410을 주므로 그 이전 tombstone은 더 이상 읽지 않는다.
+rollover와 별개로 서버 안의 스케줄러(Settings.TODO_TOMBSTONE_PRUNE_ENABLED, 기본값 켜짐)가
+TODO_TOMBSTONE_PRUNE_INTERVAL_SECONDS마다 실행하고, CLI로도 실행할 수 있다.
+tombstone은 캐시 / ETag에 반영되지 않으므로 다른 프로세스에서 실행해도 되고,
+여러 워커에서 동시에 실행해도 같은 행을 지울 뿐이다.
+
+가장 오래된 tombstone부터 id 순으로 batch_size개씩 읽어 짧은 트랜잭션 하나로 삭제한다.
+
+    cd server
+    python -m nexlist.todos.tombstones
+    python -m nexlist.todos.tombstones --retention-days 14 --batch-size 500
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, select
+from starlette.concurrency import run_in_threadpool
+
+from nexlist.config import settings
+from nexlist.db.database import SessionLocal
+from nexlist.db.routing import use_primary
+
+from .changes import utcnow
+from .models import TodoTombstone
+
+logger = logging.getLogger(__name__)
+
+
+class TombstonePruner:
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        retention_days: int = 30,
+        batch_size: int = 1000,
+        pause_seconds: float = 0.0,
+    ):
+        self.session_factory = session_factory
+        self.retention_days = retention_days
+        self.batch_size = batch_size
+        self.pause_seconds = pause_seconds
+
+    def prune_chunk(self, before: datetime, limit: int) -> int:
+        """ 가장 오래된 tombstone limit개 중 before 이전 것을 삭제 (id 순 = 삭제 순이므로 PK 범위만 읽음) """
+        with self.session_factory() as db:
+            use_primary(db)
+            rows = db.execute(
+                select(TodoTombstone.id, TodoTombstone.deleted_at).order_by(TodoTombstone.id).limit(limit)
+            ).all()
+            expired_ids = [row.id for row in rows if row.deleted_at < before]
+            if expired_ids:
+                db.execute(delete(TodoTombstone).where(TodoTombstone.id.in_(expired_ids)))
+            db.commit()
+            return len(expired_ids)
+
+    async def prune(self) -> int:
+        before = utcnow() - timedelta(days=self.retention_days)
+        pruned = 0
+        while True:
+            count = await run_in_threadpool(self.prune_chunk, before, self.batch_size)
+            pruned += count
+            if count < self.batch_size:
+                return pruned
+            if self.pause_seconds > 0:
+                await asyncio.sleep(self.pause_seconds)
+
+
+def build_tombstone_pruner(**overrides) -> TombstonePruner:
+    options = {
+        "retention_days": settings.TODO_TOMBSTONE_RETENTION_DAYS,
+        "batch_size": settings.TODO_TOMBSTONE_PRUNE_BATCH_SIZE,
+        "pause_seconds": settings.TODO_TOMBSTONE_PRUNE_PAUSE_SECONDS,
+    }
+    return TombstonePruner(**{**options, **overrides})
+
+
+class TombstonePruneScheduler:
+    """ interval초마다 정리 (lifespan에서 시작/종료), 시작 직후 한 번 실행 """
+
+    def __init__(self, pruner: TombstonePruner, interval: float):
+        self.pruner = pruner
+        self.interval = interval
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                pruned = await self.pruner.prune()
+            except Exception:
+                # 다음 주기에 다시 시도
+                logger.exception("todo tombstone pruning failed")
+            else:
+                if pruned:
+                    logger.info("pruned %d todo tombstones", pruned)
+            await asyncio.sleep(self.interval)
+
+
+tombstone_prune_scheduler = TombstonePruneScheduler(
+    build_tombstone_pruner(), settings.TODO_TOMBSTONE_PRUNE_INTERVAL_SECONDS
+)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--retention-days", type=int, default=settings.TODO_TOMBSTONE_RETENTION_DAYS,
+        help="이보다 오래된 tombstone 삭제 (서버의 TODO_TOMBSTONE_RETENTION_DAYS보다 짧으면 아직 유효한 cursor에서 삭제가 누락됨)",
+    )
+    parser.add_argument("--batch-size", type=int, default=settings.TODO_TOMBSTONE_PRUNE_BATCH_SIZE, help="chunk 최대 행 수")
+    parser.add_argument(
+        "--pause-seconds", type=float, default=settings.TODO_TOMBSTONE_PRUNE_PAUSE_SECONDS, help="chunk 사이 대기 시간"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    pruner = build_tombstone_pruner(
+        retention_days=args.retention_days, batch_size=args.batch_size, pause_seconds=args.pause_seconds
+    )
+    pruned = asyncio.run(pruner.prune())
+    print(f"pruned {pruned} tombstones older than {args.retention_days} days")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+from nexlist.auth.cache import token_cache, user_cache
+from nexlist.auth.repository import add_user
+from nexlist.auth.schemas import GoogleUserInfoResponse
+
+
+def user_selects(statements: list[str]) -> list[str]:
+    return [s for s in statements if "FROM users" in s]
+
+
+def test_current_user_is_cached(client, queries):
+    assert client.get("/todos/").status_code == 200
+    assert len(user_selects(queries)) == 1
+
+    queries.clear()
+    assert client.get("/todos/").status_code == 200
+    assert client.get("/auth/me").json()["email"] == "tester@nexlist.dev"
+    assert user_selects(queries) == []
+
+    assert token_cache.stats()["hits"] == 2
+    assert user_cache.stats()["hits"] == 2
+    assert user_cache.stats()["misses"] == 1
+
+
+def test_invalid_token_is_not_cached(client):
+    client.cookies.set("access_token", "not-a-jwt")
+    assert client.get("/todos/").status_code == 401
+    assert len(token_cache) == 0
+
+
+def test_add_user_invalidates_cached_user(client, SessionTesting, user):
+    assert client.get("/auth/me").json()["name"] == "Tester"
+
+    google_user_info = GoogleUserInfoResponse(
+        id=user.google_sub,
+        email=user.email,
+        verified_email=True,
+        name="Renamed",
+        given_name="Renamed",
+        picture="",
+    )
+    with SessionTesting() as db:
+        add_user(google_user_info, db)
+
+    assert client.get("/auth/me").json()["name"] == "Renamed"
@@ -0,0 +1,109 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from nexlist.auth.google_auth import GoogleOAuthClient, get_google_client, rebase_url
+
+STUB_URL = "http://google.stub"
+
+USER_INFO = {
+    "id": "google-sub-new",
+    "email": "new@nexlist.dev",
+    "verified_email": True,
+    "name": "New User",
+    "given_name": "New",
+    "picture": "",
+}
+
+
+class StubGoogle:
+    """ MockTransport 핸들러: 경로별로 준비된 응답(또는 예외)을 차례로 반환 """
+
+    def __init__(self, **responses):
+        self.responses = responses
+        self.calls: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.calls.append(path)
+        queue = self.responses[path]
+        result = queue.pop(0) if len(queue) > 1 else queue[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def stub_client(stub: StubGoogle, retries: int = 2) -> GoogleOAuthClient:
+    return GoogleOAuthClient(base_url=STUB_URL, retries=retries, backoff=0, transport=httpx.MockTransport(stub))
+
+
+def ok_token():
+    return httpx.Response(200, json={"access_token": "google-access-token"})
+
+
+def test_rebase_url():
+    assert rebase_url("https://oauth2.googleapis.com/token", "") == "https://oauth2.googleapis.com/token"
+    assert rebase_url("https://oauth2.googleapis.com/token", "http://localhost:9000/") == "http://localhost:9000/token"
+    assert rebase_url("https://www.googleapis.com/oauth2/v1/userinfo?alt=json", STUB_URL) == f"{STUB_URL}/oauth2/v1/userinfo?alt=json"
+
+
+def test_google_callback_with_stub(app, db_mode):
+    stub = StubGoogle(**{
+        "/token": [ok_token()],
+        "/oauth2/v1/userinfo": [httpx.Response(200, json=USER_INFO)],
+    })
+    google = stub_client(stub)
+    app.dependency_overrides[get_google_client] = lambda: google
+
+    with TestClient(app) as client:
+        response = client.get("/auth/google/callback", params={"code": "auth-code"}, follow_redirects=False)
+        assert response.status_code == 307
+        assert "access_token" in response.cookies
+
+        client.cookies.set("access_token", response.cookies["access_token"])
+        assert client.get("/auth/me").json()["email"] == "new@nexlist.dev"
+
+    assert stub.calls == ["/token", "/oauth2/v1/userinfo"]
+
+
+def test_user_info_retries_on_server_error():
+    stub = StubGoogle(**{
+        "/oauth2/v1/userinfo": [httpx.Response(503), httpx.ReadTimeout("slow"), httpx.Response(200, json=USER_INFO)],
+    })
+    user_info = asyncio.run(stub_client(stub).fetch_user_info("token"))
+    assert user_info.google_sub == "google-sub-new"
+    assert len(stub.calls) == 3
+
+
+def test_token_exchange_is_not_retried_once_sent():
+    # 인가 코드는 일회용이므로 서버에 도달한 POST는 재시도하지 않음
+    stub = StubGoogle(**{"/token": [httpx.Response(500), ok_token()]})
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(stub_client(stub).exchange_code("code"))
+    assert e.value.status_code == 400
+    assert len(stub.calls) == 1
+
+
+def test_token_exchange_retries_connect_errors():
+    stub = StubGoogle(**{"/token": [httpx.ConnectError("refused"), ok_token()]})
+    assert asyncio.run(stub_client(stub).exchange_code("code"))["access_token"] == "google-access-token"
+    assert len(stub.calls) == 2
+
+
+def test_google_unavailable():
+    stub = StubGoogle(**{"/oauth2/v1/userinfo": [httpx.ConnectError("refused")]})
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(stub_client(stub, retries=1).fetch_user_info("token"))
+    assert e.value.status_code == 502
+    assert len(stub.calls) == 2
+
+
+def test_invalid_access_token():
+    stub = StubGoogle(**{"/oauth2/v1/userinfo": [httpx.Response(401)]})
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(stub_client(stub).fetch_user_info("token"))
+    assert e.value.status_code == 401
+    assert len(stub.calls) == 1
@@ -0,0 +1,173 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from jose import jwk, jwt
+
+from nexlist.auth.google_auth import get_google_client
+from nexlist.auth.id_token import (
+    GoogleIdTokenVerifier,
+    JwksCache,
+    get_id_token_verifier,
+    jwks_fetcher,
+)
+
+from .test_google_auth import StubGoogle, stub_client
+
+CLIENT_ID = "nexlist-test.apps.googleusercontent.com"
+KID = "test-key-1"
+
+
+def generate_key() -> str:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+
+
+@pytest.fixture(scope="module")
+def private_key() -> str:
+    return generate_key()
+
+
+@pytest.fixture
+def jwks_file(tmp_path, private_key):
+    # Google JWKS 대신 쓰는 로컬 fixture 파일 (공개 키만 포함)
+    public = jwk.construct(private_key, "RS256").public_key().to_dict()
+    path = tmp_path / "jwks.json"
+    path.write_text(json.dumps({"keys": [{**public, "kid": KID, "use": "sig"}]}))
+    return path
+
+
+def make_id_token(private_key: str, access_token: str | None = "google-access-token", kid: str = KID, **overrides) -> str:
+    now = int(time.time())
+    claims = {
+        "iss": "https://accounts.google.com",
+        "aud": CLIENT_ID,
+        "sub": "google-sub-new",
+        "email": "new@nexlist.dev",
+        "email_verified": True,
+        "name": "New User",
+        "given_name": "New",
+        "picture": "",
+        "iat": now,
+        "exp": now + 3600,
+        **overrides,
+    }
+    return jwt.encode(claims, private_key, algorithm="RS256", headers={"kid": kid}, access_token=access_token)
+
+
+def counting_fetcher(path):
+    fetch = jwks_fetcher(str(path), client=None)
+    calls = []
+
+    async def counted():
+        calls.append(1)
+        return await fetch()
+
+    return counted, calls
+
+
+def verifier_for(jwks_file, **cache_options) -> tuple[GoogleIdTokenVerifier, list]:
+    fetch, calls = counting_fetcher(jwks_file)
+    return GoogleIdTokenVerifier(JwksCache(fetch, **cache_options), client_id=CLIENT_ID), calls
+
+
+def test_verify_id_token(jwks_file, private_key):
+    verifier, calls = verifier_for(jwks_file)
+
+    async def run():
+        token = make_id_token(private_key)
+        first = await verifier.verify(token, "google-access-token")
+        second = await verifier.verify(token, "google-access-token")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first.google_sub == "google-sub-new"
+    assert first.email == "new@nexlist.dev"
+    assert first.verified_email is True
+    assert second == first
+    # JWKS는 한 번만 읽고 캐시
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("token_args", [
+    {"aud": "someone-else"},
+    {"iss": "https://evil.example"},
+    {"exp": int(time.time()) - 10},
+])
+def test_rejects_invalid_claims(jwks_file, private_key, token_args):
+    verifier, _ = verifier_for(jwks_file)
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(verifier.verify(make_id_token(private_key, **token_args), "google-access-token"))
+    assert e.value.status_code == 401
+
+
+def test_rejects_mismatched_access_token_and_foreign_key(jwks_file, private_key):
+    verifier, _ = verifier_for(jwks_file)
+
+    async def run():
+        with pytest.raises(HTTPException):
+            await verifier.verify(make_id_token(private_key), "another-access-token")
+        # 같은 kid라도 다른 키로 서명된 토큰
+        with pytest.raises(HTTPException):
+            await verifier.verify(make_id_token(generate_key()), "google-access-token")
+
+    asyncio.run(run())
+
+
+def test_unknown_kid_refreshes_at_most_once_per_interval(jwks_file, private_key):
+    verifier, calls = verifier_for(jwks_file, min_refresh_interval=0)
+    token = make_id_token(private_key, kid="rotated-key")
+
+    with pytest.raises(HTTPException):
+        asyncio.run(verifier.verify(token, "google-access-token"))
+    # 최초 로드 + 모르는 kid로 인한 재조회
+    assert len(calls) == 2
+
+    verifier, calls = verifier_for(jwks_file, min_refresh_interval=60)
+    with pytest.raises(HTTPException):
+        asyncio.run(verifier.verify(token, "google-access-token"))
+    assert len(calls) == 1
+
+
+def test_jwks_background_refresh(jwks_file, private_key):
+    # refresh_ahead=0: 캐시가 있으면 요청은 기존 키로 처리하고 갱신은 백그라운드에서
+    verifier, calls = verifier_for(jwks_file, ttl=3600, refresh_ahead=0)
+
+    async def run():
+        token = make_id_token(private_key)
+        await verifier.verify(token, "google-access-token")
+        await verifier.verify(token, "google-access-token")
+        await verifier.jwks._background
+        return len(calls)
+
+    assert asyncio.run(run()) == 2
+
+
+def test_google_callback_skips_userinfo(app, jwks_file, private_key):
+    stub = StubGoogle(**{
+        "/token": [httpx.Response(200, json={
+            "access_token": "google-access-token",
+            "id_token": make_id_token(private_key),
+        })],
+    })
+    google = stub_client(stub)
+    verifier, _ = verifier_for(jwks_file)
+    app.dependency_overrides[get_google_client] = lambda: google
+    app.dependency_overrides[get_id_token_verifier] = lambda: verifier
+
+    with TestClient(app) as client:
+        response = client.get("/auth/google/callback", params={"code": "auth-code"}, follow_redirects=False)
+        assert response.status_code == 307
+        client.cookies.set("access_token", response.cookies["access_token"])
+        assert client.get("/auth/me").json()["email"] == "new@nexlist.dev"
+
+    # userinfo 호출 없이 토큰 교환 한 번으로 로그인
+    assert stub.calls == ["/token"]
@@ -0,0 +1,154 @@
+from datetime import timedelta
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from nexlist.auth.google_auth import get_google_client
+from nexlist.auth.models import RefreshToken
+from nexlist.auth.refresh_tokens import (
+    hash_refresh_token,
+    rotate_refresh_token,
+)
+from nexlist.config import settings
+
+from .test_google_auth import USER_INFO, StubGoogle, stub_client
+
+
+@pytest.fixture
+def login(app):
+    """ Google stub으로 로그인한 TestClient (access_token + refresh_token 쿠키) """
+    stub = StubGoogle(**{
+        "/token": [httpx.Response(200, json={"access_token": "google-access-token"})],
+        "/oauth2/v1/userinfo": [httpx.Response(200, json=USER_INFO)],
+    })
+    google = stub_client(stub)
+    app.dependency_overrides[get_google_client] = lambda: google
+
+    with TestClient(app) as client:
+        response = client.get("/auth/google/callback", params={"code": "auth-code"}, follow_redirects=False)
+        assert response.status_code == 307
+        assert response.cookies["refresh_token"]
+        yield client
+
+
+def refresh_with(client: TestClient, token: str):
+    client.cookies.clear()
+    client.cookies.set("refresh_token", token, path="/auth")
+    return client.post("/auth/refresh")
+
+
+def test_refresh_rotates_token(login, SessionTesting, queries):
+    old = login.cookies["refresh_token"]
+
+    queries.clear()
+    response = login.post("/auth/refresh")
+    assert response.status_code == 200
+    # Google 호출 / users 조회 없이 refresh_tokens 테이블만 사용
+    assert not any("users" in q for q in queries)
+
+    new = response.cookies["refresh_token"]
+    assert new != old
+    login.cookies.set("access_token", response.cookies["access_token"])
+    assert login.get("/auth/me").json()["email"] == USER_INFO["email"]
+
+    with SessionTesting() as db:
+        rows = {row.token_hash: row for row in db.query(RefreshToken)}
+    assert rows[hash_refresh_token(old)].revoked_at is not None
+    assert rows[hash_refresh_token(new)].revoked_at is None
+    assert rows[hash_refresh_token(new)].family_id == rows[hash_refresh_token(old)].family_id
+
+
+def test_reused_token_revokes_family(login, SessionTesting):
+    old = login.cookies["refresh_token"]
+    new = login.post("/auth/refresh").cookies["refresh_token"]
+    with SessionTesting() as db:
+        row = db.query(RefreshToken).filter_by(token_hash=hash_refresh_token(old)).one()
+        row.revoked_at -= timedelta(seconds=settings.REFRESH_REUSE_GRACE_SECONDS + 1)
+        db.commit()
+
+    # 유예 구간이 지난 뒤 이미 교체된 토큰 재사용 -> 탈취로 간주, 새 토큰까지 폐기
+    assert refresh_with(login, old).status_code == 401
+    assert refresh_with(login, new).status_code == 401
+
+
+def test_concurrent_refresh_within_grace(login):
+    # 두 탭이 같은 토큰으로 동시에 재발급: 둘 다 새 토큰을 받고 로그아웃되지 않음
+    old = login.cookies["refresh_token"]
+    first = refresh_with(login, old)
+    second = refresh_with(login, old)
+    assert first.status_code == 200
+    assert second.status_code == 200
+
+    tokens = {first.cookies["refresh_token"], second.cookies["refresh_token"]}
+    assert len(tokens) == 2
+    for token in tokens:
+        assert refresh_with(login, token).status_code == 200
+
+
+def test_concurrent_refresh_race(login, engine, SessionTesting):
+    # 조회 후 claim UPDATE 직전에 다른 요청이 같은 토큰으로 먼저 재발급하고 커밋
+    old = login.cookies["refresh_token"]
+    winner = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("UPDATE refresh_tokens") and not winner:
+            winner.append(None)
+            with SessionTesting() as db:
+                winner[0] = rotate_refresh_token(old, db)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        with SessionTesting() as db:
+            loser = rotate_refresh_token(old, db)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    # 진 요청도 유예 구간 안이므로 같은 family의 새 토큰을 받음
+    assert winner[0] is not None and loser is not None
+    assert winner[0][1] != loser[1]
+
+
+def test_logout_revokes_refresh_token(login):
+    token = login.cookies["refresh_token"]
+    assert login.post("/auth/logout").status_code == 200
+    assert refresh_with(login, token).status_code == 401
+
+
+def test_grace_does_not_undo_logout(login):
+    old = login.cookies["refresh_token"]
+    new = login.post("/auth/refresh").cookies["refresh_token"]
+    assert refresh_with(login, new).status_code == 200
+    login.post("/auth/logout")
+    # 재발급 직후여도 family에 유효한 토큰이 없으면 유예하지 않음
+    assert refresh_with(login, old).status_code == 401
+
+
+def test_unknown_or_missing_token(login):
+    assert refresh_with(login, "not-a-token").status_code == 401
+
+    login.cookies.clear()
+    assert login.post("/auth/refresh").status_code == 401
+
+
+def test_sliding_expiry_is_capped(login, SessionTesting):
+    from nexlist.config import settings
+
+    token = login.cookies["refresh_token"]
+    with SessionTesting() as db:
+        row = db.query(RefreshToken).filter_by(token_hash=hash_refresh_token(token)).one()
+        # 세션 시작이 최대 길이 직전인 경우: 연장해도 최대 길이를 넘지 않음
+        row.session_started_at -= timedelta(days=settings.REFRESH_TOKEN_MAX_DAYS - 1)
+        session_end = row.session_started_at + timedelta(days=settings.REFRESH_TOKEN_MAX_DAYS)
+        db.commit()
+
+    new = login.post("/auth/refresh").cookies["refresh_token"]
+    with SessionTesting() as db:
+        row = db.query(RefreshToken).filter_by(token_hash=hash_refresh_token(new)).one()
+        assert row.expires_at == session_end
+
+        # 만료된 토큰
+        row.expires_at -= timedelta(days=settings.REFRESH_TOKEN_MAX_DAYS)
+        db.commit()
+    assert refresh_with(login, new).status_code == 401
@@ -0,0 +1,175 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+# nexlist 모듈 import 전에 테스트용 설정 주입
+os.environ.setdefault("NEXLIST_ENV", "testing")
+os.environ.setdefault("NEXLIST_JWT_SECRET_KEY", "test-secret-key")
+os.environ.setdefault("NEXLIST_JWT_ALGORITHM", "HS256")
+
+from datetime import date
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from nexlist.auth.cache import token_cache, user_cache
+from nexlist.auth.dependencies import get_current_user_async, get_current_user_sync
+from nexlist.auth.jwt_utils import create_jwt_token
+from nexlist.auth.models import User
+from nexlist.auth.router import router as auth_router
+from nexlist.cache.versions import versions
+from nexlist.db.database import Base
+from nexlist.db.dependencies import get_async_db, get_db
+from nexlist.db.threadpool import ThreadPoolRepository
+from nexlist.memo.dependencies import get_async_memo_service, get_sync_memo_service
+from nexlist.memo.router import router as memo_router
+from nexlist.metrics import DbStatsMiddleware, instrument_engine
+from nexlist.todos.cache import (
+    MemoryBackend,
+    TodoListCache,
+    get_todo_list_cache,
+    todo_stats_cache,
+)
+from nexlist.todos.clear import TodoClearJobs, get_todo_clear_jobs
+from nexlist.todos.dependencies import get_async_todo_service, get_sync_todo_service
+from nexlist.todos.repository import TodoRepository
+from nexlist.todos.router import router as todos_router
+from nexlist.todos.search import NgramSearchIndex, get_todo_search_index
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "nexlist.db"
+
+
+@pytest.fixture
+def engine(db_path):
+    # MySQL 대신 SQLite 파일 DB 사용 (동기/비동기 엔진이 같은 파일을 공유)
+    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def SessionTesting(engine):
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def user(SessionTesting) -> User:
+    with SessionTesting() as db:
+        user = User(
+            email="tester@nexlist.dev",
+            verified_email=True,
+            name="Tester",
+            given_name="Tester",
+            google_sub="google-sub-1",
+            created_at=date.today(),
+            picture="",
+        )
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        return user
+
+
+@pytest.fixture(params=["sync", "async"])
+def db_mode(request) -> str:
+    return request.param
+
+
+@pytest.fixture
+def todo_list_cache() -> TodoListCache:
+    return TodoListCache(MemoryBackend(max_size=100, ttl_seconds=60), ttl_seconds=60)
+
+
+@pytest.fixture
+def todo_search_index() -> NgramSearchIndex:
+    return NgramSearchIndex(max_users=100)
+
+
+@pytest.fixture
+def todo_clear_jobs(SessionTesting) -> TodoClearJobs:
+    # 백그라운드 삭제도 테스트 DB 사용
+    async def deleter(user_id: int, max_id: int, limit: int) -> list[int]:
+        with SessionTesting() as db:
+            return await ThreadPoolRepository(TodoRepository(db)).remove_todo_chunk(user_id, max_id, limit)
+
+    return TodoClearJobs(deleter)
+
+
+@pytest.fixture
+def app(db_mode, engine, db_path, SessionTesting, todo_list_cache, todo_search_index, todo_clear_jobs):
+    app = FastAPI()
+    app.include_router(todos_router)
+    app.include_router(auth_router)
+    app.include_router(memo_router)
+    app.add_middleware(DbStatsMiddleware)
+
+    def override_get_db():
+        db = SessionTesting()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    # 테스트마다 DB가 새로 만들어지므로 목록 캐시도 새로 생성
+    app.dependency_overrides[get_todo_list_cache] = lambda: todo_list_cache
+    app.dependency_overrides[get_todo_search_index] = lambda: todo_search_index
+    app.dependency_overrides[get_todo_clear_jobs] = lambda: todo_clear_jobs
+
+    async_engine = None
+    if db_mode == "async":
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        AsyncSessionTesting = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+        async def override_get_async_db():
+            async with AsyncSessionTesting() as db:
+                yield db
+
+        # 라우터는 Settings.DB_ASYNC로 선택된 의존성을 참조하므로 동기 의존성을 비동기 구현으로 교체
+        app.dependency_overrides[get_async_db] = override_get_async_db
+        app.dependency_overrides[get_sync_todo_service] = get_async_todo_service
+        app.dependency_overrides[get_sync_memo_service] = get_async_memo_service
+        app.dependency_overrides[get_current_user_sync] = get_current_user_async
+
+    app.state.app_engine = async_engine.sync_engine if async_engine else engine
+    instrument_engine(app.state.app_engine, f"test_{db_mode}")
+    yield app
+
+
+@pytest.fixture
+def client(app, user):
+    with TestClient(app) as client:
+        client.cookies.set("access_token", create_jwt_token({"user_id": user.id}))
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    # 테스트마다 DB가 새로 만들어지므로 프로세스 전역 캐시도 초기화
+    token_cache.clear()
+    user_cache.clear()
+    versions.clear()
+    todo_stats_cache.clear()
+    yield
+
+
+@pytest.fixture
+def queries(app):
+    """ 앱이 사용하는 엔진에서 실행된 SQL 문 기록 """
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(app.state.app_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(app.state.app_engine, "before_cursor_execute", before_cursor_execute)
@@ -0,0 +1,77 @@
+import asyncio
+import json
+
+from nexlist.cache.versions import versions
+from nexlist.events.broker import EventBroker, InMemoryBackend, broker
+from nexlist.events.router import change_stream
+
+
+def parse_events(chunks: list[str]) -> list[tuple[str, str]]:
+    events = []
+    for chunk in chunks:
+        fields = dict(line.split(": ", 1) for line in chunk.strip().splitlines() if not line.startswith(":"))
+        if "event" in fields:
+            events.append((fields["event"], fields["data"]))
+    return events
+
+
+def test_subscription_coalesces_per_scope():
+    local = EventBroker(InMemoryBackend())
+
+    async def run():
+        async with local.subscribe(1) as subscription:
+            local.publish(1, "todos", '"etag-1"')
+            local.publish(1, "todos", '"etag-2"')
+            local.publish(1, "memo", '"memo-1"')
+            local.publish(2, "todos", '"other-user"')
+            events = await subscription.next_events(timeout=1)
+            assert local.subscriber_count() == 1
+            # 대기 중인 이벤트가 없으면 timeout 후 빈 목록 (keep-alive)
+            assert await subscription.next_events(timeout=0.01) == []
+        assert local.subscriber_count() == 0
+        return events
+
+    events = asyncio.run(run())
+    assert [(e.scope, e.etag) for e in events] == [("todos", '"etag-2"'), ("memo", '"memo-1"')]
+
+
+def test_writes_publish_changes(client, user):
+    # TestClient는 별도 스레드의 이벤트 루프에서 요청을 처리하므로 구독은 이 스레드의 루프에서 직접 순회
+    loop = asyncio.new_event_loop()
+    stream = change_stream(user.id)
+    try:
+        # retry + 연결 시점의 todos / memo ETag
+        initial = [loop.run_until_complete(anext(stream)) for _ in range(3)]
+        assert initial[0].startswith("retry: ")
+        assert [event for event, _ in parse_events(initial)] == ["todos", "memo"]
+        assert broker.subscriber_count() == 1
+
+        # 다른 탭에서의 쓰기
+        client.post("/todos/", json={"task": "from another tab", "today": True})
+        client.post("/memo/", json={"content": "memo"})
+
+        received = parse_events([loop.run_until_complete(anext(stream)) for _ in range(2)])
+        assert received == [
+            ("todos", json.dumps({"scope": "todos", "etag": versions.etag("todos", user.id)})),
+            ("memo", json.dumps({"scope": "memo", "etag": versions.etag("memo", user.id)})),
+        ]
+    finally:
+        loop.run_until_complete(stream.aclose())
+        loop.close()
+    assert broker.subscriber_count() == 0
+
+
+def test_keep_alive(user, monkeypatch):
+    from nexlist.config import settings
+
+    monkeypatch.setattr(settings, "EVENTS_KEEPALIVE_SECONDS", 0.01)
+
+    async def run():
+        stream = change_stream(user.id)
+        try:
+            chunks = [await anext(stream) for _ in range(4)]
+        finally:
+            await stream.aclose()
+        return chunks[-1]
+
+    assert asyncio.run(run()) == ": keep-alive\n\n"
@@ -0,0 +1,85 @@
+def test_memo_not_found(client):
+    assert client.get("/memo/").status_code == 404
+    assert client.put("/memo/", json={"content": "hello"}).status_code == 404
+
+
+def test_create_and_update_memo(client):
+    response = client.post("/memo/", json={"content": "hello"})
+    assert response.status_code == 201
+    assert response.json()["content"] == "hello"
+    assert response.json()["saved_at"] is None
+
+    # 메모는 사용자당 하나
+    assert client.post("/memo/", json={"content": "again"}).status_code == 500
+
+    response = client.put("/memo/", json={"content": "hello world"})
+    assert response.status_code == 200
+    assert response.json()["saved_at"] is not None
+
+    assert client.get("/memo/").json()["content"] == "hello world"
+
+
+def test_memo_conditional_get(client, queries):
+    client.post("/memo/", json={"content": "hello"})
+    etag = client.get("/memo/").headers["ETag"]
+
+    queries.clear()
+    response = client.get("/memo/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert queries == []
+
+    client.put("/memo/", json={"content": "changed"})
+    response = client.get("/memo/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["content"] == "changed"
+
+
+def test_patch_memo_applies_edits(client):
+    client.post("/memo/", json={"content": "hello world"})
+    assert client.get("/memo/").json()["version"] == 0
+
+    response = client.patch("/memo/", json={
+        "base_version": 0,
+        "ops": [
+            {"pos": 0, "delete": 5, "insert": "goodbye"},
+            {"pos": 13, "insert": "!"},  # 직전 편집이 반영된 텍스트 기준
+        ],
+    })
+    assert response.status_code == 200
+    assert response.json()["version"] == 1
+
+    memo = client.get("/memo/").json()
+    assert memo["content"] == "goodbye world!"
+    assert memo["version"] == 1
+
+
+def test_patch_memo_rejects_stale_base(client):
+    client.post("/memo/", json={"content": "abc"})
+    assert client.put("/memo/", json={"content": "xyz"}).json()["version"] == 1
+
+    response = client.patch("/memo/", json={"base_version": 0, "ops": [{"pos": 0, "insert": "!"}]})
+    assert response.status_code == 409
+    assert client.get("/memo/").json()["content"] == "xyz"
+
+
+def test_patch_memo_invalid_ops(client):
+    from nexlist.config import settings
+
+    assert client.patch("/memo/", json={"base_version": 0, "ops": [{"pos": 0}]}).status_code == 404
+
+    client.post("/memo/", json={"content": "abc"})
+    assert client.patch("/memo/", json={"base_version": 0, "ops": [{"pos": 2, "delete": 5}]}).status_code == 422
+    assert client.patch("/memo/", json={"base_version": 0, "ops": []}).status_code == 422
+    # 편집 하나의 삽입 문자열도 메모 최대 길이까지 (본문 검증 단계에서 거부)
+    too_long = {"pos": 0, "insert": "x" * (settings.MEMO_MAX_LENGTH + 1)}
+    assert client.patch("/memo/", json={"base_version": 0, "ops": [too_long]}).status_code == 422
+    assert client.get("/memo/").json()["version"] == 0
+
+
+def test_memo_size_limit(client, monkeypatch):
+    from nexlist.config import settings
+
+    client.post("/memo/", json={"content": "abc"})
+    monkeypatch.setattr(settings, "MEMO_MAX_LENGTH", 5)
+    response = client.patch("/memo/", json={"base_version": 0, "ops": [{"pos": 3, "insert": "def"}]})
+    assert response.status_code == 422
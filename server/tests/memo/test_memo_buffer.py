@@ -0,0 +1,164 @@
+import asyncio
+
+import pytest
+
+from nexlist.memo.buffer import MemoWriteBuffer
+from nexlist.memo.dependencies import get_memo_write_buffer
+from nexlist.metrics import MEMO_WRITES
+
+
+def writes(outcome: str) -> float:
+    return MEMO_WRITES.labels(outcome)._value.get()
+
+
+@pytest.fixture
+def buffer(app):
+    buffer = MemoWriteBuffer(flush_interval=3600)
+    app.dependency_overrides[get_memo_write_buffer] = lambda: buffer
+    return buffer
+
+
+def test_autosave_burst_is_coalesced(client, buffer, queries):
+    client.post("/memo/", json={"content": "a"})
+    coalesced, flushed = writes("coalesced"), writes("flushed")
+
+    queries.clear()
+    for content in ("ab", "abc", "abcd"):
+        response = client.put("/memo/", json={"content": content})
+        assert response.status_code == 200
+        assert response.json()["saved_at"] is not None
+        assert response.json()["version"] is None
+
+    # 처음 한 번 메모 존재 확인만 하고 UPDATE는 하지 않음
+    assert not any(q.lstrip().upper().startswith("UPDATE") for q in queries)
+    assert len(buffer) == 1
+    assert writes("coalesced") - coalesced == 2
+
+    # 조회 전에 이 사용자의 대기 값을 기록 (read-your-writes)
+    memo = client.get("/memo/").json()
+    assert memo["content"] == "abcd"
+    assert memo["version"] == 1
+    assert len(buffer) == 0
+    assert writes("flushed") - flushed == 1
+
+
+def test_buffered_put_requires_existing_memo(client, buffer):
+    assert client.put("/memo/", json={"content": "x"}).status_code == 404
+    assert len(buffer) == 0
+
+
+def test_patch_after_buffered_put(client, buffer):
+    client.post("/memo/", json={"content": "hello"})
+    client.put("/memo/", json={"content": "hello world"})
+
+    # PATCH 기준은 flush 이후 version
+    response = client.patch("/memo/", json={"base_version": 1, "ops": [{"pos": 11, "insert": "!"}]})
+    assert response.status_code == 200
+    assert client.get("/memo/").json()["content"] == "hello world!"
+
+
+def test_failed_flush_keeps_newer_values():
+    buffer = MemoWriteBuffer()
+
+    async def failing(memos):
+        # flush 도중 새 값이 들어온 경우
+        await buffer.put(1, "newer")
+        raise RuntimeError("db down")
+
+    async def run():
+        await buffer.put(1, "older")
+        await buffer.put(2, "other")
+        with pytest.raises(RuntimeError):
+            await buffer.flush(failing)
+        return buffer.get(1).content, buffer.get(2).content
+
+    assert asyncio.run(run()) == ("newer", "other")
+
+
+def test_journal_replay(tmp_path):
+    journal = tmp_path / "memo.journal"
+    written = []
+
+    async def writer(memos):
+        written.extend((memo.user_id, memo.content) for memo in memos)
+
+    async def crash():
+        buffer = MemoWriteBuffer(journal_path=journal)
+        await buffer.put(1, "first")
+        await buffer.put(2, "second")
+        await buffer.flush_user(1, writer)
+        await buffer.put(2, "second v2")
+        # stop() 없이 종료
+
+    async def restart():
+        buffer = MemoWriteBuffer(journal_path=journal)
+        await buffer.start(writer)
+        await buffer.stop()
+        return len(buffer)
+
+    asyncio.run(crash())
+    written.clear()
+    assert asyncio.run(restart()) == 0
+    # 이미 기록된 user 1은 다시 쓰지 않고, user 2는 마지막 값만 기록
+    assert written == [(2, "second v2")]
+    assert journal.read_text() == ""
+
+
+def test_journal_keeps_put_during_flush_user(tmp_path):
+    # flush_user 기록 중에 들어온 같은 사용자의 새 값은 재시작 후 replay되어야 함
+    journal = tmp_path / "memo.journal"
+    written = []
+
+    async def crash():
+        buffer = MemoWriteBuffer(journal_path=journal)
+        release = asyncio.Event()
+
+        async def slow_writer(memos):
+            await release.wait()
+            written.extend(memo.content for memo in memos)
+
+        await buffer.put(1, "older")
+        flush_user = asyncio.create_task(buffer.flush_user(1, slow_writer))
+        await asyncio.sleep(0)
+        await buffer.put(1, "newer")
+        release.set()
+        assert await flush_user is True
+        # stop() 없이 종료
+
+    asyncio.run(crash())
+    assert written == ["older"]
+    replayed = MemoWriteBuffer(journal_path=journal)._read_journal()
+    assert {user_id: entry.content for user_id, entry in replayed.items()} == {1: "newer"}
+
+
+def test_flush_user_waits_for_running_flush():
+    buffer = MemoWriteBuffer()
+    written = []
+
+    async def run():
+        release = asyncio.Event()
+
+        async def slow_writer(memos):
+            await release.wait()
+            written.extend(memo.content for memo in memos)
+
+        async def writer(memos):
+            written.extend(memo.content for memo in memos)
+
+        await buffer.put(1, "older")
+        flush = asyncio.create_task(buffer.flush(slow_writer))
+        await asyncio.sleep(0)
+        # 기록 중인 값도 보임
+        assert buffer.get(1).content == "older"
+
+        # 조회 전 flush_user는 진행 중인 batch가 커밋될 때까지 기다린 뒤 새 값을 기록
+        await buffer.put(1, "newer")
+        flush_user = asyncio.create_task(buffer.flush_user(1, writer))
+        await asyncio.sleep(0)
+        assert written == []
+        release.set()
+        await flush
+        assert await flush_user is True
+
+    asyncio.run(run())
+    assert written == ["older", "newer"]
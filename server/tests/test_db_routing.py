@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from nexlist.auth.models import User
+from nexlist.cache.versions import versions
+from nexlist.config import settings
+from nexlist.db.database import Base
+from nexlist.db.routing import RoutingSession, use_primary
+from nexlist.db.threadpool import ThreadPoolRepository
+from nexlist.todos.models import Todo
+from nexlist.todos.repository import AsyncTodoRepository, TodoRepository
+from nexlist.todos.schemas import TodoCompletedState
+from nexlist.todos.service import TODOS_SCOPE, TodoService
+
+
+@pytest.fixture
+def db_urls(tmp_path):
+    # primary / replica 대신 SQLite 파일 두 개 사용, 라우팅 확인을 위해 task 이름만 다르게 시딩
+    urls = {}
+    for name in ("primary", "replica"):
+        urls[name] = f"sqlite:///{tmp_path / name}.db"
+        engine = create_engine(urls[name])
+        Base.metadata.create_all(bind=engine)
+        with sessionmaker(bind=engine)() as db:
+            db.add(User(id=1, email="a@nexlist.dev", google_sub="sub"))
+            db.add(Todo(id=1, user_id=1, task=f"from {name}", today=True, is_done=False))
+            db.commit()
+        engine.dispose()
+    return urls
+
+
+@pytest.fixture
+def SessionRouting(db_urls):
+    primary = create_engine(db_urls["primary"])
+    replica = create_engine(db_urls["replica"])
+    yield sessionmaker(class_=RoutingSession, primary=primary, replica=replica)
+    primary.dispose()
+    replica.dispose()
+
+
+def test_reads_go_to_replica(SessionRouting):
+    with SessionRouting() as db:
+        repo = TodoRepository(db)
+        assert [t.task for t in repo.get_all_todos(1, None)] == ["from replica"]
+        assert repo.get_todo_by_id(1, 1).task == "from replica"
+
+
+def test_write_sticks_session_to_primary(SessionRouting):
+    with SessionRouting() as db:
+        repo = TodoRepository(db)
+        todo = repo.update_completed_state_by_id(1, TodoCompletedState(is_done=True), 1)
+        # 쓰기 이후 같은 세션의 조회는 primary에서 (read-your-writes)
+        assert todo.task == "from primary"
+        assert todo.is_done is True
+        assert [t.task for t in repo.get_all_todos(1, None)] == ["from primary"]
+
+    # 새 세션(= 새 요청)은 다시 replica에서 읽음
+    with SessionRouting() as db:
+        assert TodoRepository(db).get_todo_by_id(1, 1).task == "from replica"
+
+
+def test_use_primary(SessionRouting):
+    with SessionRouting() as db:
+        use_primary(db)
+        assert TodoRepository(db).get_todo_by_id(1, 1).task == "from primary"
+
+
+def test_clear_range_is_read_from_primary(SessionRouting):
+    # replica에 아직 없는 todo도 목록 초기화 범위에 포함
+    with SessionRouting() as db:
+        db.add(Todo(id=2, user_id=1, task="only on primary"))
+        db.commit()
+    with SessionRouting() as db:
+        assert TodoRepository(db).get_max_todo_id(1) == 2
+
+
+def test_without_replica_everything_goes_to_primary(db_urls):
+    primary = create_engine(db_urls["primary"])
+    with sessionmaker(class_=RoutingSession, primary=primary)() as db:
+        assert TodoRepository(db).get_todo_by_id(1, 1).task == "from primary"
+    primary.dispose()
+
+
+def test_async_routing(db_urls):
+    async def scenario():
+        primary = create_async_engine(db_urls["primary"].replace("sqlite", "sqlite+aiosqlite"))
+        replica = create_async_engine(db_urls["replica"].replace("sqlite", "sqlite+aiosqlite"))
+        AsyncSessionRouting = async_sessionmaker(
+            sync_session_class=RoutingSession,
+            primary=primary.sync_engine,
+            replica=replica.sync_engine,
+            expire_on_commit=False,
+        )
+        async with AsyncSessionRouting() as db:
+            repo = AsyncTodoRepository(db)
+            before = (await repo.get_todo_by_id(1, 1)).task
+            after = (await repo.update_completed_state_by_id(1, TodoCompletedState(is_done=True), 1)).task
+        await primary.dispose()
+        await replica.dispose()
+        return before, after
+
+    assert asyncio.run(scenario()) == ("from replica", "from primary")
+
+
+def test_recent_writer_reads_from_primary(SessionRouting, monkeypatch):
+    # 쓰기로 버전(ETag)이 올라간 직후에는 replica 지연 중인 본문에 최신 ETag가 붙지 않도록 primary에서 조회
+    user = User(id=1)
+
+    def read_tasks():
+        with SessionRouting() as db:
+            service = TodoService(ThreadPoolRepository(TodoRepository(db)))
+            todos, _ = asyncio.run(service.get_todo_page(user, None))
+            return [t.task for t in todos]
+
+    assert read_tasks() == ["from replica"]
+    versions.bump(TODOS_SCOPE, user.id)
+    assert read_tasks() == ["from primary"]
+
+    monkeypatch.setattr(settings, "DB_REPLICA_STICKY_SECONDS", 0)
+    assert read_tasks() == ["from replica"]
+
+
+def test_list_cache_is_filled_from_primary(SessionRouting, todo_list_cache):
+    # 캐시에 넣은 목록은 TTL 동안 재사용되므로 replica 지연 중인 목록을 넣지 않음
+    with SessionRouting() as db:
+        service = TodoService(ThreadPoolRepository(TodoRepository(db)), todo_list_cache)
+        body, _ = asyncio.run(service.get_todo_list_json(User(id=1), None))
+    assert b"from primary" in body
+    assert asyncio.run(todo_list_cache.get(1, None)) == body
@@ -0,0 +1,31 @@
+from prometheus_client import REGISTRY
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_db_queries_per_request(client):
+    before_count = sample("nexlist_db_queries_per_request_count", handler="/todos/{id}/completed")
+    before_sum = sample("nexlist_db_queries_per_request_sum", handler="/todos/{id}/completed")
+
+    todo = client.post("/todos/", json={"task": "Task", "today": True}).json()
+    client.put(f"/todos/{todo['id']}/completed", json={"is_done": True})
+
+    assert sample("nexlist_db_queries_per_request_count", handler="/todos/{id}/completed") == before_count + 1
+    assert sample("nexlist_db_queries_per_request_sum", handler="/todos/{id}/completed") == before_sum + 2
+
+
+def test_query_duration_and_pool_metrics(client, db_mode):
+    before = sample("nexlist_db_query_duration_seconds_count", engine=f"test_{db_mode}", statement="SELECT")
+    client.get("/todos/")
+
+    assert sample("nexlist_db_query_duration_seconds_count", engine=f"test_{db_mode}", statement="SELECT") > before
+    assert REGISTRY.get_sample_value("nexlist_db_pool_checked_out", {"engine": f"test_{db_mode}"}) == 0
+
+
+def test_auth_cache_metrics(client):
+    client.get("/todos/")
+    client.get("/todos/")
+    assert sample("nexlist_cache_hits_total", cache="auth_user") >= 1
+    assert sample("nexlist_cache_misses_total", cache="auth_user") >= 1
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import QueuePool, create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from nexlist.db.database import Base
+from nexlist.db.startup import (
+    Readiness,
+    SchemaMismatchError,
+    UnversionedSchemaError,
+    alembic_config,
+    create_tables_and_stamp,
+    get_head_revision,
+    prewarm_pool,
+    verify_schema_revision,
+)
+from nexlist.health.router import router as health_router
+
+
+@pytest.fixture
+def url(tmp_path):
+    return f"sqlite:///{tmp_path / 'startup.db'}"
+
+
+@pytest.fixture
+def pooled_engine(url):
+    engine = create_engine(url, poolclass=QueuePool, pool_size=3, max_overflow=2)
+    yield engine
+    engine.dispose()
+
+
+def test_schema_check_fails_without_alembic_revision(engine):
+    # create_all만 하고 stamp하지 않은 DB
+    with pytest.raises(SchemaMismatchError) as e:
+        asyncio.run(verify_schema_revision(engine))
+    assert e.value.current is None
+    assert e.value.head == get_head_revision()
+
+
+def test_create_tables_and_stamp_marks_head(pooled_engine):
+    asyncio.run(create_tables_and_stamp(pooled_engine, Base.metadata))
+    assert asyncio.run(verify_schema_revision(pooled_engine)) == get_head_revision()
+
+
+def test_create_tables_refuses_unversioned_tables(pooled_engine):
+    # import 시점 create_all로 만든 DB: head로 stamp하면 이후 마이그레이션의 컬럼이 빠진 채로 남음
+    Base.metadata.create_all(bind=pooled_engine)
+    with pytest.raises(UnversionedSchemaError) as e:
+        asyncio.run(create_tables_and_stamp(pooled_engine, Base.metadata))
+    assert "alembic stamp" in str(e.value)
+    with pytest.raises(SchemaMismatchError):
+        asyncio.run(verify_schema_revision(pooled_engine))
+
+
+def test_prewarm_fills_pool_up_to_pool_size(pooled_engine):
+    assert asyncio.run(prewarm_pool(pooled_engine, 10)) == 3
+    assert pooled_engine.pool.checkedin() == 3
+    assert pooled_engine.pool.checkedout() == 0
+
+
+def test_prewarm_async_engine(url):
+    async def run():
+        engine = create_async_engine(url.replace("sqlite://", "sqlite+aiosqlite://"), pool_size=2)
+        try:
+            warmed = await prewarm_pool(engine, 5)
+            return warmed, engine.pool.checkedin()
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(run()) == (2, 2)
+
+
+def test_readiness_recovers_after_migration(pooled_engine):
+    Base.metadata.create_all(bind=pooled_engine)
+    readiness = Readiness(pooled_engine)
+    assert asyncio.run(readiness.check()) is False
+    assert "alembic head" in readiness.detail
+
+    # 배포 중 마이그레이션이 끝나면 다음 probe에서 ready
+    with pooled_engine.begin() as connection:
+        MigrationContext.configure(connection).stamp(ScriptDirectory.from_config(alembic_config()), "head")
+    assert asyncio.run(readiness.check()) is True
+    assert readiness.detail == "ok"
+
+
+def test_readiness_reports_unreachable_database(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'missing' / 'x.db'}")
+    readiness = Readiness(engine)
+    assert asyncio.run(readiness.check()) is False
+    assert readiness.detail.startswith("database unavailable")
+
+
+def test_health_endpoints(pooled_engine):
+    app = FastAPI()
+    app.include_router(health_router)
+
+    with TestClient(app) as client:
+        assert client.get("/healthz").status_code == 200
+        # lifespan이 readiness를 만들기 전
+        assert client.get("/readyz").status_code == 503
+
+        app.state.readiness = Readiness(pooled_engine)
+        response = client.get("/readyz")
+        assert response.status_code == 503
+        assert client.get("/healthz").status_code == 200
+
+        asyncio.run(create_tables_and_stamp(pooled_engine, Base.metadata))
+        response = client.get("/readyz")
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
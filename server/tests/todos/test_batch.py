@@ -0,0 +1,60 @@
+def create_many(client, count: int) -> list[dict]:
+    items = [{"task": f"Task {i}", "today": False} for i in range(count)]
+    response = client.post("/todos/batch", json={"items": items})
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_batch_create(client):
+    todos = create_many(client, 3)
+    assert [t["task"] for t in todos] == ["Task 0", "Task 1", "Task 2"]
+    assert all(t["is_done"] is False for t in todos)
+    assert [t["id"] for t in client.get("/todos/").json()] == [t["id"] for t in todos]
+
+
+def test_batch_completed_and_move(client):
+    ids = [t["id"] for t in create_many(client, 3)]
+    missing = ids[-1] + 100
+
+    response = client.put("/todos/batch/completed", json={"ids": [ids[0], missing, ids[1]], "is_done": True})
+    assert response.status_code == 200
+    assert response.json() == [
+        {"id": ids[0], "ok": True},
+        {"id": missing, "ok": False},
+        {"id": ids[1], "ok": True},
+    ]
+
+    response = client.put("/todos/batch/move", json={"ids": ids, "today": True})
+    assert all(result["ok"] for result in response.json())
+
+    todos = {t["id"]: t for t in client.get("/todos/").json()}
+    assert [todos[i]["is_done"] for i in ids] == [True, True, False]
+    assert all(todos[i]["today"] for i in ids)
+
+
+def test_batch_delete(client):
+    ids = [t["id"] for t in create_many(client, 3)]
+
+    response = client.post("/todos/batch/delete", json={"ids": [ids[0], ids[0], ids[2]]})
+    assert response.json() == [{"id": ids[0], "ok": True}, {"id": ids[2], "ok": True}]
+    assert [t["id"] for t in client.get("/todos/").json()] == [ids[1]]
+
+    response = client.post("/todos/batch/delete", json={"ids": [ids[0]]})
+    assert response.json() == [{"id": ids[0], "ok": False}]
+
+
+def test_batch_statement_budget(client, queries):
+    ids = [t["id"] for t in create_many(client, 20)]
+
+    queries.clear()
+    client.put("/todos/batch/completed", json={"ids": ids, "is_done": True})
+    assert len(queries) == 2  # UPDATE + SELECT id
+
+    queries.clear()
+    client.post("/todos/batch/delete", json={"ids": ids})
+    assert len(queries) == 3  # SELECT id FOR UPDATE + DELETE + INSERT tombstones
+
+
+def test_batch_validation(client):
+    assert client.put("/todos/batch/completed", json={"ids": [], "is_done": True}).status_code == 422
+    assert client.post("/todos/batch", json={"items": []}).status_code == 422
@@ -0,0 +1,137 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import select, text
+
+from nexlist.config import settings
+from nexlist.todos.changes import from_cursor, to_cursor, utcnow
+from nexlist.todos.models import TodoTombstone
+from nexlist.todos.rollover import TodoRollover
+from nexlist.todos.tombstones import TombstonePruner, TombstonePruneScheduler
+
+from .test_todos import create
+
+
+@pytest.fixture(autouse=True)
+def no_settle(monkeypatch):
+    monkeypatch.setattr(settings, "TODO_CHANGES_SETTLE_SECONDS", 0)
+
+
+def changes(client, since=None) -> dict:
+    params = {} if since is None else {"since": since}
+    response = client.get("/todos/changes", params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def tasks(body) -> list[str]:
+    return [todo["task"] for todo in body["todos"]]
+
+
+def test_initial_sync_returns_full_list(client):
+    a = create(client, "a")
+    b = create(client, "b")
+    body = changes(client)
+    assert body["todos"] == [a, b]
+    assert body["deleted"] == []
+    assert body["cursor"] <= to_cursor(utcnow())
+
+
+def test_only_changes_since_cursor(client):
+    a = create(client, "a")
+    b = create(client, "b")
+    c = create(client, "c")
+    cursor = changes(client)["cursor"]
+    assert changes(client, cursor)["todos"] == []
+
+    client.put(f"/todos/{a['id']}", json={"task": "a2", "today": True})
+    client.put("/todos/batch/completed", json={"ids": [c["id"]], "is_done": True})
+    client.delete(f"/todos/{b['id']}")
+    d = create(client, "d")
+
+    body = changes(client, cursor)
+    assert tasks(body) == ["a2", "c", "d"]
+    assert body["deleted"] == [b["id"]]
+
+    body = changes(client, body["cursor"])
+    assert body == {"todos": [], "deleted": [], "cursor": body["cursor"]}
+
+    client.post("/todos/batch/delete", json={"ids": [a["id"]]})
+    client.delete("/todos/")
+    later = changes(client, body["cursor"])
+    assert later["todos"] == []
+    assert sorted(later["deleted"]) == sorted([a["id"], c["id"], d["id"]])
+
+
+def test_cursor_lags_by_settle_window(client, monkeypatch):
+    monkeypatch.setattr(settings, "TODO_CHANGES_SETTLE_SECONDS", 60)
+    create(client, "a")
+    first = changes(client)
+    # 아직 settle 구간 안의 변경은 다음 동기화에서 다시 전달
+    assert tasks(changes(client, first["cursor"])) == ["a"]
+    # cursor는 뒤로 가지 않음
+    assert changes(client, first["cursor"] + 10**9)["cursor"] == first["cursor"] + 10**9
+
+
+def test_expired_cursor_requires_full_sync(client):
+    expired = to_cursor(utcnow() - timedelta(days=settings.TODO_TOMBSTONE_RETENTION_DAYS + 1))
+    assert client.get("/todos/changes", params={"since": expired}).status_code == 410
+    assert client.get("/todos/changes", params={"since": -1}).status_code == 422
+
+
+def test_rollover_updates_are_synced(client, SessionTesting, todo_list_cache):
+    todo = create(client, "due", today=False, due_date=utcnow().date().isoformat())
+    cursor = changes(client)["cursor"]
+
+    asyncio.run(TodoRollover(SessionTesting, cache=todo_list_cache).run(utcnow().date()))
+    body = changes(client, cursor)
+    assert body["todos"] == [{**todo, "today": True}]
+
+
+def test_prune_old_tombstones(client, SessionTesting):
+    old = create(client, "old")
+    recent = create(client, "recent")
+    client.delete(f"/todos/{old['id']}")
+    client.delete(f"/todos/{recent['id']}")
+    with SessionTesting() as db:
+        db.execute(
+            TodoTombstone.__table__.update()
+            .where(TodoTombstone.todo_id == old["id"])
+            .values(deleted_at=utcnow() - timedelta(days=31))
+        )
+        db.commit()
+
+    assert asyncio.run(TombstonePruner(SessionTesting, retention_days=30, batch_size=1).prune()) == 1
+    with SessionTesting() as db:
+        assert db.scalars(select(TodoTombstone.todo_id)).all() == [recent["id"]]
+
+
+def test_prune_scheduler_runs_on_start():
+    class Pruner:
+        runs = 0
+
+        async def prune(self) -> int:
+            self.runs += 1
+            return 0
+
+    async def scenario():
+        scheduler = TombstonePruneScheduler(Pruner(), interval=3600)
+        await scheduler.start()
+        await asyncio.sleep(0)
+        await scheduler.stop()
+        return scheduler.pruner.runs
+
+    assert asyncio.run(scenario()) == 1
+
+
+def test_cursor_round_trip():
+    moment = utcnow()
+    assert from_cursor(to_cursor(moment)) == moment
+
+
+def test_changes_indexes(engine):
+    with engine.connect() as conn:
+        names = conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'")).scalars().all()
+    assert "ix_todos_user_id_updated_at" in names
+    assert "ix_todo_tombstones_user_id_deleted_at" in names
@@ -0,0 +1,83 @@
+import time
+from datetime import date
+
+from nexlist.auth.jwt_utils import create_jwt_token
+from nexlist.auth.models import User
+
+from .test_todos import create
+
+
+def todo_deletes(statements: list[str]) -> list[str]:
+    return [s for s in statements if s.startswith("DELETE FROM todos")]
+
+
+def wait_for_job(client, location: str) -> dict:
+    deadline = time.monotonic() + 5
+    while True:
+        job = client.get(location).json()
+        if job["status"] != "running" or time.monotonic() > deadline:
+            return job
+        time.sleep(0.01)
+
+
+def test_small_list_is_deleted_inline_in_chunks(client, todo_clear_jobs, queries):
+    todo_clear_jobs.batch_size = 2
+    for i in range(5):
+        create(client, f"task {i}")
+
+    queries.clear()
+    assert client.delete("/todos/").status_code == 204
+    # 2 + 2 + 1
+    assert len(todo_deletes(queries)) == 3
+    assert client.get("/todos/").json() == []
+
+
+def test_large_list_is_deleted_in_background(client, todo_clear_jobs, todo_search_index):
+    todo_clear_jobs.batch_size = 2
+    todo_clear_jobs.inline_max_rows = 2
+    todo_clear_jobs.pause_seconds = 0.05
+    for i in range(7):
+        create(client, f"task {i}")
+    assert len(client.get("/todos/search", params={"q": "task"}).json()) == 7
+
+    response = client.delete("/todos/")
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "running"
+    assert job["deleted"] == 2
+    assert response.headers["Location"] == f"/todos/clear-jobs/{job['id']}"
+
+    # 진행 중에 다시 요청하면 같은 작업
+    again = client.delete("/todos/")
+    assert again.status_code == 202
+    assert again.json()["id"] == job["id"]
+
+    # 삭제 요청 이후 추가한 todo는 남음
+    survivor = create(client, "added later")
+
+    job = wait_for_job(client, response.headers["Location"])
+    assert job["status"] == "done"
+    assert job["deleted"] == 7
+    assert job["finished_at"] is not None
+    assert client.get("/todos/").json() == [survivor]
+    assert client.get("/todos/search", params={"q": "task"}).json() == []
+
+
+def test_clear_job_is_scoped_to_user(client, todo_clear_jobs, SessionTesting):
+    todo_clear_jobs.batch_size = 1
+    todo_clear_jobs.inline_max_rows = 1
+    for i in range(3):
+        create(client, f"task {i}")
+    location = client.delete("/todos/").headers["Location"]
+    wait_for_job(client, location)
+
+    assert client.get(location).status_code == 200
+    assert client.get("/todos/clear-jobs/unknown").status_code == 404
+
+    with SessionTesting() as db:
+        other = User(email="other@nexlist.dev", name="Other", google_sub="other", created_at=date.today())
+        db.add(other)
+        db.commit()
+        other_id = other.id
+    client.cookies.set("access_token", create_jwt_token({"user_id": other_id}))
+    assert client.get(location).status_code == 404
@@ -0,0 +1,51 @@
+from nexlist.cache.versions import VersionStore
+
+
+def test_todo_list_conditional_get(client, queries):
+    client.post("/todos/", json={"task": "Task", "today": True})
+
+    response = client.get("/todos/")
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+    # 변경 없음: todos 테이블을 조회하지 않고 304
+    queries.clear()
+    response = client.get("/todos/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert queries == []
+
+    # 쓰기 이후에는 새 ETag로 200
+    client.put(f"/todos/{client.get('/todos/').json()[0]['id']}/completed", json={"is_done": True})
+    response = client.get("/todos/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()[0]["is_done"] is True
+
+
+def test_failed_write_keeps_etag(client):
+    etag = client.get("/todos/").headers["ETag"]
+    assert client.delete("/todos/999").status_code == 404
+    assert client.get("/todos/", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_if_none_match_list_and_weak_tag(client):
+    etag = client.get("/todos/").headers["ETag"]
+    headers = {"If-None-Match": f'"other", W/{etag}'}
+    assert client.get("/todos/", headers=headers).status_code == 304
+
+
+def test_version_store_is_bounded():
+    store = VersionStore(max_users=2)
+    store.bump("todos", 1)
+    store.bump("todos", 1)
+    store.bump("todos", 2)
+    etag = store.etag("todos", 3)
+    store.bump("todos", 3)
+    assert len(store) == 2
+    assert not store.changed_within("todos", 1, 60)
+    # 방출된 사용자의 버전은 줄어들지 않음 (이전 ETag가 다른 내용에 다시 붙지 않음)
+    assert store.get("todos", 1) == 2
+    assert store.bump("todos", 1) == 3
+    # 방출 이후 처음 보는 사용자도 이전에 받은 ETag와 겹치지 않음
+    assert store.etag("todos", 3) != etag
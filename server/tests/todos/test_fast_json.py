@@ -0,0 +1,36 @@
+import pytest
+
+from nexlist.config import settings
+
+from .test_todos import create
+
+
+@pytest.fixture
+def todos(client):
+    create(client, "오늘 할 일 ✓", today=True)
+    create(client, 'quote " and \\ backslash', today=False, due_date=None)
+    done = create(client, "done", today=True)
+    client.put(f"/todos/{done['id']}/completed", json={"is_done": True})
+    create(client, "later", today=False)
+
+
+@pytest.mark.parametrize("params", [{}, {"today": True}, {"today": False}, {"limit": 2}, {"cursor": 2, "limit": 1}])
+def test_fast_json_matches_response_model(client, todos, monkeypatch, params):
+    fast = client.get("/todos/", params=params)
+
+    monkeypatch.setattr(settings, "TODO_FAST_JSON", False)
+    slow = client.get("/todos/", params=params)
+
+    assert fast.status_code == slow.status_code == 200
+    assert fast.content == slow.content
+    assert fast.headers["content-type"] == slow.headers["content-type"]
+    for header in ("ETag", "X-Next-Cursor"):
+        assert fast.headers.get(header) == slow.headers.get(header)
+
+
+def test_fast_json_projects_columns(client, todos, queries):
+    queries.clear()
+    client.get("/todos/")
+    select = next(q for q in queries if "FROM todos" in q)
+    # 응답에 필요 없는 user_id 컬럼은 조회하지 않음
+    assert "todos.user_id," not in select.split("FROM")[0]
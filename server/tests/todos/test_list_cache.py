@@ -0,0 +1,221 @@
+import asyncio
+import fnmatch
+import time
+
+import pytest
+
+from nexlist.auth.models import User
+from nexlist.todos.cache import (
+    MemoryBackend,
+    RedisBackend,
+    TodoListCache,
+    get_todo_list_cache,
+)
+from nexlist.todos.service import TodoService, todos_changed
+
+from .test_todos import create
+
+
+class FakeRedis:
+    """ RedisBackend가 사용하는 명령만 구현한 로컬 fake (PX 만료 포함) """
+
+    def __init__(self):
+        self.data: dict[str, tuple[float, bytes]] = {}
+
+    async def get(self, key):
+        entry = self.data.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            self.data.pop(key, None)
+            return None
+        return entry[1]
+
+    async def set(self, key, value, px):
+        self.data[key] = (time.monotonic() + px / 1000, value)
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def incr(self, key):
+        value = int(await self.get(key) or 0) + 1
+        self.data[key] = (float("inf"), str(value).encode())
+        return value
+
+    async def scan_iter(self, match):
+        for key in list(self.data):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+    async def aclose(self):
+        pass
+
+
+class DownRedis(FakeRedis):
+    """ 모든 명령이 연결 오류 """
+
+    def __getattribute__(self, name):
+        if name in ("get", "set", "delete", "incr"):
+            async def fail(*args, **kwargs):
+                raise ConnectionError("redis unavailable")
+            return fail
+        return super().__getattribute__(name)
+
+
+def todo_selects(statements: list[str]) -> list[str]:
+    return [s for s in statements if "FROM todos" in s]
+
+
+@pytest.fixture(params=["memory", "redis"])
+def list_cache(request, app, todo_list_cache):
+    if request.param == "memory":
+        return todo_list_cache
+    cache = TodoListCache(RedisBackend(FakeRedis(), prefix="test:"), ttl_seconds=60)
+    app.dependency_overrides[get_todo_list_cache] = lambda: cache
+    return cache
+
+
+def test_list_is_served_from_cache(client, list_cache, queries):
+    create(client, "Task")
+    first = client.get("/todos/")
+    assert list_cache.stats()["misses"] == 1
+
+    queries.clear()
+    second = client.get("/todos/")
+    assert second.content == first.content
+    assert todo_selects(queries) == []
+    assert list_cache.stats()["hits"] == 1
+
+
+def test_today_filters_are_cached_separately(client, list_cache):
+    create(client, "Today", today=True)
+    create(client, "Later", today=False)
+
+    for _ in range(2):
+        assert [t["task"] for t in client.get("/todos/").json()] == ["Today", "Later"]
+        assert [t["task"] for t in client.get("/todos/", params={"today": True}).json()] == ["Today"]
+        assert [t["task"] for t in client.get("/todos/", params={"today": False}).json()] == ["Later"]
+    assert list_cache.stats()["misses"] == 3
+    assert list_cache.stats()["hits"] == 3
+
+
+WRITES = {
+    "create": lambda client, todo: client.post("/todos/", json={"task": "New", "today": False}),
+    "create_batch": lambda client, todo: client.post("/todos/batch", json={"items": [{"task": "New", "today": False}]}),
+    "update": lambda client, todo: client.put(f"/todos/{todo['id']}", json={"task": "Renamed", "today": True}),
+    "completed": lambda client, todo: client.put(f"/todos/{todo['id']}/completed", json={"is_done": True}),
+    "move": lambda client, todo: client.put(f"/todos/{todo['id']}/move", json={"today": False}),
+    "batch_completed": lambda client, todo: client.put("/todos/batch/completed", json={"ids": [todo["id"]], "is_done": True}),
+    "batch_move": lambda client, todo: client.put("/todos/batch/move", json={"ids": [todo["id"]], "today": False}),
+    "batch_delete": lambda client, todo: client.post("/todos/batch/delete", json={"ids": [todo["id"]]}),
+    "delete": lambda client, todo: client.delete(f"/todos/{todo['id']}"),
+    "delete_all": lambda client, todo: client.delete("/todos/"),
+}
+
+
+@pytest.mark.parametrize("write", WRITES)
+def test_writes_invalidate_every_filter(client, list_cache, write):
+    todo = create(client, "Task", today=True)
+    params = [{}, {"today": True}, {"today": False}]
+    before = [client.get("/todos/", params=p).json() for p in params]
+
+    assert WRITES[write](client, todo).status_code < 300
+
+    after = [client.get("/todos/", params=p).json() for p in params]
+    assert after != before
+    # 캐시를 거치지 않은 응답과 같아야 함
+    assert after == [client.get("/todos/", params={**p, "limit": 1000}).json() for p in params]
+
+
+def test_failed_write_keeps_cache(client, list_cache):
+    create(client, "Task")
+    client.get("/todos/")
+    assert client.delete("/todos/999").status_code == 404
+    client.get("/todos/")
+    assert list_cache.stats()["hits"] == 1
+
+
+def test_pages_bypass_cache(client, list_cache):
+    create(client, "A")
+    create(client, "B")
+    client.get("/todos/", params={"limit": 1})
+    client.get("/todos/", params={"cursor": 1})
+    assert list_cache.stats()["hits"] == list_cache.stats()["misses"] == 0
+
+
+def test_entries_expire(list_cache):
+    list_cache.ttl_seconds = 0.05
+
+    async def scenario():
+        await list_cache.set(1, None, b"[]")
+        assert await list_cache.get(1, None) == b"[]"
+        await asyncio.sleep(0.1)
+        assert await list_cache.get(1, None) is None
+
+    asyncio.run(scenario())
+
+
+def test_generation_counters_are_bounded():
+    cache = TodoListCache(MemoryBackend(max_size=100, ttl_seconds=60, max_counters=1), ttl_seconds=60)
+
+    async def scenario():
+        await cache.invalidate(1)
+        await cache.set(1, None, b"old")
+        # 사용자 1의 세대 카운터 방출
+        await cache.invalidate(2)
+        assert len(cache.backend.counters) == 1
+        await cache.set(1, None, b"new")
+        # 방출 후 쓰기로 올라간 세대에서 방출 전 세대의 항목이 다시 조회되지 않음
+        await cache.invalidate(1)
+        return await cache.get(1, None)
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_concurrent_write_is_not_cached(list_cache):
+    user = User(id=1)
+
+    class Repository:
+        async def use_primary(self):
+            pass
+
+        async def get_todo_rows(self, user_id, today, cursor=None, limit=None):
+            # 조회 도중 다른 요청의 쓰기가 커밋됨
+            await todos_changed(user_id, list_cache)
+            return []
+
+    service = TodoService(Repository(), list_cache)
+    asyncio.run(service.get_todo_list_json(user, None))
+    assert asyncio.run(list_cache.get(user.id, None)) is None
+
+
+def test_other_worker_write_invalidates_shared_redis():
+    # 같은 redis를 쓰는 두 워커: 세대 카운터도 redis에 있으므로 다른 워커의 쓰기가 바로 반영됨
+    redis = FakeRedis()
+    worker_a = TodoListCache(RedisBackend(redis), ttl_seconds=60)
+    worker_b = TodoListCache(RedisBackend(redis), ttl_seconds=60)
+
+    async def scenario():
+        generation = await worker_a.generation(1)
+        await worker_b.invalidate(1)
+        # worker_a가 쓰기 이전에 읽은 목록은 이전 세대에 저장되어 조회되지 않음
+        await worker_a.set(1, None, b"[stale]", generation)
+        assert await worker_a.get(1, None) is None
+        assert await worker_b.get(1, None) is None
+
+        await worker_a.set(1, None, b"[]")
+        assert await worker_b.get(1, None) == b"[]"
+        await worker_a.invalidate(1)
+        assert await worker_b.get(1, None) is None
+
+    asyncio.run(scenario())
+
+
+def test_redis_outage_falls_back_to_db(client, app):
+    cache = TodoListCache(RedisBackend(DownRedis()), ttl_seconds=60)
+    app.dependency_overrides[get_todo_list_cache] = lambda: cache
+
+    todo = create(client, "Task")
+    assert client.get("/todos/").json() == [todo]
+    assert client.put(f"/todos/{todo['id']}/completed", json={"is_done": True}).status_code == 200
+    assert client.get("/todos/").json() == [{**todo, "is_done": True}]
+    assert client.delete(f"/todos/{todo['id']}").status_code == 204
+    assert cache.stats()["hits"] == 0
@@ -0,0 +1,96 @@
+from datetime import date, timedelta
+
+from nexlist.todos import repository as todo_repository
+from nexlist.todos.repository import todo_list_statement
+from nexlist.todos.schemas import TodoListFilters
+
+from .test_todos import create
+
+
+def day(offset: int) -> str:
+    return (date.today() + timedelta(days=offset)).isoformat()
+
+
+def tasks(response) -> list[str]:
+    assert response.status_code == 200, response.text
+    return [todo["task"] for todo in response.json()]
+
+
+def seed(client):
+    create(client, "last week", due_date=day(-7))
+    create(client, "yesterday", due_date=day(-1))
+    done = create(client, "done yesterday", due_date=day(-1))
+    client.put(f"/todos/{done['id']}/completed", json={"is_done": True})
+    create(client, "today", due_date=day(0))
+    create(client, "next week", due_date=day(7))
+    create(client, "no due date", due_date=None)
+
+
+def test_due_date_range_is_exclusive(client):
+    seed(client)
+    assert tasks(client.get("/todos/", params={"due_before": day(0)})) == ["last week", "yesterday", "done yesterday"]
+    assert tasks(client.get("/todos/", params={"due_after": day(-1)})) == ["today", "next week"]
+    assert tasks(client.get("/todos/", params={"due_after": day(-7), "due_before": day(7)})) == [
+        "yesterday", "done yesterday", "today"
+    ]
+
+
+def test_overdue_and_is_done(client):
+    seed(client)
+    assert tasks(client.get("/todos/", params={"overdue": True})) == ["last week", "yesterday"]
+    assert tasks(client.get("/todos/", params={"is_done": True})) == ["done yesterday"]
+    assert "done yesterday" not in tasks(client.get("/todos/", params={"is_done": False}))
+    assert tasks(client.get("/todos/", params={"overdue": True, "due_after": day(-7)})) == ["yesterday"]
+
+
+def test_filters_combine_with_pagination_and_stream(client):
+    seed(client)
+    first = client.get("/todos/", params={"due_before": day(1), "limit": 2})
+    assert tasks(first) == ["last week", "yesterday"]
+    rest = client.get("/todos/", params={"due_before": day(1), "cursor": first.headers["X-Next-Cursor"]})
+    assert tasks(rest) == ["done yesterday", "today"]
+
+    streamed = client.get("/todos/", params={"overdue": True, "stream": True})
+    assert len(streamed.text.splitlines()) == 2
+
+
+def test_filtered_list_bypasses_list_cache(client, todo_list_cache):
+    seed(client)
+    client.get("/todos/")
+    client.get("/todos/", params={"is_done": True})
+    assert todo_list_cache.stats()["misses"] == 1
+    assert todo_list_cache.stats()["size"] == 1
+
+
+def test_filters_are_pushed_down_to_sql(client, queries):
+    seed(client)
+    queries.clear()
+    client.get("/todos/", params={"overdue": True, "due_after": day(-30)})
+    [statement] = [s for s in queries if "FROM todos" in s]
+    assert "todos.due_date <" in statement
+    assert "todos.due_date >" in statement
+    assert "todos.is_done IS NOT 1" in statement
+
+
+def test_overdue_etag_changes_with_date(client, monkeypatch):
+    create(client, "task", due_date=day(0))
+    first = client.get("/todos/", params={"overdue": True})
+    assert first.json() == []
+    assert client.get("/todos/").headers["ETag"] != first.headers["ETag"]
+
+    class Tomorrow(date):
+        @classmethod
+        def today(cls):
+            return date.today() + timedelta(days=1)
+
+    monkeypatch.setattr(todo_repository, "date", Tomorrow)
+    monkeypatch.setattr("nexlist.todos.service.date", Tomorrow)
+    response = client.get("/todos/", params={"overdue": True}, headers={"If-None-Match": first.headers["ETag"]})
+    assert tasks(response) == ["task"]
+
+
+def test_empty_filters():
+    assert TodoListFilters().is_empty()
+    assert not TodoListFilters(is_done=False).is_empty()
+    plain = str(todo_list_statement(1, None, filters=TodoListFilters()))
+    assert plain == str(todo_list_statement(1, None))
@@ -0,0 +1,198 @@
+import asyncio
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from sqlalchemy import event, select
+
+from nexlist.cache.versions import versions
+from nexlist.config import settings
+from nexlist.todos.models import Todo, TodoRolloverCheckpoint
+from nexlist.todos.rollover import (
+    RolloverScheduler,
+    TodoRollover,
+    get_todo_rollover_scheduler,
+)
+from nexlist.todos.service import TODOS_SCOPE
+
+RUN_DATE = date(2026, 10, 18)
+
+
+@pytest.fixture
+def add_todos(SessionTesting, user):
+    def add(*todos: dict) -> list[int]:
+        with SessionTesting() as db:
+            rows = [Todo(user_id=user.id, task=f"task {i}", **fields) for i, fields in enumerate(todos)]
+            db.add_all(rows)
+            db.commit()
+            return [row.id for row in rows]
+    return add
+
+
+@pytest.fixture
+def rollover(SessionTesting, todo_list_cache):
+    return TodoRollover(SessionTesting, batch_size=2, cache=todo_list_cache)
+
+
+@pytest.fixture
+def updates(engine):
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("UPDATE todos"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def today_flags(SessionTesting) -> dict[int, bool]:
+    with SessionTesting() as db:
+        return dict(db.execute(select(Todo.id, Todo.today).order_by(Todo.id)).all())
+
+
+def test_rollover_promotes_due_and_clears_done(rollover, add_todos, SessionTesting):
+    overdue, due, later, done_due, done_today, no_due = add_todos(
+        {"today": False, "due_date": RUN_DATE - timedelta(days=3)},
+        {"today": False, "due_date": RUN_DATE},
+        {"today": False, "due_date": RUN_DATE + timedelta(days=1)},
+        {"today": False, "due_date": RUN_DATE, "is_done": True},
+        {"today": True, "is_done": True},
+        {"today": True},
+    )
+
+    result = asyncio.run(rollover.run(RUN_DATE))
+    assert result.updated_rows == 3
+    assert today_flags(SessionTesting) == {
+        overdue: True, due: True, later: False, done_due: False, done_today: False, no_due: True,
+    }
+
+
+def test_rollover_updates_in_chunks(rollover, add_todos, updates, SessionTesting):
+    add_todos(*[{"today": False, "due_date": RUN_DATE} for _ in range(5)])
+
+    result = asyncio.run(rollover.run(RUN_DATE))
+    assert result.updated_rows == 5
+    # promote 3 chunk(2 + 2 + 1) + clear_done 대상 없음
+    assert len(updates) == 3
+    assert all(today_flags(SessionTesting).values())
+
+
+def test_rollover_updates_only_selected_rows(rollover, add_todos, engine, SessionTesting):
+    # 조회와 UPDATE 사이에 조건을 만족하게 된 행은 변경하지 않음 (그 사용자는 user_ids에 없어 무효화되지 않으므로)
+    first, changed, last = add_todos(
+        {"today": False, "due_date": RUN_DATE},
+        {"today": False, "due_date": RUN_DATE + timedelta(days=1)},
+        {"today": False, "due_date": RUN_DATE},
+    )
+    rollover.batch_size = 3
+    injected = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("UPDATE todos") and not injected:
+            injected.append(statement)
+            cursor.execute("UPDATE todos SET due_date = ? WHERE id = ?", (RUN_DATE.isoformat(), changed))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        result = asyncio.run(rollover.run(RUN_DATE))
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    assert result.updated_rows == 2
+    assert today_flags(SessionTesting) == {first: True, changed: False, last: True}
+
+
+def test_rollover_resumes_from_checkpoint(rollover, add_todos, updates, SessionTesting, monkeypatch):
+    add_todos(*[{"today": False, "due_date": RUN_DATE} for _ in range(5)])
+
+    run_chunk = rollover.run_chunk
+    calls = []
+
+    def failing_chunk(*args):
+        calls.append(args)
+        if len(calls) == 2:
+            raise RuntimeError("connection lost")
+        return run_chunk(*args)
+
+    monkeypatch.setattr(rollover, "run_chunk", failing_chunk)
+    with pytest.raises(RuntimeError):
+        asyncio.run(rollover.run(RUN_DATE))
+    assert sum(today_flags(SessionTesting).values()) == 2
+
+    monkeypatch.setattr(rollover, "run_chunk", run_chunk)
+    updates.clear()
+    result = asyncio.run(rollover.run(RUN_DATE))
+    assert result.updated_rows == 3
+    assert len(updates) == 2
+    with SessionTesting() as db:
+        checkpoint = db.get(TodoRolloverCheckpoint, RUN_DATE)
+        assert checkpoint.finished_at is not None
+        assert checkpoint.updated_rows == 5
+
+
+def test_finished_date_is_skipped_unless_restarted(rollover, add_todos, SessionTesting):
+    asyncio.run(rollover.run(RUN_DATE))
+    [todo_id] = add_todos({"today": False, "due_date": RUN_DATE})
+
+    assert asyncio.run(rollover.run(RUN_DATE)).skipped
+    assert today_flags(SessionTesting)[todo_id] is False
+
+    result = asyncio.run(rollover.run(RUN_DATE, restart=True))
+    assert not result.skipped
+    assert today_flags(SessionTesting)[todo_id] is True
+
+
+def test_rollover_invalidates_changed_users(client, rollover, add_todos, user, todo_list_cache):
+    add_todos({"today": False, "due_date": RUN_DATE})
+    etag = client.get("/todos/", params={"today": True}).headers["ETag"]
+    assert todo_list_cache.stats()["size"] == 1
+
+    asyncio.run(rollover.run(RUN_DATE))
+    assert versions.get(TODOS_SCOPE, user.id) == 1
+    assert todo_list_cache.stats()["size"] == 0
+    response = client.get("/todos/", params={"today": True}, headers={"If-None-Match": etag})
+    assert [todo["task"] for todo in response.json()] == ["task 0"]
+
+
+def test_rollover_endpoint_requires_ops_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "OPS_TOKEN", "")
+    assert client.post("/todos/rollover").status_code == 404
+
+    monkeypatch.setattr(settings, "OPS_TOKEN", "secret")
+    assert client.post("/todos/rollover").status_code == 401
+    assert client.post("/todos/rollover", headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+
+def test_rollover_endpoint_runs_in_server(app, client, rollover, add_todos, user, monkeypatch):
+    # 서버 프로세스 안에서 실행되므로 기존 ETag가 바로 무효화됨
+    monkeypatch.setattr(settings, "OPS_TOKEN", "secret")
+    app.dependency_overrides[get_todo_rollover_scheduler] = lambda: RolloverScheduler(rollover, time(0, 5))
+    add_todos({"today": False, "due_date": RUN_DATE})
+    etag = client.get("/todos/", params={"today": True}).headers["ETag"]
+
+    response = client.post(
+        "/todos/rollover", params={"date": RUN_DATE.isoformat()}, headers={"Authorization": "Bearer secret"}
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["run_date"], body["skipped"], body["updated_rows"], body["users"]) == (RUN_DATE.isoformat(), False, 1, 1)
+    response = client.get("/todos/", params={"today": True}, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert [todo["task"] for todo in response.json()] == ["task 0"]
+
+
+def test_slow_chunks_shrink_batch(SessionTesting, add_todos, updates):
+    add_todos(*[{"today": False, "due_date": RUN_DATE} for _ in range(7)])
+    rollover = TodoRollover(SessionTesting, steps=("promote",), batch_size=4, max_lock_seconds=0)
+
+    assert asyncio.run(rollover.run(RUN_DATE)).updated_rows == 7
+    # 4 -> 2 -> 1
+    assert len(updates) == 3
+
+
+def test_scheduler_next_run():
+    scheduler = RolloverScheduler(None, time(0, 5))
+    assert scheduler.next_run(datetime(2026, 10, 18, 0, 1)) == datetime(2026, 10, 18, 0, 5)
+    assert scheduler.next_run(datetime(2026, 10, 18, 0, 5)) == datetime(2026, 10, 19, 0, 5)
+    assert scheduler.next_run(datetime(2026, 10, 18, 23, 59)) == datetime(2026, 10, 19, 0, 5)
@@ -0,0 +1,116 @@
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.dialects import mysql
+
+from nexlist.auth.jwt_utils import create_jwt_token
+from nexlist.auth.models import User
+from nexlist.todos.repository import todo_search_statement
+from nexlist.todos.search import UserIndex, boolean_mode_phrase
+
+from .test_todos import create
+
+
+def search(client, q, **params):
+    response = client.get("/todos/search", params={"q": q, **params})
+    assert response.status_code == 200, response.text
+    return response
+
+
+def tasks(response) -> list[str]:
+    return [todo["task"] for todo in response.json()]
+
+
+def test_search_matches_phrase_and_ranks(client):
+    create(client, "주간 보고서 작성")
+    create(client, "보고 회의")
+    create(client, "보고서 보고서 검토")
+    create(client, "Write Report")
+
+    assert tasks(search(client, "보고서")) == ["보고서 보고서 검토", "주간 보고서 작성"]
+    assert tasks(search(client, "보고")) == ["보고서 보고서 검토", "보고 회의", "주간 보고서 작성"]
+    # 대소문자 / 연속 공백 무시
+    assert tasks(search(client, "write  REPORT")) == ["Write Report"]
+    assert search(client, "없는 단어").json() == []
+
+
+def test_search_returns_list_response_shape(client):
+    todo = create(client, "장보기 목록", today=False)
+    assert search(client, "장보기").json() == [todo]
+
+
+def test_search_is_paginated(client):
+    for i in range(5):
+        create(client, f"task {i}")
+
+    first = search(client, "task", limit=2)
+    assert tasks(first) == ["task 4", "task 3"]
+    assert first.headers["X-Next-Cursor"] == "2"
+
+    last = search(client, "task", limit=2, cursor=4)
+    assert tasks(last) == ["task 0"]
+    assert "X-Next-Cursor" not in last.headers
+
+
+def test_search_index_follows_writes(client, todo_search_index):
+    a = create(client, "우유 사기")
+    b = create(client, "우유 버리기")
+    assert len(search(client, "우유").json()) == 2
+
+    create(client, "우유 마시기")
+    client.post("/todos/batch", json={"items": [{"task": "저지방 우유", "today": True}]})
+    client.put(f"/todos/{a['id']}", json={"task": "빵 사기", "today": True})
+    client.delete(f"/todos/{b['id']}")
+    # 길이가 같으면 최근 todo 먼저
+    assert tasks(search(client, "우유")) == ["저지방 우유", "우유 마시기"]
+    assert tasks(search(client, "사기")) == ["빵 사기"]
+
+    ids = [todo["id"] for todo in search(client, "우유").json()]
+    client.post("/todos/batch/delete", json={"ids": ids[:1]})
+    assert tasks(search(client, "우유")) == ["우유 마시기"]
+
+    client.delete("/todos/")
+    assert search(client, "우유").json() == []
+
+
+def test_search_is_scoped_to_user(client, SessionTesting):
+    create(client, "secret plan")
+    with SessionTesting() as db:
+        other = User(email="other@nexlist.dev", name="Other", google_sub="other", created_at=date.today())
+        db.add(other)
+        db.commit()
+        other_id = other.id
+
+    client.cookies.set("access_token", create_jwt_token({"user_id": other_id}))
+    assert search(client, "secret").json() == []
+
+
+def test_search_query_validation(client):
+    assert client.get("/todos/search", params={"q": "a"}).status_code == 422
+    assert client.get("/todos/search").status_code == 422
+    assert client.get("/todos/search", params={"q": "ab", "limit": 0}).status_code == 422
+
+
+def test_user_index_requires_contiguous_phrase():
+    index = UserIndex()
+    index.add(1, "ab cd")
+    index.add(2, "abcd")
+    assert index.search("bc") == [2]
+    assert index.search("ab") == [2, 1]
+
+    index.remove(2)
+    assert index.search("bc") == []
+    assert "bc" not in index.postings
+
+
+def test_fulltext_statement():
+    sql = str(todo_search_statement(1, 'say "hi"', 20, 40).compile(dialect=mysql.dialect()))
+    assert "MATCH (todos.task) AGAINST (%s IN BOOLEAN MODE)" in sql
+    assert "LIMIT %s, %s" in sql
+    assert boolean_mode_phrase('say  "hi"') == '"say hi"'
+
+
+def test_fulltext_index_is_mysql_only(engine):
+    with engine.connect() as conn:
+        names = conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'")).scalars().all()
+    assert "ft_todos_task" not in names
@@ -0,0 +1,61 @@
+# 엔드포인트별 SQL 문 개수 상한 (인증 캐시가 채워진 상태 기준)
+from datetime import date
+
+import pytest
+
+from nexlist.auth.jwt_utils import create_jwt_token
+from nexlist.auth.models import User
+
+
+@pytest.fixture
+def todo_id(client):
+    response = client.post("/todos/", json={"task": "Budget", "today": True})
+    return response.json()["id"]
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "body", "budget"),
+    [
+        ("put", "/todos/{id}", {"task": "Changed", "today": True}, 2),  # UPDATE + SELECT
+        ("put", "/todos/{id}/completed", {"is_done": True}, 2),  # UPDATE + SELECT
+        ("put", "/todos/{id}/move", {"today": False}, 2),  # UPDATE + SELECT
+        ("delete", "/todos/{id}", None, 2),  # DELETE + INSERT tombstone
+    ],
+)
+def test_write_statement_budget(client, queries, todo_id, method, path, body, budget):
+    queries.clear()
+    kwargs = {"json": body} if body is not None else {}
+    response = client.request(method.upper(), path.format(id=todo_id), **kwargs)
+
+    assert response.status_code < 300
+    assert len(queries) == budget, queries
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "body"),
+    [
+        ("put", "/todos/{id}", {"task": "Changed", "today": True}),
+        ("put", "/todos/{id}/completed", {"is_done": True}),
+        ("put", "/todos/{id}/move", {"today": False}),
+        ("delete", "/todos/{id}", None),
+    ],
+)
+def test_missing_todo_costs_one_statement(client, queries, todo_id, method, path, body):
+    queries.clear()
+    kwargs = {"json": body} if body is not None else {}
+    response = client.request(method.upper(), path.format(id=todo_id + 1), **kwargs)
+
+    assert response.status_code == 404
+    assert len(queries) == 1, queries
+
+
+def test_other_users_todo_is_not_modified(client, SessionTesting, todo_id):
+    with SessionTesting() as db:
+        other = User(email="other@nexlist.dev", name="Other", google_sub="other", created_at=date.today())
+        db.add(other)
+        db.commit()
+        other_id = other.id
+
+    client.cookies.set("access_token", create_jwt_token({"user_id": other_id}))
+    assert client.put(f"/todos/{todo_id}/completed", json={"is_done": True}).status_code == 404
+    assert client.delete(f"/todos/{todo_id}").status_code == 404
@@ -0,0 +1,55 @@
+from datetime import date, timedelta
+
+from nexlist.todos import service as todo_service
+
+from .test_todos import create
+
+
+def todo_selects(statements: list[str]) -> list[str]:
+    return [s for s in statements if "FROM todos" in s]
+
+
+def test_stats_counts(client):
+    yesterday = (date.today() - timedelta(days=1)).isoformat()
+    tomorrow = (date.today() + timedelta(days=1)).isoformat()
+    create(client, "overdue", today=True, due_date=yesterday)
+    create(client, "due later", today=False, due_date=tomorrow)
+    create(client, "no due date", today=False, due_date=None)
+    done = create(client, "done overdue", today=True, due_date=yesterday)
+    client.put(f"/todos/{done['id']}/completed", json={"is_done": True})
+
+    response = client.get("/todos/stats")
+    assert response.status_code == 200
+    assert response.json() == {"total": 4, "done": 1, "open": 3, "today": 2, "overdue": 1}
+
+
+def test_stats_without_todos(client):
+    assert client.get("/todos/stats").json() == {"total": 0, "done": 0, "open": 0, "today": 0, "overdue": 0}
+
+
+def test_stats_single_query_and_cached_until_write(client, queries):
+    todo = create(client, "task")
+
+    queries.clear()
+    assert client.get("/todos/stats").json()["done"] == 0
+    assert len(todo_selects(queries)) == 1
+
+    queries.clear()
+    client.get("/todos/stats")
+    assert todo_selects(queries) == []
+
+    client.put(f"/todos/{todo['id']}/completed", json={"is_done": True})
+    assert client.get("/todos/stats").json()["done"] == 1
+
+
+def test_stats_recomputed_on_new_day(client, monkeypatch):
+    create(client, "task", due_date=date.today().isoformat())
+    assert client.get("/todos/stats").json()["overdue"] == 0
+
+    class Tomorrow(date):
+        @classmethod
+        def today(cls):
+            return date.today() + timedelta(days=1)
+
+    monkeypatch.setattr(todo_service, "date", Tomorrow)
+    assert client.get("/todos/stats").json()["overdue"] == 1
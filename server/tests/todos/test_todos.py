@@ -0,0 +1,103 @@
+import json
+
+
+def create(client, task="Test Task", today=True, due_date="2025-12-31"):
+    response = client.post("/todos/", json={"task": task, "due_date": due_date, "today": today})
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_login_required(client):
+    client.cookies.clear()
+    response = client.get("/todos/")
+    assert response.status_code == 401
+
+
+def test_create_and_read_todo(client):
+    todo = create(client)
+    assert todo["task"] == "Test Task"
+    assert todo["is_done"] is False
+
+    response = client.get(f"/todos/{todo['id']}")
+    assert response.status_code == 200
+    assert response.json() == todo
+
+
+def test_read_todo_list_filters_today(client):
+    create(client, "Today", today=True)
+    create(client, "Later", today=False)
+
+    assert len(client.get("/todos/").json()) == 2
+    assert [t["task"] for t in client.get("/todos/", params={"today": True}).json()] == ["Today"]
+    assert [t["task"] for t in client.get("/todos/", params={"today": False}).json()] == ["Later"]
+
+
+def test_update_todo(client):
+    todo = create(client)
+    response = client.put(f"/todos/{todo['id']}", json={"task": "New Task", "due_date": "2026-01-01", "today": True})
+    assert response.status_code == 200
+    assert response.json()["task"] == "New Task"
+    assert response.json()["due_date"] == "2026-01-01"
+
+
+def test_update_completed_and_today_state(client):
+    todo = create(client)
+
+    response = client.put(f"/todos/{todo['id']}/completed", json={"is_done": True})
+    assert response.status_code == 200
+    assert response.json()["is_done"] is True
+
+    response = client.put(f"/todos/{todo['id']}/move", json={"today": False})
+    assert response.status_code == 200
+    assert response.json()["today"] is False
+
+
+def test_update_missing_todo(client):
+    assert client.put("/todos/999", json={"task": "x", "today": True}).status_code == 404
+    assert client.put("/todos/999/completed", json={"is_done": True}).status_code == 404
+    assert client.put("/todos/999/move", json={"today": True}).status_code == 404
+
+
+def test_delete_single_todo(client):
+    todo = create(client)
+    assert client.delete(f"/todos/{todo['id']}").status_code == 204
+    assert client.delete(f"/todos/{todo['id']}").status_code == 404
+    assert client.get("/todos/").json() == []
+
+
+def test_delete_all_todos(client):
+    create(client, "Task 1")
+    create(client, "Task 2")
+    assert client.delete("/todos/").status_code == 204
+    assert client.get("/todos/").json() == []
+
+
+def test_keyset_pagination(client):
+    ids = [create(client, f"Task {i}", today=i % 2 == 0)["id"] for i in range(5)]
+
+    response = client.get("/todos/", params={"limit": 2})
+    assert [t["id"] for t in response.json()] == ids[:2]
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = client.get("/todos/", params={"limit": 2, "cursor": cursor})
+    assert [t["id"] for t in response.json()] == ids[2:4]
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = client.get("/todos/", params={"limit": 2, "cursor": cursor})
+    assert [t["id"] for t in response.json()] == ids[4:]
+    assert "X-Next-Cursor" not in response.headers
+
+    response = client.get("/todos/", params={"limit": 10, "today": True})
+    assert [t["id"] for t in response.json()] == ids[::2]
+
+
+def test_stream_ndjson(client):
+    ids = [create(client, f"Task {i}")["id"] for i in range(3)]
+
+    response = client.get("/todos/", params={"stream": True, "cursor": ids[0]})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [t["id"] for t in lines] == ids[1:]
+    assert lines[0]["task"] == "Task 1"